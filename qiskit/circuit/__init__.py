@@ -195,6 +195,7 @@ Gates and Instructions
    Instruction
    InstructionSet
    EquivalenceLibrary
+   CommutationLibrary
 
 Parametric Quantum Circuits
 ---------------------------
@@ -205,6 +206,7 @@ Parametric Quantum Circuits
     Parameter
     ParameterVector
     ParameterExpression
+    ParameterBinder
 
 Random Circuits
 ---------------
@@ -229,6 +231,8 @@ from .reset import Reset
 from .parameter import Parameter
 from .parametervector import ParameterVector
 from .parameterexpression import ParameterExpression
+from .parameterbinder import ParameterBinder
 from .equivalence import EquivalenceLibrary
+from .commutation_library import CommutationLibrary
 from .classicalfunction.types import Int1, Int2
 from .classicalfunction import classical_function
@@ -65,8 +65,7 @@ def add_control(operation: Union[Gate, ControlledGate],
         # attempt decomposition
         operation._define()
     cgate = control(operation, num_ctrl_qubits=num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
-    cgate.base_gate.label = operation.label
-    return cgate
+    return cgate._with_base_gate_label(operation.label)
 
 
 def control(operation: Union[Gate, ControlledGate],
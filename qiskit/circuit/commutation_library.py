@@ -0,0 +1,218 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""A library of commutation relations between operations."""
+
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+
+# pylint: disable=invalid-name
+
+
+class CommutationLibrary():
+    """A library of commutation relations between operations.
+
+    The commutation of two standard gates is first decided by rules on the
+    bases in which the gates act on each of their qubits: two gates commute
+    if, on each of their common qubits, they are both diagonal in the same
+    basis (for example a CX gate is diagonal in the Z basis on its control
+    and in the X basis on its target). Otherwise, the matrices of the products
+    of the two operations, in both orders, are compared, and the result is
+    stored in a bounded cache shared by all the users of the library.
+    """
+
+    def __init__(self, max_size=2 ** 14):
+        """Create a new commutation library.
+
+        Args:
+            max_size (int): The maximum number of commutation relations
+                stored in the library. The least recently used relations
+                are discarded first.
+        """
+        self.max_size = max_size
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def commute(self, op1, qargs1, op2, qargs2):
+        """Return whether two operations commute.
+
+        Args:
+            op1 (Instruction): The first operation.
+            qargs1 (list): The qubits the first operation acts on.
+            op2 (Instruction): The second operation.
+            qargs2 (list): The qubits the second operation acts on.
+
+        Returns:
+            bool: True if the operations commute.
+
+        Raises:
+            QiskitError: if the matrix of an operation is needed and cannot be
+                computed.
+        """
+        qargs1 = list(qargs1)
+        positions = {qarg: position for position, qarg in enumerate(qargs1)}
+        positions2 = []
+        for qarg in qargs2:
+            if qarg not in positions:
+                positions[qarg] = len(positions)
+            positions2.append(positions[qarg])
+        positions2 = tuple(positions2)
+
+        # Operations on disjoint qubits always commute
+        if all(position >= len(qargs1) for position in positions2):
+            return True
+
+        if _commute_by_bases(op1, op2, positions2):
+            return True
+
+        key = _relation_key(op1, op2, positions2)
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        does_commute = _commute_by_matrices(op1, op2, positions2, len(positions))
+
+        if key is not None:
+            self._cache[key] = does_commute
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return does_commute
+
+    def clear(self):
+        """Remove all the commutation relations stored in the library."""
+        self._cache.clear()
+
+    def save(self, filename):
+        """Save the commutation relations stored in the library to a file.
+
+        Args:
+            filename (str): The name of the file.
+        """
+        with open(filename, 'wb') as file:
+            pickle.dump(list(self._cache.items()), file)
+
+    def load(self, filename):
+        """Add the commutation relations saved in a file to the library.
+
+        Args:
+            filename (str): The name of a file written by :meth:`save`.
+        """
+        with open(filename, 'rb') as file:
+            relations = pickle.load(file)
+        for key, does_commute in relations:
+            self._cache[key] = does_commute
+            self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+
+def _relation_key(op1, op2, positions2):
+    """Return the key of the relation between two operations, or None if the
+    relation must not be stored.
+
+    Only the relations between standard gates are stored, as the matrix of
+    other operations can come from their own definition, even when they
+    share their name and parameters. None is also returned when the
+    operations are not hashable (e.g. unitary gates with a matrix parameter).
+    """
+    if not (_is_standard_gate(op1) and _is_standard_gate(op2)):
+        return None
+    key = (type(op1), op1.name, op1.num_qubits, tuple(op1.params),
+           getattr(op1, 'ctrl_state', None),
+           type(op2), op2.name, op2.num_qubits, tuple(op2.params),
+           getattr(op2, 'ctrl_state', None), positions2)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _is_standard_gate(op):
+    """Return True if an operation is an instance of a standard gate class."""
+    return type(op).__module__.startswith('qiskit.circuit.library.standard_gates.')
+
+
+def _commute_by_bases(op1, op2, positions2):
+    """Return True if two operations are known to commute from the bases in
+    which they act on their common qubits."""
+    bases1 = _gate_bases(op1)
+    if bases1 is None:
+        return False
+    bases2 = _gate_bases(op2)
+    if bases2 is None:
+        return False
+    for basis2, position in zip(bases2, positions2):
+        if position < len(bases1):
+            basis1 = bases1[position]
+            if basis1 != basis2 and 'I' not in (basis1, basis2):
+                return False
+    return True
+
+
+_STANDARD_GATE_BASES = None
+
+
+def _gate_bases(op):
+    """Return the bases in which a standard gate is diagonal on each of its
+    qubits ('I' for the identity), or None if they are not known."""
+    global _STANDARD_GATE_BASES  # pylint: disable=global-statement
+    if _STANDARD_GATE_BASES is None:
+        # pylint: disable=cyclic-import
+        from qiskit.circuit.library import standard_gates as gates
+        _STANDARD_GATE_BASES = {
+            gates.IGate: ('I',),
+            gates.XGate: ('X',), gates.RXGate: ('X',),
+            gates.SXGate: ('X',), gates.SXdgGate: ('X',),
+            gates.YGate: ('Y',), gates.RYGate: ('Y',),
+            gates.ZGate: ('Z',), gates.RZGate: ('Z',), gates.U1Gate: ('Z',),
+            gates.PhaseGate: ('Z',), gates.SGate: ('Z',), gates.SdgGate: ('Z',),
+            gates.TGate: ('Z',), gates.TdgGate: ('Z',),
+            gates.RXXGate: ('X', 'X'), gates.RYYGate: ('Y', 'Y'),
+            gates.RZZGate: ('Z', 'Z'), gates.RZXGate: ('Z', 'X'),
+        }
+    bases = _STANDARD_GATE_BASES.get(type(op))
+    if bases is not None:
+        return bases
+
+    # The controls of a controlled gate are diagonal in the Z basis
+    base_gate = getattr(op, 'base_gate', None)
+    num_ctrl_qubits = getattr(op, 'num_ctrl_qubits', None)
+    if base_gate is None or num_ctrl_qubits is None:
+        return None
+    if op.num_qubits != num_ctrl_qubits + base_gate.num_qubits:
+        return None
+    base_bases = _gate_bases(base_gate)
+    if base_bases is None:
+        return None
+    return ('Z',) * num_ctrl_qubits + base_bases
+
+
+def _commute_by_matrices(op1, op2, positions2, num_qubits):
+    """Return whether two operations commute, by comparing the matrices of
+    their products in both orders."""
+    # pylint: disable=cyclic-import
+    from qiskit.quantum_info.operators import Operator
+
+    qargs1 = list(range(op1.num_qubits))
+    qargs2 = list(positions2)
+    id_op = Operator(np.eye(2 ** num_qubits))
+    op12 = id_op.compose(op1, qargs=qargs1).compose(op2, qargs=qargs2)
+    op21 = id_op.compose(op2, qargs=qargs2).compose(op1, qargs=qargs1)
+    return op12 == op21
+
+
+SessionCommutationLibrary = CommutationLibrary()
@@ -167,7 +167,9 @@ class ControlledGate(Gate):
         Raises:
             CircuitError: ctrl_state is invalid.
         """
-        self._ctrl_state = _ctrl_state_to_int(ctrl_state, self.num_ctrl_qubits)
+        ctrl_state = _ctrl_state_to_int(ctrl_state, self.num_ctrl_qubits)
+        self._check_mutable('ctrl_state', ctrl_state != self._ctrl_state)
+        self._ctrl_state = ctrl_state
 
     @property
     def params(self):
@@ -201,7 +203,27 @@ class ControlledGate(Gate):
             raise CircuitError('Controlled gate does not define base gate '
                                'for extracting params')
 
+    def to_mutable(self) -> 'ControlledGate':
+        """Return a mutable version of the gate, with a mutable base gate."""
+        if self._mutable:
+            return self
+        cpy = super().to_mutable()
+        cpy.base_gate = self.base_gate.to_mutable()
+        return cpy
+
+    def _with_base_gate_label(self, label: Optional[str]) -> 'ControlledGate':
+        """Return the gate, or a mutable copy of it, with the given label of
+        its base gate."""
+        if label == self.base_gate.label:
+            return self
+        gate = self.to_mutable()
+        gate.base_gate = gate.base_gate.to_mutable()
+        gate.base_gate.label = label
+        return gate
+
     def __deepcopy__(self, _memo=None):
+        if not self._mutable:
+            return self
         cpy = copy.copy(self)
         cpy.base_gate = self.base_gate.copy()
         if self._definition:
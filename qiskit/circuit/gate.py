@@ -12,6 +12,7 @@
 
 """Unitary gate."""
 
+import inspect
 from warnings import warn
 from typing import List, Optional, Union, Tuple
 import numpy as np
@@ -22,6 +23,36 @@ from qiskit.circuit.exceptions import CircuitError
 from .instruction import Instruction
 
 
+class _SingletonGateMeta(type):
+    """Metaclass of the gates with a shared immutable instance.
+
+    A gate class using this metaclass and declaring a ``_singleton_instance``
+    attribute returns the same immutable instance each time it is created
+    without arguments (or only with None arguments, e.g. no label), instead
+    of allocating a new gate. Subclasses which do not declare the attribute
+    themselves are created as usual.
+    """
+
+    @property
+    def __signature__(cls):
+        # The signature of the class is the one of its initializer, not the
+        # one of ``__call__`` below.
+        signature = inspect.signature(cls.__init__)
+        return signature.replace(parameters=list(signature.parameters.values())[1:])
+
+    def __call__(cls, *args, **kwargs):
+        if '_singleton_instance' not in cls.__dict__ \
+                or any(arg is not None for arg in args) \
+                or any(arg is not None for arg in kwargs.values()):
+            return super().__call__(*args, **kwargs)
+        instance = cls._singleton_instance
+        if instance is None:
+            instance = super().__call__()
+            instance._mutable = False
+            cls._singleton_instance = instance
+        return instance
+
+
 class Gate(Instruction):
     """Unitary gate."""
 
@@ -105,6 +136,7 @@ class Gate(Instruction):
             TypeError: name is not string or None.
         """
         if isinstance(name, (str, type(None))):
+            self._check_mutable('label', name != self._label)
             self._label = name
         else:
             raise TypeError('label expects a string or None')
@@ -49,6 +49,11 @@ _CUTOFF_PRECISION = 1E-10
 class Instruction:
     """Generic quantum instruction."""
 
+    # Shared instances of gates (e.g. the singletons of the parameterless
+    # standard gates) are immutable, see :meth:`to_mutable`
+    _mutable = True
+    _condition = None
+
     def __init__(self, name, num_qubits, num_clbits, params, duration=None, unit='dt'):
         """Create a new instruction.
 
@@ -133,6 +138,52 @@ class Instruction:
         """Populates self.definition with a decomposition of this gate."""
         pass
 
+    @property
+    def mutable(self):
+        """Return whether the instruction can be modified in place.
+
+        The instances shared between circuits, such as the ones of the
+        parameterless standard gates created without a label, are immutable.
+        Use :meth:`to_mutable` to get a copy which can be modified.
+        """
+        return self._mutable
+
+    def to_mutable(self):
+        """Return a mutable version of the instruction.
+
+        Returns:
+            qiskit.circuit.Instruction: the instruction itself if it is mutable,
+                else a copy of it which is mutable.
+        """
+        if self._mutable:
+            return self
+        cpy = object.__new__(type(self))
+        cpy.__dict__.update(self.__dict__)
+        del cpy._mutable
+        cpy._params = copy.copy(self._params)
+        if self._definition:
+            cpy._definition = copy.deepcopy(self._definition)
+        return cpy
+
+    def _check_mutable(self, attribute, changed):
+        """Raise if the attribute of an immutable instruction is changed."""
+        if changed and not self._mutable:
+            raise CircuitError("The %s of the shared %s instruction cannot be changed, "
+                               "use to_mutable() to get a copy of it which can be "
+                               "modified." % (attribute, self.name))
+
+    @property
+    def condition(self):
+        """Return the classical condition (ClassicalRegister, int) of the
+        instruction, or None."""
+        return self._condition
+
+    @condition.setter
+    def condition(self, condition):
+        """Set the classical condition of the instruction."""
+        self._check_mutable('condition', condition != self._condition)
+        self._condition = condition
+
     @property
     def params(self):
         """return instruction params."""
@@ -140,6 +191,9 @@ class Instruction:
 
     @params.setter
     def params(self, parameters):
+        if not self._mutable:
+            self._check_mutable('params', list(parameters) != self._params)
+            return
         self._params = []
         for single_param in parameters:
             if isinstance(single_param, ParameterExpression):
@@ -161,12 +215,17 @@ class Instruction:
     def definition(self):
         """Return definition in terms of other basic gates."""
         if self._definition is None:
+            if not self._mutable:
+                # The definition is not cached on a shared instance, so that the
+                # circuits using it do not share it.
+                return self.to_mutable().definition
             self._define()
         return self._definition
 
     @definition.setter
     def definition(self, array):
         """Set gate representation"""
+        self._check_mutable('definition', array is not getattr(self, '_definition', None))
         self._definition = array
 
     @property
@@ -197,6 +256,7 @@ class Instruction:
     @duration.setter
     def duration(self, duration):
         """Set the duration."""
+        self._check_mutable('duration', duration != self._duration)
         self._duration = duration
 
     @property
@@ -207,6 +267,7 @@ class Instruction:
     @unit.setter
     def unit(self, unit):
         """Set the time unit of duration."""
+        self._check_mutable('unit', unit != self._unit)
         self._unit = unit
 
     def assemble(self):
@@ -275,7 +336,8 @@ class Instruction:
             CircuitError: if the instruction is not composite
                 and an inverse has not been implemented for it.
         """
-        if self.definition is None:
+        definition = self.definition
+        if definition is None:
             raise CircuitError("inverse() not implemented for %s." % self.name)
 
         from qiskit.circuit import QuantumCircuit, Gate  # pylint: disable=cyclic-import
@@ -290,18 +352,38 @@ class Instruction:
                                 num_qubits=self.num_qubits,
                                 params=self.params.copy())
 
-        inverse_gate.definition = QuantumCircuit(*self.definition.qregs, *self.definition.cregs)
+        inverse_gate.definition = QuantumCircuit(*definition.qregs, *definition.cregs)
         inverse_gate.definition._data = [(inst.inverse(), qargs, cargs)
-                                         for inst, qargs, cargs in reversed(self._definition)]
+                                         for inst, qargs, cargs in reversed(definition)]
 
         return inverse_gate
 
     def c_if(self, classical, val):
-        """Add classical condition on register classical and value val."""
+        """Add classical condition on register classical and value val.
+
+        The condition is set in place. A shared immutable instruction is not
+        modified, a conditioned copy of it is returned instead; the shared
+        instructions of a circuit are replaced by copies of their own when
+        they are read through :attr:`.QuantumCircuit.data`, so that they can
+        be conditioned in place.
+
+        Args:
+            classical (ClassicalRegister): the register of the condition.
+            val (int): the value of the register the condition holds for.
+
+        Returns:
+            qiskit.circuit.Instruction: the instruction with the condition, which
+                is a copy of it if the instruction is immutable.
+
+        Raises:
+            CircuitError: if ``classical`` is not a register or ``val`` is negative.
+        """
         if not isinstance(classical, ClassicalRegister):
             raise CircuitError("c_if must be used with a classical register")
         if val < 0:
             raise CircuitError("condition value should be non-negative")
+        if not self._mutable:
+            return self.to_mutable().c_if(classical, val)
         self.condition = (classical, val)
         return self
 
@@ -320,16 +402,25 @@ class Instruction:
         cpy = self.__deepcopy__()
 
         if name:
+            cpy = cpy.to_mutable()
             cpy.name = name
         return cpy
 
     def __deepcopy__(self, _memo=None):
+        if not self._mutable:
+            return self
         cpy = copy.copy(self)
         cpy._params = copy.copy(self._params)
         if self._definition:
             cpy._definition = copy.deepcopy(self._definition, _memo)
         return cpy
 
+    def __reduce_ex__(self, protocol):
+        # An immutable instance is restored as the shared instance
+        if not self._mutable:
+            return type(self), ()
+        return super().__reduce_ex__(protocol)
+
     def _qasmif(self, string):
         """Print an if statement if needed."""
         if self.condition is None:
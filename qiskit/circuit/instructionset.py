@@ -20,15 +20,22 @@ from .instruction import Instruction
 class InstructionSet:
     """Instruction collection, and their contexts."""
 
-    def __init__(self):
+    def __init__(self, circuit=None):
         """New collection of instructions.
 
         The context (qargs and cargs that each instruction is attached to)
         is also stored separately for each instruction.
+
+        Args:
+            circuit (QuantumCircuit): the circuit the instructions were just
+                appended to, if any. The copies of immutable instructions made
+                by :meth:`c_if` replace them in this circuit.
         """
         self.instructions = []
         self.qargs = []
         self.cargs = []
+        self._circuit = circuit
+        self._indices = []
 
     def __len__(self):
         """Return number of instructions in set"""
@@ -46,6 +53,8 @@ class InstructionSet:
         self.instructions.append(gate)
         self.qargs.append(qargs)
         self.cargs.append(cargs)
+        if self._circuit is not None:
+            self._indices.append(len(self._circuit._data) - 1)
 
     def inverse(self):
         """Invert all instructions."""
@@ -55,6 +64,11 @@ class InstructionSet:
 
     def c_if(self, classical, val):
         """Add condition on classical register to all instructions."""
-        for gate in self.instructions:
-            gate.c_if(classical, val)
+        for index, gate in enumerate(self.instructions):
+            conditioned = gate.c_if(classical, val)
+            if conditioned is not gate:
+                self.instructions[index] = conditioned
+                if self._circuit is not None:
+                    _, qargs, cargs = self._circuit._data[self._indices[index]]
+                    self._circuit._data[self._indices[index]] = (conditioned, qargs, cargs)
         return self
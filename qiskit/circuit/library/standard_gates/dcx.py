@@ -13,11 +13,11 @@
 """Double-CNOT gate."""
 
 import numpy as np
-from qiskit.circuit.gate import Gate
+from qiskit.circuit.gate import Gate, _SingletonGateMeta
 from qiskit.circuit.quantumregister import QuantumRegister
 
 
-class DCXGate(Gate):
+class DCXGate(Gate, metaclass=_SingletonGateMeta):
     r"""Double-CNOT gate.
 
     A 2-qubit Clifford gate consisting of two back-to-back
@@ -44,6 +44,8 @@ class DCXGate(Gate):
             \end{pmatrix}
     """
 
+    _singleton_instance = None
+
     def __init__(self):
         """Create new DCX gate."""
         super().__init__('dcx', 2, [])
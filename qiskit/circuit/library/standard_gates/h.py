@@ -14,14 +14,14 @@
 
 import numpy
 from qiskit.circuit.controlledgate import ControlledGate
-from qiskit.circuit.gate import Gate
+from qiskit.circuit.gate import Gate, _SingletonGateMeta
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.qasm import pi
 from .t import TGate, TdgGate
 from .s import SGate, SdgGate
 
 
-class HGate(Gate):
+class HGate(Gate, metaclass=_SingletonGateMeta):
     r"""Single-qubit Hadamard gate.
 
     This gate is a \pi rotation about the X+Z axis, and has the effect of
@@ -47,6 +47,8 @@ class HGate(Gate):
             \end{pmatrix}
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new H gate."""
         super().__init__('h', 1, [], label=label)
@@ -84,8 +86,7 @@ class HGate(Gate):
         """
         if num_ctrl_qubits == 1:
             gate = CHGate(label=label, ctrl_state=ctrl_state)
-            gate.base_gate.label = self.label
-            return gate
+            return gate._with_base_gate_label(self.label)
         return super().control(num_ctrl_qubits=num_ctrl_qubits, label=label,
                                ctrl_state=ctrl_state)
 
@@ -99,7 +100,7 @@ class HGate(Gate):
                             [1, -1]], dtype=complex) / numpy.sqrt(2)
 
 
-class CHGate(ControlledGate):
+class CHGate(ControlledGate, metaclass=_SingletonGateMeta):
     r"""Controlled-Hadamard gate.
 
     Applies a Hadamard on the target qubit if the control is
@@ -163,6 +164,8 @@ class CHGate(ControlledGate):
                             [0, 0, 0, 1]],
                            dtype=complex)
 
+    _singleton_instance = None
+
     def __init__(self, label=None, ctrl_state=None):
         """Create new CH gate."""
         super().__init__('ch', 2, [], num_ctrl_qubits=1, label=label,
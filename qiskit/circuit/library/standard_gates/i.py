@@ -13,10 +13,10 @@
 """Identity gate."""
 
 import numpy
-from qiskit.circuit.gate import Gate
+from qiskit.circuit.gate import Gate, _SingletonGateMeta
 
 
-class IGate(Gate):
+class IGate(Gate, metaclass=_SingletonGateMeta):
     r"""Identity gate.
 
     Identity gate corresponds to a single-qubit gate wait cycle,
@@ -39,6 +39,8 @@ class IGate(Gate):
              └───┘
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new Identity gate."""
         super().__init__('id', 1, [], label=label)
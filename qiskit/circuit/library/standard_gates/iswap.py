@@ -13,11 +13,11 @@
 """iSWAP gate."""
 
 import numpy as np
-from qiskit.circuit.gate import Gate
+from qiskit.circuit.gate import Gate, _SingletonGateMeta
 from qiskit.circuit.quantumregister import QuantumRegister
 
 
-class iSwapGate(Gate):
+class iSwapGate(Gate, metaclass=_SingletonGateMeta):
     r"""iSWAP gate.
 
     A 2-qubit XX+YY interaction.
@@ -75,6 +75,8 @@ class iSwapGate(Gate):
             \end{pmatrix}
     """
 
+    _singleton_instance = None
+
     def __init__(self):
         """Create new iSwap gate."""
         super().__init__('iswap', 2, [])
@@ -101,8 +101,7 @@ class PhaseGate(Gate):
         else:
             return super().control(num_ctrl_qubits=num_ctrl_qubits, label=label,
                                    ctrl_state=ctrl_state)
-        gate.base_gate.label = self.label
-        return gate
+        return gate._with_base_gate_label(self.label)
 
     def inverse(self):
         r"""Return inverted Phase gate (:math:`Phase(\lambda){\dagger} = Phase(-\lambda)`)"""
@@ -189,8 +188,7 @@ class CPhaseGate(ControlledGate):
         """
         if ctrl_state is None:
             gate = MCPhaseGate(self.params[0], num_ctrl_qubits=num_ctrl_qubits + 1, label=label)
-            gate.base_gate.label = self.label
-            return gate
+            return gate._with_base_gate_label(self.label)
         return super().control(num_ctrl_qubits=num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
 
     def inverse(self):
@@ -277,8 +275,7 @@ class MCPhaseGate(ControlledGate):
             gate = MCPhaseGate(self.params[0],
                                num_ctrl_qubits=num_ctrl_qubits + self.num_ctrl_qubits,
                                label=label)
-            gate.base_gate.label = self.label
-            return gate
+            return gate._with_base_gate_label(self.label)
         return super().control(num_ctrl_qubits=num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
 
     def inverse(self):
@@ -14,11 +14,11 @@
 
 import numpy
 from qiskit.qasm import pi
-from qiskit.circuit.gate import Gate
+from qiskit.circuit.gate import Gate, _SingletonGateMeta
 from qiskit.circuit.quantumregister import QuantumRegister
 
 
-class SGate(Gate):
+class SGate(Gate, metaclass=_SingletonGateMeta):
     r"""Single qubit S gate (Z**0.5).
 
     It induces a :math:`\pi/2` phase, and is sometimes called the P gate (phase).
@@ -45,6 +45,8 @@ class SGate(Gate):
     Equivalent to a :math:`\pi/2` radian rotation about the Z axis.
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new S gate."""
         super().__init__('s', 1, [], label=label)
@@ -76,7 +78,7 @@ class SGate(Gate):
                             [0, 1j]], dtype=complex)
 
 
-class SdgGate(Gate):
+class SdgGate(Gate, metaclass=_SingletonGateMeta):
     r"""Single qubit S-adjoint gate (~Z**0.5).
 
     It induces a :math:`-\pi/2` phase.
@@ -103,6 +105,8 @@ class SdgGate(Gate):
     Equivalent to a :math:`\pi/2` radian rotation about the Z axis.
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new Sdg gate."""
         super().__init__('sdg', 1, [], label=label)
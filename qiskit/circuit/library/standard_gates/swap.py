@@ -14,11 +14,11 @@
 
 import numpy
 from qiskit.circuit.controlledgate import ControlledGate
-from qiskit.circuit.gate import Gate
+from qiskit.circuit.gate import Gate, _SingletonGateMeta
 from qiskit.circuit.quantumregister import QuantumRegister
 
 
-class SwapGate(Gate):
+class SwapGate(Gate, metaclass=_SingletonGateMeta):
     r"""The SWAP gate.
 
     This is a symmetric and Clifford gate.
@@ -50,6 +50,8 @@ class SwapGate(Gate):
         |a, b\rangle \rightarrow |b, a\rangle
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new SWAP gate."""
         super().__init__('swap', 2, [], label=label)
@@ -89,8 +91,7 @@ class SwapGate(Gate):
         """
         if num_ctrl_qubits == 1:
             gate = CSwapGate(label=label, ctrl_state=ctrl_state)
-            gate.base_gate.label = self.label
-            return gate
+            return gate._with_base_gate_label(self.label)
         return super().control(num_ctrl_qubits=num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
 
     def inverse(self):
@@ -105,7 +106,7 @@ class SwapGate(Gate):
                             [0, 0, 0, 1]], dtype=complex)
 
 
-class CSwapGate(ControlledGate):
+class CSwapGate(ControlledGate, metaclass=_SingletonGateMeta):
     r"""Controlled-X gate.
 
     **Circuit symbol:**
@@ -195,6 +196,8 @@ class CSwapGate(ControlledGate):
                             [0, 0, 0, 0, 0, 0, 1, 0],
                             [0, 0, 0, 0, 0, 0, 0, 1]], dtype=complex)
 
+    _singleton_instance = None
+
     def __init__(self, label=None, ctrl_state=None):
         """Create new CSWAP gate."""
         super().__init__('cswap', 3, [], num_ctrl_qubits=1, label=label,
@@ -15,11 +15,11 @@
 import numpy
 from qiskit.qasm import pi
 from qiskit.circuit.controlledgate import ControlledGate
-from qiskit.circuit.gate import Gate
+from qiskit.circuit.gate import Gate, _SingletonGateMeta
 from qiskit.circuit.quantumregister import QuantumRegister
 
 
-class SXGate(Gate):
+class SXGate(Gate, metaclass=_SingletonGateMeta):
     r"""The single-qubit Sqrt(X) gate (:math:`\sqrt{X}`).
 
     **Matrix Representation:**
@@ -54,6 +54,8 @@ class SXGate(Gate):
 
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new SX gate."""
         super().__init__('sx', 1, [], label=label)
@@ -96,8 +98,7 @@ class SXGate(Gate):
         """
         if num_ctrl_qubits == 1:
             gate = CSXGate(label=label, ctrl_state=ctrl_state)
-            gate.base_gate.label = self.label
-            return gate
+            return gate._with_base_gate_label(self.label)
         return super().control(num_ctrl_qubits=num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
 
     def to_matrix(self):
@@ -106,7 +107,7 @@ class SXGate(Gate):
                             [1 - 1j, 1 + 1j]], dtype=complex) / 2
 
 
-class SXdgGate(Gate):
+class SXdgGate(Gate, metaclass=_SingletonGateMeta):
     r"""The inverse single-qubit Sqrt(X) gate.
 
     .. math::
@@ -132,6 +133,8 @@ class SXdgGate(Gate):
 
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new SXdg gate."""
         super().__init__('sxdg', 1, [], label=label)
@@ -164,7 +167,7 @@ class SXdgGate(Gate):
                             [1 + 1j, 1 - 1j]], dtype=complex) / 2
 
 
-class CSXGate(ControlledGate):
+class CSXGate(ControlledGate, metaclass=_SingletonGateMeta):
     r"""Controlled-√X gate.
 
     **Circuit symbol:**
@@ -226,6 +229,8 @@ class CSXGate(ControlledGate):
                             [(1 - 1j) / 2, 0, (1 + 1j) / 2, 0],
                             [0, 0, 0, 1]], dtype=complex)
 
+    _singleton_instance = None
+
     def __init__(self, label=None, ctrl_state=None):
         """Create new CSX gate."""
         super().__init__('csx', 2, [], num_ctrl_qubits=1, label=label,
@@ -14,11 +14,11 @@
 
 import numpy
 from qiskit.qasm import pi
-from qiskit.circuit.gate import Gate
+from qiskit.circuit.gate import Gate, _SingletonGateMeta
 from qiskit.circuit.quantumregister import QuantumRegister
 
 
-class TGate(Gate):
+class TGate(Gate, metaclass=_SingletonGateMeta):
     r"""Single qubit T gate (Z**0.25).
 
     It induces a :math:`\pi/4` phase, and is sometimes called the pi/8 gate
@@ -46,6 +46,8 @@ class TGate(Gate):
     Equivalent to a :math:`\pi/4` radian rotation about the Z axis.
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new T gate."""
         super().__init__('t', 1, [], label=label)
@@ -77,7 +79,7 @@ class TGate(Gate):
                             [0, (1 + 1j) / numpy.sqrt(2)]], dtype=complex)
 
 
-class TdgGate(Gate):
+class TdgGate(Gate, metaclass=_SingletonGateMeta):
     r"""Single qubit T-adjoint gate (~Z**0.25).
 
     It induces a :math:`-\pi/4` phase.
@@ -104,6 +106,8 @@ class TdgGate(Gate):
     Equivalent to a :math:`\pi/2` radian rotation about the Z axis.
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new Tdg gate."""
         super().__init__('tdg', 1, [], label=label)
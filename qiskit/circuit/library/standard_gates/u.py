@@ -85,8 +85,7 @@ class UGate(Gate):
         if num_ctrl_qubits == 1:
             gate = CUGate(self.params[0], self.params[1], self.params[2], 0,
                           label=label, ctrl_state=ctrl_state)
-            gate.base_gate.label = self.label
-            return gate
+            return gate._with_base_gate_label(self.label)
         return super().control(num_ctrl_qubits=num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
 
     def to_matrix(self):
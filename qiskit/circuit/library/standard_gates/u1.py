@@ -111,8 +111,7 @@ class U1Gate(Gate):
         else:
             return super().control(num_ctrl_qubits=num_ctrl_qubits, label=label,
                                    ctrl_state=ctrl_state)
-        gate.base_gate.label = self.label
-        return gate
+        return gate._with_base_gate_label(self.label)
 
     def inverse(self):
         r"""Return inverted U1 gate (:math:`U1(\lambda){\dagger} = U1(-\lambda)`)"""
@@ -205,8 +204,7 @@ class CU1Gate(ControlledGate):
         """
         if ctrl_state is None:
             gate = MCU1Gate(self.params[0], num_ctrl_qubits=num_ctrl_qubits + 1, label=label)
-            gate.base_gate.label = self.label
-            return gate
+            return gate._with_base_gate_label(self.label)
         return super().control(num_ctrl_qubits=num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
 
     def inverse(self):
@@ -296,8 +294,7 @@ class MCU1Gate(ControlledGate):
         new_ctrl_state = (self.ctrl_state << num_ctrl_qubits) | ctrl_state
         gate = MCU1Gate(self.params[0], num_ctrl_qubits=num_ctrl_qubits + self.num_ctrl_qubits,
                         label=label, ctrl_state=new_ctrl_state)
-        gate.base_gate.label = self.label
-        return gate
+        return gate._with_base_gate_label(self.label)
 
     def inverse(self):
         r"""Return inverted MCU1 gate (:math:`MCU1(\lambda){\dagger} = MCU1(-\lambda)`)"""
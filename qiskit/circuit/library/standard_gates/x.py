@@ -15,7 +15,7 @@
 from math import ceil
 import numpy
 from qiskit.circuit.controlledgate import ControlledGate
-from qiskit.circuit.gate import Gate
+from qiskit.circuit.gate import Gate, _SingletonGateMeta
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.circuit._utils import _compute_control_matrix, _ctrl_state_to_int
 from qiskit.qasm import pi
@@ -25,7 +25,7 @@ from .u1 import U1Gate
 from .u2 import U2Gate
 
 
-class XGate(Gate):
+class XGate(Gate, metaclass=_SingletonGateMeta):
     r"""The single-qubit Pauli-X gate (:math:`\sigma_x`).
 
     **Matrix Representation:**
@@ -68,6 +68,8 @@ class XGate(Gate):
         |1\rangle \rightarrow |0\rangle
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new X gate."""
         super().__init__('x', 1, [], label=label)
@@ -104,8 +106,7 @@ class XGate(Gate):
             ControlledGate: controlled version of this gate.
         """
         gate = MCXGate(num_ctrl_qubits=num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
-        gate.base_gate.label = self.label
-        return gate
+        return gate._with_base_gate_label(self.label)
 
     def inverse(self):
         r"""Return inverted X gate (itself)."""
@@ -117,7 +118,7 @@ class XGate(Gate):
                             [1, 0]], dtype=complex)
 
 
-class CXGate(ControlledGate):
+class CXGate(ControlledGate, metaclass=_SingletonGateMeta):
     r"""Controlled-X gate.
 
     **Circuit symbol:**
@@ -176,6 +177,8 @@ class CXGate(ControlledGate):
         `|a, b\rangle \rightarrow |a, a \oplus b\rangle`
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None, ctrl_state=None):
         """Create new CX gate."""
         super().__init__('cx', 2, [], num_ctrl_qubits=1, label=label,
@@ -196,8 +199,7 @@ class CXGate(ControlledGate):
         ctrl_state = _ctrl_state_to_int(ctrl_state, num_ctrl_qubits)
         new_ctrl_state = (self.ctrl_state << num_ctrl_qubits) | ctrl_state
         gate = MCXGate(num_ctrl_qubits=num_ctrl_qubits + 1, label=label, ctrl_state=new_ctrl_state)
-        gate.base_gate.label = self.label
-        return gate
+        return gate._with_base_gate_label(self.label)
 
     def inverse(self):
         """Return inverted CX gate (itself)."""
@@ -217,7 +219,7 @@ class CXGate(ControlledGate):
                                 [0, 0, 0, 1]], dtype=complex)
 
 
-class CCXGate(ControlledGate):
+class CCXGate(ControlledGate, metaclass=_SingletonGateMeta):
     r"""CCX gate, also known as Toffoli gate.
 
     **Circuit symbol:**
@@ -281,6 +283,8 @@ class CCXGate(ControlledGate):
 
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None, ctrl_state=None):
         """Create new CCX gate."""
         super().__init__('ccx', 3, [], num_ctrl_qubits=2, label=label,
@@ -336,8 +340,7 @@ class CCXGate(ControlledGate):
         ctrl_state = _ctrl_state_to_int(ctrl_state, num_ctrl_qubits)
         new_ctrl_state = (self.ctrl_state << num_ctrl_qubits) | ctrl_state
         gate = MCXGate(num_ctrl_qubits=num_ctrl_qubits + 2, label=label, ctrl_state=new_ctrl_state)
-        gate.base_gate.label = self.label
-        return gate
+        return gate._with_base_gate_label(self.label)
 
     def inverse(self):
         """Return an inverted CCX gate (also a CCX)."""
@@ -350,7 +353,7 @@ class CCXGate(ControlledGate):
                                        ctrl_state=self.ctrl_state)
 
 
-class RCCXGate(Gate):
+class RCCXGate(Gate, metaclass=_SingletonGateMeta):
     """The simplified Toffoli gate, also referred to as Margolus gate.
 
     The simplified Toffoli gate implements the Toffoli gate up to relative phases.
@@ -363,6 +366,8 @@ class RCCXGate(Gate):
     of Fig. 3.
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create a new simplified CCX gate."""
         super().__init__('rccx', 3, [], label=label)
@@ -510,8 +515,7 @@ class C3XGate(ControlledGate):
         ctrl_state = _ctrl_state_to_int(ctrl_state, num_ctrl_qubits)
         new_ctrl_state = (self.ctrl_state << num_ctrl_qubits) | ctrl_state
         gate = MCXGate(num_ctrl_qubits=num_ctrl_qubits + 3, label=label, ctrl_state=new_ctrl_state)
-        gate.base_gate.label = self.label
-        return gate
+        return gate._with_base_gate_label(self.label)
 
     def inverse(self):
         """Invert this gate. The C3X is its own inverse."""
@@ -538,7 +542,7 @@ class C3XGate(ControlledGate):
     #                         [0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0]], dtype=complex)
 
 
-class RC3XGate(Gate):
+class RC3XGate(Gate, metaclass=_SingletonGateMeta):
     """The simplified 3-controlled Toffoli gate.
 
     The simplified Toffoli gate implements the Toffoli gate up to relative phases.
@@ -549,6 +553,8 @@ class RC3XGate(Gate):
     of Fig. 4.
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create a new RC3X gate."""
         super().__init__('rcccx', 4, [], label=label)
@@ -625,7 +631,7 @@ class RC3XGate(Gate):
                             [0, 0, 0, 0, 0, 0, 0, -1, 0, 0, 0, 0, 0, 0, 0, 0]], dtype=complex)
 
 
-class C4XGate(ControlledGate):
+class C4XGate(ControlledGate, metaclass=_SingletonGateMeta):
     """The 4-qubit controlled X gate.
 
     This implementation is based on Page 21, Lemma 7.5, of [1].
@@ -634,6 +640,8 @@ class C4XGate(ControlledGate):
         [1] Barenco et al., 1995. https://arxiv.org/pdf/quant-ph/9503016.pdf
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None, ctrl_state=None):
         """Create a new 4-qubit controlled X gate."""
         super().__init__('mcx', 5, [], num_ctrl_qubits=4, label=label,
@@ -703,8 +711,7 @@ class C4XGate(ControlledGate):
         ctrl_state = _ctrl_state_to_int(ctrl_state, num_ctrl_qubits)
         new_ctrl_state = (self.ctrl_state << num_ctrl_qubits) | ctrl_state
         gate = MCXGate(num_ctrl_qubits=num_ctrl_qubits + 4, label=label, ctrl_state=new_ctrl_state)
-        gate.base_gate.label = self.label
-        return gate
+        return gate._with_base_gate_label(self.label)
 
     def inverse(self):
         """Invert this gate. The C4X is its own inverse."""
@@ -733,11 +740,8 @@ class MCXGate(ControlledGate):
             2: CCXGate
         }
         if num_ctrl_qubits in explicit.keys():
-            gate_class = explicit[num_ctrl_qubits]
-            gate = gate_class.__new__(gate_class, label=label, ctrl_state=ctrl_state)
-            # if __new__ does not return the same type as cls, init is not called
-            gate.__init__(label=label, ctrl_state=ctrl_state)
-            return gate
+            # the explicit gate is not an MCXGate, so __init__ is not called again
+            return explicit[num_ctrl_qubits](label=label, ctrl_state=ctrl_state)
         return super().__new__(cls)
 
     def __init__(self, num_ctrl_qubits, label=None, ctrl_state=None, _name='mcx'):
@@ -796,8 +800,7 @@ class MCXGate(ControlledGate):
             # use __class__ so this works for derived classes
             gate = self.__class__(self.num_ctrl_qubits + num_ctrl_qubits, label=label,
                                   ctrl_state=ctrl_state)
-            gate.base_gate.label = self.label
-            return gate
+            return gate._with_base_gate_label(self.label)
         return super().control(num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
 
 
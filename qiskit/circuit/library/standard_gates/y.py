@@ -16,11 +16,11 @@ import numpy
 from qiskit.qasm import pi
 # pylint: disable=cyclic-import
 from qiskit.circuit.controlledgate import ControlledGate
-from qiskit.circuit.gate import Gate
+from qiskit.circuit.gate import Gate, _SingletonGateMeta
 from qiskit.circuit.quantumregister import QuantumRegister
 
 
-class YGate(Gate):
+class YGate(Gate, metaclass=_SingletonGateMeta):
     r"""The single-qubit Pauli-Y gate (:math:`\sigma_y`).
 
     **Matrix Representation:**
@@ -63,6 +63,8 @@ class YGate(Gate):
         |1\rangle \rightarrow -i|0\rangle
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new Y gate."""
         super().__init__('y', 1, [], label=label)
@@ -97,8 +99,7 @@ class YGate(Gate):
         """
         if num_ctrl_qubits == 1:
             gate = CYGate(label=label, ctrl_state=ctrl_state)
-            gate.base_gate.label = self.label
-            return gate
+            return gate._with_base_gate_label(self.label)
         return super().control(num_ctrl_qubits=num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
 
     def inverse(self):
@@ -111,7 +112,7 @@ class YGate(Gate):
                             [1j, 0]], dtype=complex)
 
 
-class CYGate(ControlledGate):
+class CYGate(ControlledGate, metaclass=_SingletonGateMeta):
     r"""Controlled-Y gate.
 
     **Circuit symbol:**
@@ -173,6 +174,8 @@ class CYGate(ControlledGate):
                             [1j, 0, 0, 0],
                             [0, 0, 0, 1]], dtype=complex)
 
+    _singleton_instance = None
+
     def __init__(self, label=None, ctrl_state=None):
         """Create new CY gate."""
         super().__init__('cy', 2, [], num_ctrl_qubits=1, label=label,
@@ -15,11 +15,11 @@
 import numpy
 from qiskit.qasm import pi
 from qiskit.circuit.controlledgate import ControlledGate
-from qiskit.circuit.gate import Gate
+from qiskit.circuit.gate import Gate, _SingletonGateMeta
 from qiskit.circuit.quantumregister import QuantumRegister
 
 
-class ZGate(Gate):
+class ZGate(Gate, metaclass=_SingletonGateMeta):
     r"""The single-qubit Pauli-Z gate (:math:`\sigma_z`).
 
     **Matrix Representation:**
@@ -62,6 +62,8 @@ class ZGate(Gate):
         |1\rangle \rightarrow -|1\rangle
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None):
         """Create new Z gate."""
         super().__init__('z', 1, [], label=label)
@@ -96,8 +98,7 @@ class ZGate(Gate):
         """
         if num_ctrl_qubits == 1:
             gate = CZGate(label=label, ctrl_state=ctrl_state)
-            gate.base_gate.label = self.label
-            return gate
+            return gate._with_base_gate_label(self.label)
         return super().control(num_ctrl_qubits=num_ctrl_qubits, label=label, ctrl_state=ctrl_state)
 
     def inverse(self):
@@ -110,7 +111,7 @@ class ZGate(Gate):
                             [0, -1]], dtype=complex)
 
 
-class CZGate(ControlledGate):
+class CZGate(ControlledGate, metaclass=_SingletonGateMeta):
     r"""Controlled-Z gate.
 
     This is a Clifford and symmetric gate.
@@ -140,6 +141,8 @@ class CZGate(ControlledGate):
     the target qubit if the control qubit is in the :math:`|1\rangle` state.
     """
 
+    _singleton_instance = None
+
     def __init__(self, label=None, ctrl_state=None):
         """Create new CZ gate."""
         super().__init__('cz', 2, [], label=label, num_ctrl_qubits=1,
@@ -0,0 +1,249 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Bulk binding of many sets of numeric values to the parameters of a circuit.
+"""
+import copy
+from collections import defaultdict
+
+import numpy as np
+
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.parameter import Parameter
+from qiskit.circuit.parameterexpression import ParameterExpression
+from qiskit.circuit.parametertable import ParameterTable
+from qiskit.circuit.parametervector import ParameterVector
+
+
+class ParameterBinder:
+    """Bind many sets of numeric values to the parameters of a circuit at once.
+
+    :meth:`.QuantumCircuit.bind_parameters` copies the whole circuit and
+    substitutes every parameter symbolically each time it is called. The
+    binder instead indexes once where the parameters of ``circuit`` are used,
+    evaluates the compiled parameter expressions for all the value sets as
+    NumPy arrays and only copies the parameterized instructions of each bound
+    circuit. The other instructions are shared with ``circuit``, which must
+    therefore not be modified in place while the bound circuits are in use.
+
+    .. jupyter-execute::
+
+        import numpy as np
+        from qiskit.circuit import QuantumCircuit, Parameter
+        from qiskit.circuit import ParameterBinder
+
+        theta, phi = Parameter('θ'), Parameter('φ')
+        circuit = QuantumCircuit(1)
+        circuit.ry(theta, 0)
+        circuit.rz(2 * phi, 0)
+
+        binder = ParameterBinder(circuit, [theta, phi])
+        bound_circuits = binder.bind(np.random.random((1000, 2)))
+        bound_circuits[0].draw()
+    """
+
+    def __init__(self, circuit, parameters=None):
+        """Index the parameters of ``circuit``.
+
+        Args:
+            circuit (QuantumCircuit): the parameterized circuit.
+            parameters (list[Parameter]): the order of the parameters in the
+                value arrays passed to :meth:`evaluate` and :meth:`bind`. Defaults
+                to the parameters of ``circuit`` sorted by name. It may contain
+                parameters that are not in ``circuit`` (for instance parameters
+                optimized away by the transpiler), whose values are ignored.
+
+        Raises:
+            CircuitError: if ``parameters`` does not contain all the circuit parameters.
+        """
+        if parameters is None:
+            parameters = sorted(circuit.parameters, key=lambda param: param.name)
+        else:
+            parameters = _unroll_parameters(parameters)
+        if not circuit.parameters <= set(parameters) or len(parameters) != len(set(parameters)):
+            raise CircuitError('The parameters to bind ({}) must contain the circuit parameters '
+                               '({}) once.'.format([str(p) for p in parameters],
+                                                   [str(p) for p in circuit.parameters]))
+        self._circuit = circuit
+        self._parameters = parameters
+        self._column = {param: column for column, param in enumerate(parameters)}
+
+        # The expressions to evaluate for each bind, and the slots (position in
+        # circuit.data and in the instruction params) they are assigned to.
+        self._expressions = []
+        expression_index = {}
+        self._slots = defaultdict(list)
+        for data_index, (instruction, _, _) in enumerate(circuit.data):
+            for param_index, param in enumerate(instruction.params):
+                if isinstance(param, ParameterExpression):
+                    if param not in expression_index:
+                        expression_index[param] = len(self._expressions)
+                        self._expressions.append(param)
+                    self._slots[data_index].append((param_index, expression_index[param]))
+
+        self._global_phase = None
+        if isinstance(circuit.global_phase, ParameterExpression):
+            self._global_phase = len(self._expressions)
+            self._expressions.append(circuit.global_phase)
+
+        self._functions = [self._compile(expression) for expression in self._expressions]
+
+    @property
+    def parameters(self):
+        """The parameters, in the order of the columns of the values to bind."""
+        return list(self._parameters)
+
+    @property
+    def circuit(self):
+        """The parameterized circuit."""
+        return self._circuit
+
+    def _compile(self, expression):
+        """Return a function of the value array evaluating ``expression`` on every row."""
+        if isinstance(expression, Parameter):
+            column = self._column[expression]
+            return lambda values: values[:, column]
+
+        parameters = list(expression.parameters)
+        columns = [self._column[param] for param in parameters]
+        function = expression.compiled(parameters)
+        return lambda values: function(*(values[:, column] for column in columns))
+
+    def _values_array(self, values):
+        """Convert the accepted formats of values to bind into a 2D array."""
+        if isinstance(values, dict):
+            values = _unroll_value_dict(values)
+            if values.keys() != set(self._parameters):
+                raise CircuitError('Values must be given for all the parameters '
+                                   '({}).'.format([str(p) for p in self._parameters]))
+            values = np.column_stack([np.atleast_1d(np.asarray(values[param], dtype=float))
+                                      for param in self._parameters])
+        elif isinstance(values, (list, tuple)) and values and isinstance(values[0], dict):
+            return np.vstack([self._values_array(bind) for bind in values])
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 1:
+            values = values.reshape(1, -1)
+        if values.ndim != 2 or values.shape[1] != len(self._parameters):
+            raise CircuitError('Expected an array of values with {} columns, got an array of '
+                               'shape {}.'.format(len(self._parameters), values.shape))
+        return values
+
+    def evaluate(self, values):
+        """Evaluate the parameter expressions of the circuit for every set of values.
+
+        Args:
+            values (array_like or dict or list[dict]): the values to bind. Either
+                an array of shape ``(num_binds, num_parameters)`` ordered as
+                :attr:`parameters`, a dictionary mapping every parameter (or
+                :class:`.ParameterVector`) to its ``num_binds`` values, or a list
+                of ``num_binds`` dictionaries mapping every parameter to one value.
+
+        Returns:
+            numpy.ndarray: an array of shape ``(num_binds, num_expressions)`` with
+            the value of every distinct parameter expression of the circuit.
+
+        Raises:
+            CircuitError: if the values do not match the circuit parameters.
+            ZeroDivisionError: if an expression evaluates to an infinite value.
+        """
+        values = self._values_array(values)
+        result = np.empty((values.shape[0], len(self._functions)))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for index, function in enumerate(self._functions):
+                result[:, index] = function(values)
+        if not np.all(np.isfinite(result)):
+            raise ZeroDivisionError('Binding provided values results in division by zero.')
+        return result
+
+    def bind(self, values):
+        """Bind every set of values to the circuit parameters.
+
+        Args:
+            values (array_like or dict or list[dict]): the values to bind, in
+                any of the formats accepted by :meth:`evaluate`.
+
+        Returns:
+            list[QuantumCircuit]: one bound circuit per set of values.
+
+        Raises:
+            CircuitError: if the values do not match the circuit parameters.
+        """
+        values = self._values_array(values)
+        if self._circuit.calibrations:
+            # Parameterized calibrations hold pulse schedules that need to be
+            # rebound individually.
+            parameters = self._circuit.parameters
+            return [self._circuit.bind_parameters({param: value for param, value
+                                                   in zip(self._parameters, row)
+                                                   if param in parameters})
+                    for row in values.tolist()]
+        return [self._bind_row(value_row, row)
+                for value_row, row in zip(values.tolist(), self.evaluate(values).tolist())]
+
+    def _bind_row(self, value_row, row):
+        template = self._circuit
+        bound = copy.copy(template)
+        bound.qregs = template.qregs.copy()
+        bound.cregs = template.cregs.copy()
+        bound._qubits = template._qubits.copy()
+        bound._clbits = template._clbits.copy()
+        bound._parameter_table = ParameterTable()
+        bound._calibrations = defaultdict(dict)
+
+        data = list(template._data)
+        for data_index, slots in self._slots.items():
+            instruction, qargs, cargs = data[data_index]
+            if instruction._definition is not None:
+                # The definition of, e.g., a custom gate is not rebuilt from the
+                # params: go through the symbolic path for it.
+                bound_instruction = instruction.copy()
+                for param in instruction.params:
+                    if isinstance(param, ParameterExpression):
+                        for parameter in param.parameters:
+                            template._rebind_definition(
+                                bound_instruction, parameter, value_row[self._column[parameter]])
+            else:
+                bound_instruction = copy.copy(instruction)
+            bound_instruction._params = list(instruction._params)
+            for param_index, expression_index in slots:
+                bound_instruction._params[param_index] = row[expression_index]
+            data[data_index] = (bound_instruction, qargs, cargs)
+        bound._data = data
+
+        if self._global_phase is not None:
+            bound.global_phase = row[self._global_phase]
+        return bound
+
+
+def _unroll_parameters(parameters):
+    unrolled = []
+    for param in parameters:
+        if isinstance(param, ParameterVector):
+            unrolled.extend(param)
+        else:
+            unrolled.append(param)
+    return unrolled
+
+
+def _unroll_value_dict(value_dict):
+    unrolled = {}
+    for param, value in value_dict.items():
+        if isinstance(param, ParameterVector):
+            value = np.asarray(value, dtype=float)
+            if value.shape[-1] != len(param):
+                raise CircuitError('ParameterVector {} has length {}, which differs from the '
+                                   'values of shape {}.'.format(param, len(param), value.shape))
+            unrolled.update(zip(param, np.atleast_2d(value).T))
+        else:
+            unrolled[param] = value
+    return unrolled
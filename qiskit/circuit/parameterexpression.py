@@ -12,7 +12,8 @@
 """
 ParameterExpression Class to enable creating simple expressions of Parameters.
 """
-from typing import Callable, Dict, Set, Union
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Set, Union
 
 import numbers
 import operator
@@ -23,6 +24,42 @@ from qiskit.circuit.exceptions import CircuitError
 
 ParameterValueType = Union['ParameterExpression', float, int]
 
+# Maximum number of compiled numeric functions kept in ``_COMPILED_FUNCTIONS``.
+COMPILED_CACHE_SIZE = 4096
+
+# Least-recently-used cache of the numeric functions compiled from sympy
+# expressions, keyed on the expression and the order of its arguments.
+_COMPILED_FUNCTIONS = OrderedDict()
+
+
+def _compile(symbol_expr, symbols):
+    key = (symbol_expr, symbols)
+    try:
+        _COMPILED_FUNCTIONS.move_to_end(key)
+        return _COMPILED_FUNCTIONS[key]
+    except KeyError:
+        pass
+
+    from sympy import lambdify
+    from sympy.printing.pycode import NumPyPrinter
+
+    # The abstract methods of the sympy code printers left out by NumPyPrinter
+    # only print loops and statements of whole functions, which lambdify does
+    # not use.
+    class _FullPrecisionPrinter(NumPyPrinter):  # pylint: disable=abstract-method
+        """Print floats with all their digits, instead of the 15 significant digits of sympy."""
+
+        def _print_Float(self, expr):
+            return repr(float(expr))
+
+    printer = _FullPrecisionPrinter({'fully_qualified_modules': False, 'inline': True,
+                                     'allow_unknown_functions': True, 'user_functions': {}})
+    function = lambdify(symbols, symbol_expr, modules='numpy', printer=printer, dummify=True)
+    _COMPILED_FUNCTIONS[key] = function
+    if len(_COMPILED_FUNCTIONS) > COMPILED_CACHE_SIZE:
+        _COMPILED_FUNCTIONS.popitem(last=False)
+    return function
+
 
 class ParameterExpression:
     """ParameterExpression class to enable creating expressions of Parameters."""
@@ -92,6 +129,16 @@ class ParameterExpression:
         self._raise_if_passed_unknown_parameters(parameter_values.keys())
         self._raise_if_passed_non_real_value(parameter_values)
 
+        if parameter_values and parameter_values.keys() == self._parameters and \
+                all(isinstance(value, float) for value in parameter_values.values()):
+            # Fully binding with floats: the result is a float, which the
+            # compiled expression computes much faster than sympy substitution.
+            with numpy.errstate(all='ignore'):
+                value = self.compiled(parameter_values.keys())(*parameter_values.values())
+            if numpy.isreal(value) and numpy.isfinite(value):
+                from sympy import Float
+                return ParameterExpression({}, Float(float(value)))
+
         symbol_values = {self._parameter_symbols[parameter]: value
                          for parameter, value in parameter_values.items()}
         bound_symbol_expr = self._symbol_expr.subs(symbol_values)
@@ -113,6 +160,58 @@ class ParameterExpression:
 
         return ParameterExpression(free_parameter_symbols, bound_symbol_expr)
 
+    def compiled(self, parameters: Iterable = None) -> Callable:
+        """Return a numeric function of the parameters evaluating this expression.
+
+        The function is generated from the symbolic expression once and cached,
+        so that the expression can be evaluated repeatedly (for example in an
+        optimization loop) without going through symbolic substitution. It is
+        vectorized: given NumPy arrays of values, it returns the array of the
+        expression values.
+
+        Args:
+            parameters: The parameters of the expression, in the order of the
+                arguments of the returned function. Defaults to the parameters
+                sorted by name.
+
+        Raises:
+            CircuitError: If ``parameters`` are not the parameters of the expression.
+
+        Returns:
+            A function taking the value of every parameter as positional arguments.
+        """
+        if parameters is None:
+            parameters = sorted(self._parameters, key=lambda param: param.name)
+        parameters = list(parameters)
+        if set(parameters) != self._parameters:
+            raise CircuitError('The compiled expression must take the expression parameters '
+                               '({}) as arguments.'.format([str(p) for p in self._parameters]))
+        symbols = tuple(self._parameter_symbols[param] for param in parameters)
+        return _compile(self._symbol_expr, symbols)
+
+    def evaluate(self, parameter_values: Dict) -> Union[float, numpy.ndarray]:
+        """Evaluate the expression numerically.
+
+        Args:
+            parameter_values: Mapping of every Parameter in the expression to a
+                numeric value, or to an array of values to evaluate the expression
+                on all of them at once.
+
+        Raises:
+            CircuitError: If a value is not given for every parameter.
+
+        Returns:
+            The value of the expression, or an array of values if arrays were given.
+        """
+        if parameter_values.keys() != self._parameters:
+            raise CircuitError('Values must be given for all the parameters of the expression '
+                               '({}).'.format([str(p) for p in self._parameters]))
+        parameters = list(parameter_values)
+        result = self.compiled(parameters)(*(parameter_values[param] for param in parameters))
+        if numpy.ndim(result) == 0:
+            return float(result)
+        return numpy.asarray(result)
+
     def subs(self,
              parameter_map: Dict) -> 'ParameterExpression':
         """Returns a new Expression with replacement Parameters.
@@ -0,0 +1,550 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+===========================================================
+QPY serialization (:mod:`qiskit.circuit.qpy_serialization`)
+===========================================================
+
+.. currentmodule:: qiskit.circuit.qpy_serialization
+
+A compact binary format for :class:`~qiskit.circuit.QuantumCircuit` objects,
+faster to write and read and smaller than their pickles for deep circuits.
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   dump
+   load
+   dumps
+   loads
+
+Format
+======
+
+A file starts with the magic bytes ``QPY``, the version of the format and the
+number of circuits it holds. Each circuit is then made of
+
+* its name, global phase, duration and unit,
+* its registers, as their kind, name and size,
+* a table of the distinct operations of the circuit: the standard gates are
+  stored once per class, and rebuilt from their class and parameters, while
+  the custom gates and instructions are stored once per object, with their
+  definition serialized as a nested circuit,
+* the table index, flags and number of parameters of each instruction, and
+  the indices of the qubits and clbits of all the instructions, as packed
+  integer arrays,
+* the parameters of the instructions, followed by their condition, label,
+  control state and duration when their flags say they have one,
+* its calibrations and layout.
+
+Numbers, strings, :class:`~qiskit.circuit.Parameter`,
+:class:`~qiskit.circuit.ParameterExpression` objects and numpy arrays are
+encoded directly. The operations and values which cannot be rebuilt from
+these fields are stored as pickles, so the format, like :mod:`pickle`, must
+only be used to load trusted data.
+"""
+
+import importlib
+import io
+import numbers
+import pickle
+import struct
+import uuid
+
+import numpy as np
+
+from qiskit.circuit.barrier import Barrier
+from qiskit.circuit.classicalregister import ClassicalRegister
+from qiskit.circuit.controlledgate import ControlledGate
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.gate import Gate
+from qiskit.circuit.instruction import Instruction
+from qiskit.circuit.parameter import Parameter
+from qiskit.circuit.parameterexpression import ParameterExpression
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.quantumregister import QuantumRegister, AncillaRegister
+
+MAGIC = b'QPY'
+FORMAT_VERSION = 1
+
+# The operation classes rebuilt from their class and parameters
+_STANDARD_MODULE_PREFIX = 'qiskit.circuit.library.standard_gates.'
+_STANDARD_CLASSES = {'qiskit.circuit.measure.Measure', 'qiskit.circuit.reset.Reset',
+                     'qiskit.circuit.barrier.Barrier', 'qiskit.extensions.unitary.UnitaryGate'}
+
+# Kinds of the entries of the operation table
+_CLASS_ENTRY = b'c'
+_GATE_ENTRY = b'g'
+_INSTRUCTION_ENTRY = b'i'
+_PICKLE_ENTRY = b'k'
+
+# Kinds of the entries of the generic gates and instructions, by their exact class
+_GENERIC_ENTRIES = {Gate: _GATE_ENTRY, Instruction: _INSTRUCTION_ENTRY}
+
+# Flags of the instructions
+_CONDITION_FLAG = 1
+_LABEL_FLAG = 2
+_CTRL_STATE_FLAG = 4
+_DURATION_FLAG = 8
+
+_REGISTER_KINDS = {QuantumRegister: b'q', AncillaRegister: b'a', ClassicalRegister: b'c'}
+_REGISTER_CLASSES = {kind: register_class for register_class, kind in _REGISTER_KINDS.items()}
+
+_HEADER = struct.Struct('<3sHQ')
+_UINT32 = struct.Struct('<I')
+_INT64 = struct.Struct('<q')
+_FLOAT = struct.Struct('<d')
+_COMPLEX = struct.Struct('<dd')
+_CLASS_ENTRY_SIZES = struct.Struct('<II')
+
+
+def dump(circuits, file_obj):
+    """Write circuits to a binary file.
+
+    Args:
+        circuits (QuantumCircuit or list[QuantumCircuit]): The circuits to write.
+        file_obj (file): A file object opened in binary mode.
+    """
+    if isinstance(circuits, QuantumCircuit):
+        circuits = [circuits]
+    file_obj.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(circuits)))
+    for circuit in circuits:
+        _write_circuit(file_obj, circuit)
+
+
+def load(file_obj):
+    """Read the circuits of a binary file written by :func:`dump`.
+
+    Args:
+        file_obj (file): A file object opened in binary mode.
+
+    Returns:
+        list[QuantumCircuit]: The circuits of the file.
+
+    Raises:
+        CircuitError: if the file is not a QPY file or was written with a
+            newer version of the format.
+    """
+    magic, version, num_circuits = _HEADER.unpack(_read(file_obj, _HEADER.size))
+    if magic != MAGIC:
+        raise CircuitError('The file is not a QPY file.')
+    if version > FORMAT_VERSION:
+        raise CircuitError('The file was written with version %d of the QPY format, '
+                           'newer than the supported version %d.' % (version, FORMAT_VERSION))
+    parameters = {}
+    return [_read_circuit(file_obj, parameters) for _ in range(num_circuits)]
+
+
+def dumps(circuits):
+    """Return the binary serialization of circuits.
+
+    Args:
+        circuits (QuantumCircuit or list[QuantumCircuit]): The circuits to serialize.
+
+    Returns:
+        bytes: The content of the file :func:`dump` would write.
+    """
+    file_obj = io.BytesIO()
+    dump(circuits, file_obj)
+    return file_obj.getvalue()
+
+
+def loads(data):
+    """Return the circuits of a binary serialization returned by :func:`dumps`.
+
+    Args:
+        data (bytes): The serialized circuits.
+
+    Returns:
+        list[QuantumCircuit]: The circuits.
+    """
+    return load(io.BytesIO(data))
+
+
+def _read(file_obj, size):
+    data = file_obj.read(size)
+    if len(data) != size:
+        raise CircuitError('Unexpected end of QPY data.')
+    return data
+
+
+def _write_uint32(file_obj, value):
+    file_obj.write(_UINT32.pack(value))
+
+
+def _read_uint32(file_obj):
+    return _UINT32.unpack(_read(file_obj, _UINT32.size))[0]
+
+
+def _write_bytes(file_obj, data):
+    _write_uint32(file_obj, len(data))
+    file_obj.write(data)
+
+
+def _read_bytes(file_obj):
+    return _read(file_obj, _read_uint32(file_obj))
+
+
+def _write_string(file_obj, string):
+    _write_bytes(file_obj, string.encode('utf8'))
+
+
+def _read_string(file_obj):
+    return _read_bytes(file_obj).decode('utf8')
+
+
+def _write_array(file_obj, values, dtype):
+    _write_bytes(file_obj, np.asarray(values, dtype=dtype).tobytes())
+
+
+def _read_array(file_obj, dtype):
+    return np.frombuffer(_read_bytes(file_obj), dtype=dtype).tolist()
+
+
+def _write_parameter(file_obj, parameter):
+    file_obj.write(parameter._uuid.bytes)
+    _write_string(file_obj, parameter.name)
+
+
+def _read_parameter(file_obj, parameters):
+    parameter_uuid = uuid.UUID(bytes=_read(file_obj, 16))
+    name = _read_string(file_obj)
+    parameter = parameters.get(parameter_uuid)
+    if parameter is None:
+        parameter = Parameter.__new__(Parameter, name, parameter_uuid)
+        parameter.__init__(name)
+        parameters[parameter_uuid] = parameter
+    return parameter
+
+
+def _write_value(file_obj, value):
+    """Write a parameter or attribute value, prefixed by a byte giving its type."""
+    # pylint: disable=too-many-return-statements
+    if value is None:
+        file_obj.write(b'n')
+        return
+    if isinstance(value, Parameter):
+        file_obj.write(b'p')
+        _write_parameter(file_obj, value)
+        return
+    if isinstance(value, ParameterExpression):
+        from sympy import srepr
+        file_obj.write(b'e')
+        _write_uint32(file_obj, len(value._parameter_symbols))
+        for parameter, symbol in value._parameter_symbols.items():
+            _write_parameter(file_obj, parameter)
+            _write_string(file_obj, symbol.name)
+        _write_string(file_obj, srepr(value._symbol_expr))
+        return
+    if isinstance(value, numbers.Integral) and not isinstance(value, bool) \
+            and -2 ** 63 <= value < 2 ** 63:
+        file_obj.write(b'i')
+        file_obj.write(_INT64.pack(value))
+        return
+    if isinstance(value, float):
+        file_obj.write(b'f')
+        file_obj.write(_FLOAT.pack(value))
+        return
+    if isinstance(value, complex):
+        file_obj.write(b'c')
+        file_obj.write(_COMPLEX.pack(value.real, value.imag))
+        return
+    if isinstance(value, str):
+        file_obj.write(b's')
+        _write_string(file_obj, value)
+        return
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        array_file = io.BytesIO()
+        np.save(array_file, value, allow_pickle=False)
+        file_obj.write(b'a')
+        _write_bytes(file_obj, array_file.getvalue())
+        return
+    if isinstance(value, QuantumCircuit):
+        file_obj.write(b'q')
+        _write_circuit(file_obj, value)
+        return
+    file_obj.write(b'k')
+    _write_bytes(file_obj, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _read_value(file_obj, parameters):
+    """Read a value written by :func:`_write_value`."""
+    # pylint: disable=too-many-return-statements
+    kind = _read(file_obj, 1)
+    if kind == b'n':
+        return None
+    if kind == b'p':
+        return _read_parameter(file_obj, parameters)
+    if kind == b'e':
+        from sympy import Symbol
+        from sympy.parsing.sympy_parser import parse_expr
+        symbol_map = {}
+        for _ in range(_read_uint32(file_obj)):
+            parameter = _read_parameter(file_obj, parameters)
+            symbol_map[parameter] = Symbol(_read_string(file_obj))
+        expr = parse_expr(_read_string(file_obj), transformations=())
+        return ParameterExpression(symbol_map, expr)
+    if kind == b'i':
+        return _INT64.unpack(_read(file_obj, _INT64.size))[0]
+    if kind == b'f':
+        return _FLOAT.unpack(_read(file_obj, _FLOAT.size))[0]
+    if kind == b'c':
+        return complex(*_COMPLEX.unpack(_read(file_obj, _COMPLEX.size)))
+    if kind == b's':
+        return _read_string(file_obj)
+    if kind == b'a':
+        return np.load(io.BytesIO(_read_bytes(file_obj)), allow_pickle=False)
+    if kind == b'q':
+        return _read_circuit(file_obj, parameters)
+    if kind == b'k':
+        return pickle.loads(_read_bytes(file_obj))
+    raise CircuitError('Invalid QPY value type %r.' % kind)
+
+
+def _class_path(op_class):
+    return op_class.__module__ + '.' + op_class.__qualname__
+
+
+def _is_standard_class(path):
+    if path in _STANDARD_CLASSES:
+        return True
+    # A top level class of a module of the standard gates
+    return path.startswith(_STANDARD_MODULE_PREFIX) and \
+        path[len(_STANDARD_MODULE_PREFIX):].count('.') == 1
+
+
+def _build_standard(op_class, num_qubits, params):
+    """Build a standard operation from its class and parameters."""
+    if op_class is Barrier:
+        return Barrier(num_qubits)
+    return op_class(*params)
+
+
+def _can_rebuild(op):
+    """Return whether an operation is rebuilt exactly by :func:`_build_standard`
+    from its class, its parameters and the attributes stored with each
+    instruction."""
+    op_class = type(op)
+    class_path = _class_path(op_class)
+    if not _is_standard_class(class_path):
+        return False
+    try:
+        rebuilt = _build_standard(op_class, op.num_qubits, op.params)
+    except Exception:  # pylint: disable=broad-except
+        return False
+    # The loader builds the operation from the stored class path
+    return (_class_path(rebuilt.__class__) == class_path
+            and rebuilt.num_qubits == op.num_qubits
+            and rebuilt.num_clbits == op.num_clbits
+            and len(rebuilt.params) == len(op.params))
+
+
+def _write_circuit(file_obj, circuit):
+    """Write a circuit, with the layout described in the module docstring."""
+    _write_value(file_obj, circuit.name)
+    _write_value(file_obj, circuit.global_phase)
+    _write_value(file_obj, circuit.duration)
+    _write_string(file_obj, circuit.unit)
+
+    registers = circuit.qregs + circuit.cregs
+    _write_uint32(file_obj, len(registers))
+    for register in registers:
+        file_obj.write(_REGISTER_KINDS[type(register)])
+        _write_string(file_obj, register.name)
+        _write_uint32(file_obj, register.size)
+
+    qubit_indices = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+    clbit_indices = {clbit: index for index, clbit in enumerate(circuit.clbits)}
+    creg_indices = {creg: index for index, creg in enumerate(circuit.cregs)}
+
+    # The table of the operations: the standard operations are stored once
+    # per class and size, the other operations once per object
+    entries = []
+    entry_indices = {}
+    rebuildable = {}
+    op_entries = []
+    flags = []
+    num_params = []
+    qargs = []
+    cargs = []
+    for op, op_qargs, op_cargs in circuit._data:
+        op_class = type(op)
+        class_key = (op_class, op.name, op.num_qubits, op.num_clbits)
+        if class_key not in rebuildable:
+            rebuildable[class_key] = _can_rebuild(op)
+        if rebuildable[class_key] and (op.condition is None or op.condition[0] in creg_indices):
+            key = class_key
+            op_flags = 0
+            if op.condition is not None:
+                op_flags |= _CONDITION_FLAG
+            if getattr(op, 'label', None) is not None:
+                op_flags |= _LABEL_FLAG
+            if isinstance(op, ControlledGate) and op.ctrl_state != 2 ** op.num_ctrl_qubits - 1:
+                op_flags |= _CTRL_STATE_FLAG
+            if op.duration is not None or op.unit != 'dt':
+                op_flags |= _DURATION_FLAG
+            flags.append(op_flags)
+            num_params.append(len(op.params))
+        else:
+            key = id(op)
+            flags.append(0)
+            num_params.append(0)
+        entry_index = entry_indices.get(key)
+        if entry_index is None:
+            entry_index = entry_indices[key] = len(entries)
+            entries.append((key is class_key, op))
+        op_entries.append(entry_index)
+        qargs.extend(qubit_indices[qubit] for qubit in op_qargs)
+        cargs.extend(clbit_indices[clbit] for clbit in op_cargs)
+
+    _write_uint32(file_obj, len(entries))
+    for is_class_entry, op in entries:
+        generic_entry = _GENERIC_ENTRIES.get(op.__class__)
+        if is_class_entry:
+            file_obj.write(_CLASS_ENTRY)
+            _write_string(file_obj, _class_path(type(op)))
+            _write_string(file_obj, op.name)
+            file_obj.write(_CLASS_ENTRY_SIZES.pack(op.num_qubits, op.num_clbits))
+        elif generic_entry is not None and op.condition is None \
+                and op.duration is None and op.unit == 'dt':
+            file_obj.write(generic_entry)
+            _write_string(file_obj, op.name)
+            file_obj.write(_CLASS_ENTRY_SIZES.pack(op.num_qubits, op.num_clbits))
+            _write_value(file_obj, getattr(op, 'label', None))
+            _write_uint32(file_obj, len(op.params))
+            for param in op.params:
+                _write_value(file_obj, param)
+            _write_value(file_obj, op.definition)
+        else:
+            file_obj.write(_PICKLE_ENTRY)
+            _write_bytes(file_obj, pickle.dumps(op, protocol=pickle.HIGHEST_PROTOCOL))
+
+    _write_uint32(file_obj, len(op_entries))
+    _write_array(file_obj, op_entries, '<u4')
+    _write_array(file_obj, flags, '<u1')
+    _write_array(file_obj, num_params, '<u2')
+    _write_array(file_obj, qargs, '<u4')
+    _write_array(file_obj, cargs, '<u4')
+
+    for (op, _, _), op_flags, op_num_params in zip(circuit._data, flags, num_params):
+        for param in op.params[:op_num_params]:
+            _write_value(file_obj, param)
+        if op_flags & _CONDITION_FLAG:
+            _write_uint32(file_obj, creg_indices[op.condition[0]])
+            _write_value(file_obj, op.condition[1])
+        if op_flags & _LABEL_FLAG:
+            _write_string(file_obj, op.label)
+        if op_flags & _CTRL_STATE_FLAG:
+            _write_value(file_obj, op.ctrl_state)
+        if op_flags & _DURATION_FLAG:
+            _write_value(file_obj, op.duration)
+            _write_string(file_obj, op.unit)
+
+    _write_value(file_obj, dict(circuit.calibrations) or None)
+    _write_value(file_obj, circuit._layout)
+
+
+def _read_circuit(file_obj, parameters):
+    """Read a circuit written by :func:`_write_circuit`."""
+    name = _read_value(file_obj, parameters)
+    global_phase = _read_value(file_obj, parameters)
+    duration = _read_value(file_obj, parameters)
+    unit = _read_string(file_obj)
+
+    registers = []
+    for _ in range(_read_uint32(file_obj)):
+        register_class = _REGISTER_CLASSES[_read(file_obj, 1)]
+        register_name = _read_string(file_obj)
+        registers.append(register_class(_read_uint32(file_obj), register_name))
+    circuit = QuantumCircuit(*registers, name=name, global_phase=global_phase)
+    circuit.duration = duration
+    circuit.unit = unit
+
+    entries = []
+    for _ in range(_read_uint32(file_obj)):
+        kind = _read(file_obj, 1)
+        if kind == _CLASS_ENTRY:
+            path = _read_string(file_obj)
+            if not _is_standard_class(path):
+                raise CircuitError('Invalid QPY operation class %s.' % path)
+            module_name, class_name = path.rsplit('.', 1)
+            op_class = getattr(importlib.import_module(module_name), class_name)
+            op_name = _read_string(file_obj)
+            num_qubits, num_clbits = _CLASS_ENTRY_SIZES.unpack(
+                _read(file_obj, _CLASS_ENTRY_SIZES.size))
+            entries.append((op_class, op_name, num_qubits, num_clbits))
+        elif kind in (_GATE_ENTRY, _INSTRUCTION_ENTRY):
+            op_name = _read_string(file_obj)
+            num_qubits, num_clbits = _CLASS_ENTRY_SIZES.unpack(
+                _read(file_obj, _CLASS_ENTRY_SIZES.size))
+            label = _read_value(file_obj, parameters)
+            params = [_read_value(file_obj, parameters)
+                      for _ in range(_read_uint32(file_obj))]
+            if kind == _GATE_ENTRY:
+                op = Gate(op_name, num_qubits, params, label=label)
+            else:
+                op = Instruction(op_name, num_qubits, num_clbits, params)
+            op.definition = _read_value(file_obj, parameters)
+            entries.append(op)
+        elif kind == _PICKLE_ENTRY:
+            entries.append(pickle.loads(_read_bytes(file_obj)))
+        else:
+            raise CircuitError('Invalid QPY operation entry %r.' % kind)
+
+    num_instructions = _read_uint32(file_obj)
+    op_entries = _read_array(file_obj, '<u4')
+    flags = _read_array(file_obj, '<u1')
+    num_params = _read_array(file_obj, '<u2')
+    qargs = _read_array(file_obj, '<u4')
+    cargs = _read_array(file_obj, '<u4')
+    if not len(op_entries) == len(flags) == len(num_params) == num_instructions:
+        raise CircuitError('Invalid QPY instruction arrays.')
+
+    qubits = circuit.qubits
+    clbits = circuit.clbits
+    qarg_position = 0
+    carg_position = 0
+    for entry_index, op_flags, op_num_params in zip(op_entries, flags, num_params):
+        entry = entries[entry_index]
+        if isinstance(entry, tuple):
+            op_class, op_name, num_qubits, num_clbits = entry
+            params = [_read_value(file_obj, parameters) for _ in range(op_num_params)]
+            op = _build_standard(op_class, num_qubits, params)
+            if op_flags or op.name != op_name:
+                # The shared instances of the standard gates are not modified
+                op = op.to_mutable()
+                op.name = op_name
+            if op_flags & _CONDITION_FLAG:
+                creg = circuit.cregs[_read_uint32(file_obj)]
+                op.condition = (creg, _read_value(file_obj, parameters))
+            if op_flags & _LABEL_FLAG:
+                op.label = _read_string(file_obj)
+            if op_flags & _CTRL_STATE_FLAG:
+                op.ctrl_state = _read_value(file_obj, parameters)
+            if op_flags & _DURATION_FLAG:
+                op.duration = _read_value(file_obj, parameters)
+                op.unit = _read_string(file_obj)
+        else:
+            op = entry
+            num_qubits, num_clbits = op.num_qubits, op.num_clbits
+        op_qargs = [qubits[index] for index in qargs[qarg_position:qarg_position + num_qubits]]
+        op_cargs = [clbits[index] for index in cargs[carg_position:carg_position + num_clbits]]
+        qarg_position += num_qubits
+        carg_position += num_clbits
+        circuit._append(op, op_qargs, op_cargs)
+
+    calibrations = _read_value(file_obj, parameters)
+    if calibrations:
+        circuit._calibrations.update(calibrations)
+    circuit._layout = _read_value(file_obj, parameters)
+    return circuit
@@ -38,6 +38,7 @@ from .register import Register
 from .bit import Bit
 from .quantumcircuitdata import QuantumCircuitData
 from .delay import Delay
+from .tools import pi_check
 
 try:
     import pygments
@@ -840,7 +841,7 @@ class QuantumCircuit:
         expanded_qargs = [self.qbit_argument_conversion(qarg) for qarg in qargs or []]
         expanded_cargs = [self.cbit_argument_conversion(carg) for carg in cargs or []]
 
-        instructions = InstructionSet()
+        instructions = InstructionSet(circuit=self)
         for (qarg, carg) in instruction.broadcast_arguments(expanded_qargs, expanded_cargs):
             instructions.add(self._append(instruction, qarg, carg), qarg, carg)
         return instructions
@@ -1019,9 +1020,12 @@ class QuantumCircuit:
                         raise CircuitError("circuits are not compatible")
 
     @staticmethod
-    def _get_composite_circuit_qasm_from_instruction(instruction):
+    def _get_composite_circuit_qasm_from_instruction(instruction, name=None):
         """Returns OpenQASM string composite circuit given an instruction.
-        The given instruction should be the result of composite_circuit.to_instruction()."""
+        The given instruction should be the result of composite_circuit.to_instruction().
+        The gate is named ``name`` if given, else the name of the instruction."""
+        if name is None:
+            name = instruction.name
 
         gate_parameters = ",".join(["param%i" % num for num in range(len(instruction.params))])
         qubit_parameters = ",".join(["q%i" % num for num in range(instruction.num_qubits)])
@@ -1035,10 +1039,10 @@ class QuantumCircuit:
             composite_circuit_gates = composite_circuit_gates.rstrip(' ')
 
         if gate_parameters:
-            qasm_string = "gate %s(%s) %s { %s }" % (instruction.name, gate_parameters,
+            qasm_string = "gate %s(%s) %s { %s }" % (name, gate_parameters,
                                                      qubit_parameters, composite_circuit_gates)
         else:
-            qasm_string = "gate %s %s { %s }" % (instruction.name, qubit_parameters,
+            qasm_string = "gate %s %s { %s }" % (name, qubit_parameters,
                                                  composite_circuit_gates)
 
         return qasm_string
@@ -1057,68 +1061,11 @@ class QuantumCircuit:
             ImportError: If pygments is not installed and ``formatted`` is
                 ``True``.
         """
-        existing_gate_names = ['ch', 'cx', 'cy', 'cz', 'crx', 'cry', 'crz', 'ccx', 'cswap',
-                               'cu1', 'cu3', 'dcx', 'h', 'i', 'id', 'iden', 'iswap', 'ms',
-                               'r', 'rx', 'rxx', 'ry', 'ryy', 'rz', 'rzx', 'rzz', 's', 'sdg',
-                               'swap', 'x', 'y', 'z', 't', 'tdg', 'u1', 'u2', 'u3']
-
-        existing_composite_circuits = []
-
-        string_temp = self.header + "\n"
-        string_temp += self.extension_lib + "\n"
-        for register in self.qregs:
-            string_temp += register.qasm() + "\n"
-        for register in self.cregs:
-            string_temp += register.qasm() + "\n"
-        unitary_gates = []
-        for instruction, qargs, cargs in self._data:
-            if instruction.name == 'measure':
-                qubit = qargs[0]
-                clbit = cargs[0]
-                string_temp += "%s %s[%d] -> %s[%d];\n" % (instruction.qasm(),
-                                                           qubit.register.name, qubit.index,
-                                                           clbit.register.name, clbit.index)
-            # If instruction is a root gate or a root instruction (in that case, compositive)
-            elif type(instruction) in [Gate, Instruction]:  # pylint: disable=unidiomatic-typecheck
-                if instruction not in existing_composite_circuits:
-                    if instruction.name in existing_gate_names:
-                        old_name = instruction.name
-                        instruction.name += "_" + str(id(instruction))
-
-                        warnings.warn("A gate named {} already exists. "
-                                      "We have renamed "
-                                      "your gate to {}".format(old_name, instruction.name))
-
-                    # Get qasm of composite circuit
-                    qasm_string = self._get_composite_circuit_qasm_from_instruction(instruction)
-
-                    # Insert composite circuit qasm definition right after header and extension lib
-                    string_temp = string_temp.replace(self.extension_lib,
-                                                      "%s\n%s" % (self.extension_lib,
-                                                                  qasm_string))
-
-                    existing_composite_circuits.append(instruction)
-                    existing_gate_names.append(instruction.name)
-
-                # Insert qasm representation of the original instruction
-                string_temp += "%s %s;\n" % (instruction.qasm(),
-                                             ",".join(["%s[%d]" % (j.register.name, j.index)
-                                                       for j in qargs + cargs]))
-            else:
-                string_temp += "%s %s;\n" % (instruction.qasm(),
-                                             ",".join(["%s[%d]" % (j.register.name, j.index)
-                                                       for j in qargs + cargs]))
-            if instruction.name == 'unitary':
-                unitary_gates.append(instruction)
-
-        # this resets them, so if another call to qasm() is made the gate def is added again
-        for gate in unitary_gates:
-            gate._qasm_def_written = False
+        string_temp = "".join(self.iter_qasm())
 
         if filename:
             with open(filename, 'w+') as file:
                 file.write(string_temp)
-            file.close()
 
         if formatted:
             if not HAS_PYGMENTS:
@@ -1133,6 +1080,113 @@ class QuantumCircuit:
         else:
             return string_temp
 
+    def dump_qasm(self, file):
+        """Write the OpenQASM program of the circuit to a file.
+
+        The program is written statement by statement, so the whole program
+        is never held in memory.
+
+        Args:
+            file (str or file): The name of the file, or a file object opened
+                in text mode.
+        """
+        if isinstance(file, str):
+            with open(file, 'w') as file_obj:
+                self.dump_qasm(file_obj)
+            return
+        for statement in self.iter_qasm():
+            file.write(statement)
+
+    def iter_qasm(self):
+        """Iterate over the OpenQASM program of the circuit.
+
+        The definitions of the composite instructions are gathered in a first
+        pass over the circuit, then the program is generated lazily, so huge
+        circuits can be exported incrementally. Joining the yielded strings
+        gives the same program as :meth:`qasm`.
+
+        Yields:
+            str: The successive statements of the program, each one ending
+            with a newline.
+        """
+        definitions, qasm_names = self._qasm_composite_definitions()
+
+        yield self.header + "\n"
+        yield self.extension_lib + "\n"
+        for definition in definitions:
+            yield definition + "\n"
+        for register in self.qregs:
+            yield register.qasm() + "\n"
+        for register in self.cregs:
+            yield register.qasm() + "\n"
+
+        unitary_gates = []
+        try:
+            for instruction, qargs, cargs in self._data:
+                if instruction.name == 'measure':
+                    qubit = qargs[0]
+                    clbit = cargs[0]
+                    yield "%s %s[%d] -> %s[%d];\n" % (instruction.qasm(),
+                                                      qubit.register.name, qubit.index,
+                                                      clbit.register.name, clbit.index)
+                    continue
+                qasm_name = qasm_names.get(id(instruction), instruction.name)
+                if qasm_name == instruction.name:
+                    instruction_qasm = instruction.qasm()
+                else:
+                    instruction_qasm = _renamed_instruction_qasm(instruction, qasm_name)
+                if instruction.name == 'unitary':
+                    unitary_gates.append(instruction)
+                bits_qasm = ",".join(["%s[%d]" % (j.register.name, j.index)
+                                      for j in qargs + cargs])
+                yield "%s %s;\n" % (instruction_qasm, bits_qasm)
+        finally:
+            # this resets them, so if another call to qasm() is made the gate def is added again
+            for gate in unitary_gates:
+                gate._qasm_def_written = False
+
+    def _qasm_composite_definitions(self):
+        """Return the definitions of the composite instructions of the circuit,
+        in the order they appear in the program, and the names given in the
+        program to the composite instructions whose name is already used,
+        keyed by the ``id`` of the instructions."""
+        existing_gate_names = {'ch', 'cx', 'cy', 'cz', 'crx', 'cry', 'crz', 'ccx', 'cswap',
+                               'cu1', 'cu3', 'dcx', 'h', 'i', 'id', 'iden', 'iswap', 'ms',
+                               'r', 'rx', 'rxx', 'ry', 'ryy', 'rz', 'rzx', 'rzz', 's', 'sdg',
+                               'swap', 'x', 'y', 'z', 't', 'tdg', 'u1', 'u2', 'u3'}
+
+        # The composite instructions whose definition is written, keyed by
+        # their name in the program
+        existing_composite_circuits = defaultdict(list)
+        definitions = []
+        qasm_names = {}
+        for instruction, _, _ in self._data:
+            # If instruction is a root gate or a root instruction (in that case, compositive)
+            # pylint: disable=unidiomatic-typecheck
+            if type(instruction) not in [Gate, Instruction]:
+                continue
+            if id(instruction) in qasm_names or \
+                    instruction in existing_composite_circuits.get(instruction.name, ()):
+                continue
+            qasm_name = instruction.name
+            if qasm_name in existing_gate_names:
+                qasm_name += "_" + str(id(instruction))
+
+                warnings.warn("A gate named {} already exists. "
+                              "We have renamed "
+                              "your gate to {}".format(instruction.name, qasm_name))
+
+            definitions.append(
+                self._get_composite_circuit_qasm_from_instruction(instruction, qasm_name))
+            existing_composite_circuits[qasm_name].append(instruction)
+            existing_gate_names.add(qasm_name)
+            qasm_names[id(instruction)] = qasm_name
+
+        # Each definition is written right after the header and extension lib,
+        # before the definitions found earlier
+        definitions.reverse()
+        return definitions, qasm_names
+
     def draw(self, output=None, scale=None, filename=None, style=None,
              interactive=False, plot_barriers=True,
              reverse_bits=False, justify=None, vertical_compression='medium', idle_wires=True,
@@ -1891,8 +1945,11 @@ class QuantumCircuit:
                 [str(p) for p in param_dict.keys() - self._parameter_table]))
 
         # replace the parameters with a new Parameter ("substitute") or numeric value ("bind")
-        for parameter, value in unrolled_param_dict.items():
-            bound_circuit._assign_parameter(parameter, value)
+        if any(isinstance(value, ParameterExpression) for value in unrolled_param_dict.values()):
+            for parameter, value in unrolled_param_dict.items():
+                bound_circuit._assign_parameter(parameter, value)
+        else:
+            bound_circuit._bind_parameters(unrolled_param_dict)
 
         return None if inplace else bound_circuit
 
@@ -1954,6 +2011,40 @@ class QuantumCircuit:
             self.global_phase = self.global_phase.assign(parameter, value)
         self._assign_calibration_parameters(parameter, value)
 
+    def _bind_parameters(self, value_dict):
+        """Update this circuit where instances of the parameters in ``value_dict`` are
+        replaced by their numeric values.
+
+        Unlike successive calls to ``_assign_parameter``, every parameter expression is
+        bound to the values of all its parameters at once, which allows it to be
+        evaluated numerically instead of symbolically when it is fully bound.
+
+        Args:
+            value_dict (dict): Mapping of parameters to the numeric values to bind.
+        """
+        bound_slots = set()
+        for parameter in value_dict:
+            for instr, param_index in self._parameter_table[parameter]:
+                if (id(instr), param_index) in bound_slots:
+                    continue
+                bound_slots.add((id(instr), param_index))
+                param = instr.params[param_index]
+                binds = {p: value_dict[p] for p in param.parameters if p in value_dict}
+                instr.params[param_index] = param.bind(binds)
+                for bound_parameter, value in binds.items():
+                    self._rebind_definition(instr, bound_parameter, value)
+
+        for parameter in value_dict:
+            del self._parameter_table[parameter]  # clear evaluated expressions
+
+        if isinstance(self.global_phase, ParameterExpression):
+            binds = {p: value_dict[p] for p in self.global_phase.parameters if p in value_dict}
+            if binds:
+                self.global_phase = self.global_phase.bind(binds)
+
+        for parameter, value in value_dict.items():
+            self._assign_calibration_parameters(parameter, value)
+
     def _assign_calibration_parameters(self, parameter, value):
         """Update parameterized pulse gate calibrations, if there are any which contain
         ``parameter``. This updates the calibration mapping as well as the gate definition
@@ -2524,10 +2615,21 @@ class QuantumCircuit:
         return 0  # If there are no instructions over bits
 
 
+def _renamed_instruction_qasm(instruction, name):
+    """Return the OpenQASM string of an instruction under another name."""
+    name_param = name
+    if instruction.params:
+        name_param = "%s(%s)" % (name, ",".join(
+            [pi_check(i, ndigits=8, output='qasm') for i in instruction.params]))
+    return instruction._qasmif(name_param)
+
+
 def _circuit_from_qasm(qasm):
     # pylint: disable=cyclic-import
     from qiskit.converters import ast_to_dag
     from qiskit.converters import dag_to_circuit
-    ast = qasm.parse()
-    dag = ast_to_dag(ast)
+    dag = qasm.parse_to_dag()
+    if dag is None:
+        ast = qasm.parse()
+        dag = ast_to_dag(ast)
     return dag_to_circuit(dag)
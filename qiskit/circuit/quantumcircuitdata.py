@@ -27,7 +27,26 @@ class QuantumCircuitData(MutableSequence):
         self._circuit = circuit
 
     def __getitem__(self, i):
-        return self._circuit._data[i]
+        if isinstance(i, slice):
+            return [self._own(index) for index in range(len(self._circuit._data))[i]]
+        return self._own(i)
+
+    def __iter__(self):
+        for index in range(len(self._circuit._data)):
+            yield self._own(index)
+
+    def _own(self, index):
+        """Return the instruction context at ``index``, replacing a shared
+        immutable instruction by a mutable copy of it owned by the circuit, so
+        that the instructions read from the circuit can be modified in place
+        (e.g. with ``c_if``)."""
+        instruction_context = self._circuit._data[index]
+        instruction, qargs, cargs = instruction_context
+        if instruction.mutable:
+            return instruction_context
+        instruction_context = (instruction.to_mutable(), qargs, cargs)
+        self._circuit._data[index] = instruction_context
+        return instruction_context
 
     def __setitem__(self, key, value):
         instruction, qargs, cargs = value
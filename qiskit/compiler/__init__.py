@@ -26,11 +26,14 @@ Circuit and Pulse Compilation Functions
    assemble
    schedule
    transpile
+   transpile_parametric
    sequence
+   TranspileCache
 
 """
 
 from .assemble import assemble
-from .transpile import transpile
+from .transpile import transpile, transpile_parametric
+from .transpile_cache import TranspileCache
 from .schedule import schedule
 from .sequence import sequence
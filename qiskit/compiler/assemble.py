@@ -17,7 +17,7 @@ import logging
 import warnings
 from time import time
 from typing import Union, List, Dict, Optional
-from qiskit.circuit import QuantumCircuit, Qubit, Parameter
+from qiskit.circuit import QuantumCircuit, Qubit, Parameter, ParameterBinder
 from qiskit.exceptions import QiskitError
 from qiskit.pulse import ScheduleComponent, LoConfig
 from qiskit.assembler.run_config import RunConfig
@@ -427,9 +427,9 @@ def _expand_parameters(circuits, run_config):
                  'Parameter binds: {} ' +
                  'Circuit parameters: {}').format(all_bind_parameters, all_circuit_parameters))
 
-        circuits = [circuit.bind_parameters(binds)
+        circuits = [bound_circuit
                     for circuit in circuits
-                    for binds in parameter_binds]
+                    for bound_circuit in ParameterBinder(circuit).bind(parameter_binds)]
 
         # All parameters have been expanded and bound, so remove from run_config
         run_config = copy.deepcopy(run_config)
@@ -18,7 +18,9 @@ from typing import List, Union, Dict, Callable, Any, Optional, Tuple
 
 from qiskit import user_config
 from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.parameterbinder import ParameterBinder
 from qiskit.circuit.quantumregister import Qubit
+from qiskit.compiler.transpile_cache import TranspileCache, transpile_cache_key
 from qiskit.converters import isinstanceint, isinstancelist, dag_to_circuit, circuit_to_dag
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.providers import BaseBackend
@@ -33,6 +35,7 @@ from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.instruction_durations import InstructionDurations, InstructionDurationsType
 from qiskit.transpiler.passes import ApplyLayout
 from qiskit.transpiler.passmanager_config import PassManagerConfig
+from qiskit.transpiler.profiling import TranspileProfile
 from qiskit.transpiler.preset_passmanagers import (level_0_pass_manager,
                                                    level_1_pass_manager,
                                                    level_2_pass_manager,
@@ -58,8 +61,10 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
               pass_manager: Optional[PassManager] = None,
               callback: Optional[Callable[[BasePass, DAGCircuit, float,
                                            PropertySet, int], Any]] = None,
-              output_name: Optional[Union[str, List[str]]] = None) -> Union[QuantumCircuit,
-                                                                            List[QuantumCircuit]]:
+              output_name: Optional[Union[str, List[str]]] = None,
+              cache: Optional[TranspileCache] = None,
+              profile: Optional[TranspileProfile] = None) -> Union[QuantumCircuit,
+                                                                   List[QuantumCircuit]]:
     """Transpile one or more circuits, according to some desired transpilation targets.
 
     All arguments may be given as either a singleton or list. In case of a list,
@@ -183,6 +188,18 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
 
         output_name: A list with strings to identify the output circuits. The length of
             the list should be exactly the length of the ``circuits`` parameter.
+        cache: A cache of transpiled circuits. Circuits whose transpilation, with
+            the same options, is already in the cache are taken from it instead of
+            being transpiled again, and the others are added to it. Circuits
+            transpiled with a ``callback`` are not cached.
+        profile: A :class:`~qiskit.transpiler.TranspileProfile` in which to record
+            the statistics (wall time, number of runs, DAG size, peak memory) of
+            every pass run to transpile the circuits, including the passes run in
+            parallel worker processes. For example::
+
+                profile = TranspileProfile()
+                transpile(circuits, backend, profile=profile)
+                print(profile.to_text())
 
     Returns:
         The transpiled circuit(s).
@@ -217,7 +234,8 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
         warnings.warn("The parameter pass_manager in transpile is being deprecated. "
                       "The preferred way to tranpile a circuit using a custom pass manager is"
                       " pass_manager.run(circuit)", DeprecationWarning, stacklevel=2)
-        return pass_manager.run(circuits, output_name=output_name, callback=callback)
+        return pass_manager.run(circuits, output_name=output_name, callback=callback,
+                                profile=profile)
 
     if optimization_level is None:
         # Take optimization level from the configuration or 1 as default.
@@ -239,8 +257,10 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
 
     _check_circuits_coupling_map(circuits, transpile_args, backend)
 
-    # Transpile circuits in parallel
-    circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_args)))
+    if cache is not None:
+        circuits = _transpile_with_cache(circuits, transpile_args, cache, profile)
+    else:
+        circuits = _transpile_circuits(list(zip(circuits, transpile_args)), profile)
 
     if len(circuits) == 1:
         end_time = time()
@@ -251,6 +271,101 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
     return circuits
 
 
+def transpile_parametric(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
+                         parameters: Optional[List] = None,
+                         **transpile_options: Any) -> Union[ParameterBinder,
+                                                            List[ParameterBinder]]:
+    """Transpile parameterized circuits once, to bind many sets of values to them later.
+
+    The circuits are transpiled with their parameters left unbound, so the
+    transpiled circuits are valid for any numeric values of the parameters.
+    Binding values to them is then an update of the parameterized gates of the
+    transpiled circuit, instead of a new transpilation of every bound circuit::
+
+        from qiskit.compiler import transpile_parametric
+
+        plan = transpile_parametric(ansatz, backend=backend, optimization_level=3)
+        for values in optimizer_steps:
+            job = backend.run(assemble(plan.bind([values]), backend))
+
+    Args:
+        circuits: Parameterized circuit(s) to transpile.
+        parameters: The order of the parameters in the values bound to the
+            transpiled circuits. Defaults to the parameters of each circuit
+            sorted by name. It may include parameters removed by the transpiler.
+        transpile_options: Options passed to :func:`~qiskit.compiler.transpile`.
+
+    Returns:
+        A binding plan, or a list of binding plans if a list of circuits was
+        given. The transpiled template circuit of a plan is its
+        :attr:`~qiskit.circuit.ParameterBinder.circuit`.
+
+    Raises:
+        TranspilerError: if a transpiled circuit depends on parameters that are
+            not parameters of the input circuit.
+    """
+    if 'pass_manager' in transpile_options:
+        raise TranspilerError("transpile_parametric does not support the pass_manager option.")
+    single_circuit = isinstance(circuits, QuantumCircuit)
+    circuits = [circuits] if single_circuit else circuits
+
+    templates = transpile(circuits, **transpile_options)
+    templates = templates if isinstance(templates, list) else [templates]
+
+    plans = []
+    for circuit, template in zip(circuits, templates):
+        if not template.parameters <= circuit.parameters:
+            raise TranspilerError("The transpiled circuit {} depends on parameters ({}) that are "
+                                  "not in the input circuit.".format(
+                                      template.name,
+                                      [str(p) for p in template.parameters - circuit.parameters]))
+        circuit_parameters = parameters
+        if circuit_parameters is None:
+            circuit_parameters = sorted(circuit.parameters, key=lambda param: param.name)
+        plans.append(ParameterBinder(template, circuit_parameters))
+
+    if single_circuit:
+        return plans[0]
+    return plans
+
+
+def _transpile_circuits(circuit_config_tuples, profile=None):
+    """Transpile circuits in parallel, recording the statistics of the passes in ``profile``."""
+    if profile is None:
+        return parallel_map(_transpile_circuit, circuit_config_tuples)
+
+    results = parallel_map(_transpile_circuit, circuit_config_tuples,
+                           task_kwargs={'profile_memory': profile.memory})
+    for _, circuit_profile in results:
+        profile.merge(circuit_profile)
+    return [circuit for circuit, _ in results]
+
+
+def _transpile_with_cache(circuits, transpile_args, cache, profile=None):
+    """Transpile the circuits missing from ``cache`` in parallel, and add them to it."""
+    results = [None] * len(circuits)
+    misses = []
+    for index, (circuit, transpile_config) in enumerate(zip(circuits, transpile_args)):
+        if transpile_config['callback'] is not None:
+            misses.append((index, None))
+            continue
+        key = transpile_cache_key(circuit, transpile_config)
+        cached = cache.get(key)
+        if cached is None:
+            misses.append((index, key))
+        else:
+            cached.name = transpile_config['output_name'] or circuit.name
+            results[index] = cached
+
+    transpiled = _transpile_circuits([(circuits[index], transpile_args[index])
+                                      for index, _ in misses], profile)
+    for (index, key), circuit in zip(misses, transpiled):
+        if key is not None:
+            cache.put(key, circuit)
+        results[index] = circuit
+    return results
+
+
 def _check_conflicting_argument(**kargs):
     conflicting_args = [arg for arg, value in kargs.items() if value]
     if conflicting_args:
@@ -285,7 +400,8 @@ def _log_transpile_time(start_time, end_time):
     LOG.info(log_msg)
 
 
-def _transpile_circuit(circuit_config_tuple: Tuple[QuantumCircuit, Dict]) -> QuantumCircuit:
+def _transpile_circuit(circuit_config_tuple: Tuple[QuantumCircuit, Dict],
+                       profile_memory: Optional[bool] = None) -> QuantumCircuit:
     """Select a PassManager and run a single circuit through it.
     Args:
         circuit_config_tuple (tuple):
@@ -296,8 +412,10 @@ def _transpile_circuit(circuit_config_tuple: Tuple[QuantumCircuit, Dict]) -> Qua
                  'output_name': string,
                  'callback': callable,
                  'pass_manager_config': PassManagerConfig}
+        profile_memory (bool): If not ``None``, profile the passes, measuring their
+            peak memory if ``True``.
     Returns:
-        The transpiled circuit
+        The transpiled circuit, and its TranspileProfile if ``profile_memory`` is set
     Raises:
         TranspilerError: if transpile_config is not valid or transpilation incurs error
     """
@@ -323,14 +441,20 @@ def _transpile_circuit(circuit_config_tuple: Tuple[QuantumCircuit, Dict]) -> Qua
     else:
         raise TranspilerError("optimization_level can range from 0 to 3.")
 
+    profile = None
+    if profile_memory is not None:
+        profile = TranspileProfile(memory=profile_memory)
+
     result = pass_manager.run(circuit, callback=transpile_config['callback'],
-                              output_name=transpile_config['output_name'])
+                              output_name=transpile_config['output_name'], profile=profile)
 
     if transpile_config['faulty_qubits_map']:
-        return _remap_circuit_faulty_backend(result, transpile_config['backend_num_qubits'],
-                                             pass_manager_config.backend_properties,
-                                             transpile_config['faulty_qubits_map'])
+        result = _remap_circuit_faulty_backend(result, transpile_config['backend_num_qubits'],
+                                               pass_manager_config.backend_properties,
+                                               transpile_config['faulty_qubits_map'])
 
+    if profile is not None:
+        return result, profile
     return result
 
 
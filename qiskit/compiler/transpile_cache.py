@@ -0,0 +1,229 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Content-addressed cache of transpiled circuits."""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+from collections import OrderedDict
+
+from qiskit.circuit.parameter import Parameter
+from qiskit.circuit.parameterexpression import ParameterExpression
+from qiskit.version import __version__
+
+LOG = logging.getLogger(__name__)
+
+
+class TranspileCache:
+    """A cache of transpiled circuits, keyed on the content of the transpilation.
+
+    The key of a transpiled circuit is a hash of the structure of the input
+    circuit (registers, instructions, parameters, calibrations) and of all the
+    options it was transpiled with (basis gates, coupling map, backend
+    properties, layout, optimization level, seed, ...), and of the version of
+    Qiskit, so that circuits stored on disk by another version are not used.
+    The name of the input circuit is not part of the key. When
+    :func:`~qiskit.compiler.transpile` is given a cache, the circuits already
+    in the cache are returned from it instead of being transpiled again::
+
+        from qiskit.compiler import transpile, TranspileCache
+
+        cache = TranspileCache(max_size=1000, directory='~/.qiskit/transpile_cache')
+        transpiled = transpile(circuits, backend, seed_transpiler=11, cache=cache)
+
+    .. note::
+
+        When ``seed_transpiler`` is not set, the stochastic passes of the
+        transpiler may give a different result on every call. A cached result
+        is then one of the possible transpilations of the circuit, which is
+        returned for every later call.
+    """
+
+    def __init__(self, max_size=128, directory=None):
+        """Create an empty cache.
+
+        Args:
+            max_size (int): Maximum number of transpiled circuits kept in memory.
+                The least recently used circuits are evicted first.
+            directory (str): If set, transpiled circuits are also stored in
+                this directory, so that they can be shared between processes
+                and sessions. It is created if it does not exist.
+        """
+        self.max_size = max_size
+        self.directory = None
+        if directory is not None:
+            self.directory = os.path.abspath(os.path.expanduser(directory))
+            os.makedirs(self.directory, exist_ok=True)
+        self._circuits = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._circuits)
+
+    def __contains__(self, key):
+        return key in self._circuits or (self.directory is not None and
+                                         os.path.exists(self._path(key)))
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.pickle')
+
+    def get(self, key):
+        """Return a copy of the transpiled circuit stored with ``key``.
+
+        Args:
+            key (str): the key of the circuit, as returned by :func:`transpile_cache_key`.
+
+        Returns:
+            QuantumCircuit: the transpiled circuit, or ``None`` if it is not in the cache.
+        """
+        circuit = self._circuits.get(key)
+        if circuit is not None:
+            self._circuits.move_to_end(key)
+        elif self.directory is not None and os.path.exists(self._path(key)):
+            try:
+                with open(self._path(key), 'rb') as file:
+                    circuit = pickle.load(file)
+            except Exception:  # pylint: disable=broad-except
+                LOG.warning('Unable to read the cached transpiled circuit %s.', key)
+                circuit = None
+            if circuit is not None:
+                self._store_in_memory(key, circuit)
+
+        if circuit is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return circuit.copy()
+
+    def put(self, key, circuit):
+        """Store a copy of a transpiled circuit with ``key``.
+
+        Args:
+            key (str): the key of the circuit, as returned by :func:`transpile_cache_key`.
+            circuit (QuantumCircuit): the transpiled circuit.
+        """
+        circuit = circuit.copy()
+        self._store_in_memory(key, circuit)
+        if self.directory is not None:
+            # Write to a temporary file first, so that concurrent readers never
+            # see a partially written circuit.
+            temporary_path = '{}.{}.tmp'.format(self._path(key), os.getpid())
+            with open(temporary_path, 'wb') as file:
+                pickle.dump(circuit, file)
+            os.replace(temporary_path, self._path(key))
+
+    def _store_in_memory(self, key, circuit):
+        self._circuits[key] = circuit
+        self._circuits.move_to_end(key)
+        while len(self._circuits) > self.max_size:
+            self._circuits.popitem(last=False)
+
+    def clear(self):
+        """Remove all the circuits from the cache, including the ones on disk."""
+        self._circuits.clear()
+        if self.directory is not None:
+            for filename in os.listdir(self.directory):
+                if filename.endswith('.pickle'):
+                    os.remove(os.path.join(self.directory, filename))
+
+
+def transpile_cache_key(circuit, transpile_config):
+    """Return the key of the transpilation of ``circuit`` with ``transpile_config``.
+
+    Args:
+        circuit (QuantumCircuit): the circuit to transpile.
+        transpile_config (dict): the transpilation options of the circuit, as
+            returned by ``_parse_transpile_args``.
+
+    Returns:
+        str: the hexadecimal SHA-256 hash of the canonical form of the circuit and
+        options, and of the version of Qiskit.
+    """
+    pm_config = transpile_config['pass_manager_config']
+
+    coupling_map = pm_config.coupling_map
+    if coupling_map is not None:
+        coupling_map = sorted(coupling_map.get_edges())
+
+    initial_layout = pm_config.initial_layout
+    if initial_layout is not None:
+        initial_layout = sorted((physical, _bit_key(virtual)) for physical, virtual
+                                in initial_layout.get_physical_bits().items())
+
+    durations = pm_config.instruction_durations
+    if durations is not None:
+        durations = (durations.dt, sorted(durations.duration_by_name.items()),
+                     sorted(durations.duration_by_name_qubits.items()))
+
+    properties = pm_config.backend_properties
+    if properties is not None:
+        properties = json.dumps(properties.to_dict(), sort_keys=True, default=str)
+
+    faulty_qubits_map = transpile_config.get('faulty_qubits_map')
+    if faulty_qubits_map is not None:
+        faulty_qubits_map = sorted(faulty_qubits_map.items())
+
+    options = (pm_config.basis_gates, coupling_map, initial_layout,
+               pm_config.layout_method, pm_config.routing_method,
+               pm_config.translation_method, pm_config.scheduling_method,
+               durations, properties, pm_config.seed_transpiler,
+               transpile_config['optimization_level'],
+               transpile_config.get('backend_num_qubits'), faulty_qubits_map)
+
+    content = repr((__version__, _circuit_key(circuit), options))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _bit_key(bit):
+    return (bit.register.name, bit.register.size, type(bit.register).__name__, bit.index)
+
+
+def _param_key(param):
+    if isinstance(param, ParameterExpression):
+        # Identical parameters are required for the cached circuit to refer to
+        # the parameters of the input circuit.
+        symbols = sorted((p.name, str(p._uuid)) for p in param.parameters
+                         if isinstance(p, Parameter))
+        return ('expr', str(param), tuple(symbols))
+    if hasattr(param, 'tolist'):
+        return ('array', repr(param.tolist()))
+    return repr(param)
+
+
+def _circuit_key(circuit):
+    """Return a canonical, hashable representation of the content of ``circuit``."""
+    instructions = []
+    # A copy of the data keeps the shared instructions of the circuit shared
+    for instruction, qargs, cargs in circuit.data.copy():
+        condition = instruction.condition
+        if condition is not None:
+            condition = (condition[0].name, condition[0].size, condition[1])
+        definition = None
+        if instruction._definition is not None and \
+                not type(instruction).__module__.startswith('qiskit.circuit.library'):
+            # Custom instructions with the same name may have different definitions.
+            definition = _circuit_key(instruction._definition)
+        instructions.append((type(instruction).__name__, instruction.name,
+                             tuple(_param_key(param) for param in instruction.params),
+                             condition, definition,
+                             tuple(_bit_key(qubit) for qubit in qargs),
+                             tuple(_bit_key(clbit) for clbit in cargs)))
+
+    calibrations = sorted((name, repr(schedules)) for name, schedules
+                          in circuit.calibrations.items())
+    return (tuple((reg.name, reg.size, type(reg).__name__) for reg in circuit.qregs),
+            tuple((reg.name, reg.size) for reg in circuit.cregs),
+            _param_key(circuit.global_phase), tuple(instructions), tuple(calibrations))
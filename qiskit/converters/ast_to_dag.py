@@ -252,7 +252,8 @@ class AstInterpreter:
         maxidx = max([len(id0), len(id1)])
         for idx in range(maxidx):
             cx_gate = CXGate()
-            cx_gate.condition = self.condition
+            if self.condition is not None:
+                cx_gate = cx_gate.c_if(*self.condition)
             if len(id0) > 1 and len(id1) > 1:
                 self.dag.apply_operation_back(cx_gate, [id0[idx], id1[idx]], [])
             elif len(id0) > 1:
@@ -418,7 +419,8 @@ class AstInterpreter:
             QiskitError: if encountering a non-basis opaque gate
         """
         op = self._create_op(name, params)
-        op.condition = self.condition
+        if self.condition is not None:
+            op = op.c_if(*self.condition)
         self.dag.apply_operation_back(op, qargs, [])
 
     def _create_op(self, name, params):
@@ -15,11 +15,15 @@
 from qiskit.dagcircuit.dagcircuit import DAGCircuit
 
 
-def circuit_to_dag(circuit):
+def circuit_to_dag(circuit, copy_operations=True):
     """Build a ``DAGCircuit`` object from a ``QuantumCircuit``.
 
     Args:
         circuit (QuantumCircuit): the input circuit.
+        copy_operations (bool): Deep copy the operation objects of the
+            circuit for the DAG. If ``False``, the DAG shares the operation
+            objects of the circuit, which is faster but means that modifying
+            an operation in place modifies both of them.
 
     Return:
         DAGCircuit: the DAG representing the input circuit.
@@ -53,8 +57,15 @@ def circuit_to_dag(circuit):
     for register in circuit.cregs:
         dagcircuit.add_creg(register)
 
-    for instruction, qargs, cargs in circuit.data:
-        dagcircuit.apply_operation_back(instruction.copy(), qargs, cargs)
+    # Reading circuit.data builds the library circuits which are not built yet.
+    # Its stored instructions are used as they are, so that the shared immutable
+    # instructions are not replaced by mutable copies in the circuit.
+    data = circuit.data.copy()
+    if copy_operations:
+        dagcircuit._apply_operations_back(
+            (instruction.copy(), qargs, cargs) for instruction, qargs, cargs in data)
+    else:
+        dagcircuit._apply_operations_back(data)
 
     dagcircuit.duration = circuit.duration
     dagcircuit.unit = circuit.unit
@@ -14,11 +14,15 @@
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 
 
-def dag_to_circuit(dag):
+def dag_to_circuit(dag, copy_operations=True):
     """Build a ``QuantumCircuit`` object from a ``DAGCircuit``.
 
     Args:
         dag (DAGCircuit): the input dag.
+        copy_operations (bool): Deep copy the operation objects of the DAG
+            for the circuit. If ``False``, the circuit shares the operation
+            objects of the DAG, except for those whose condition differs from
+            the condition of their node, which are still copied.
 
     Return:
         QuantumCircuit: the circuit representing the input dag.
@@ -51,9 +55,13 @@ def dag_to_circuit(dag):
     circuit.calibrations = dag.calibrations
 
     for node in dag.topological_op_nodes():
+        inst = node.op
         # Get arguments for classical control (if any)
-        inst = node.op.copy()
-        inst.condition = node.condition
+        if inst.condition != node.condition:
+            inst = inst.copy().to_mutable()
+            inst.condition = node.condition
+        elif copy_operations:
+            inst = inst.copy()
         circuit._append(inst, node.qargs, node.cargs)
 
     circuit.duration = dag.duration
@@ -36,6 +36,10 @@ from qiskit.circuit.parameterexpression import ParameterExpression
 from qiskit.dagcircuit.exceptions import DAGCircuitError
 from qiskit.dagcircuit.dagnode import DAGNode
 
+# Source of the DAG versions: every modification of any DAG gives it a new,
+# process-wide unique, version.
+_VERSIONS = itertools.count()
+
 
 class DAGCircuit:
     """
@@ -97,6 +101,36 @@ class DAGCircuit:
         self.duration = None
         self.unit = 'dt'
 
+        # Changed by every modification of the DAG, see ``__setattr__``.
+        self._version = next(_VERSIONS)
+
+    @property
+    def version(self):
+        """An identifier of the current state of the DAG.
+
+        It changes whenever the DAG is modified, either through its methods
+        (adding or removing operations or wires, substituting nodes) or by
+        setting one of its attributes (such as the global phase or the
+        calibrations), and is preserved by copies of the DAG. Two equal
+        versions therefore mean the DAG did not change, which lets the pass
+        manager keep the analyses of an unmodified DAG.
+
+        Returns:
+            int: the version of the DAG.
+        """
+        return self._version
+
+    def _modified(self):
+        """Give a new version to the DAG, after it is modified."""
+        self._version = next(_VERSIONS)
+
+    def __setattr__(self, name, value):
+        # Setting any attribute of the DAG (its name, global phase, duration,
+        # or an attribute set by a pass) modifies it.
+        super().__setattr__(name, value)
+        if name != '_version':
+            super().__setattr__('_version', next(_VERSIONS))
+
     def to_networkx(self):
         """Returns a copy of the DAGCircuit in networkx format."""
         G = nx.MultiDiGraph()
@@ -257,6 +291,7 @@ class DAGCircuit:
             DAGCircuitError: if trying to add duplicate wire
         """
         if wire not in self._wires:
+            self._modified()
             self._wires.add(wire)
 
             wire_name = "%s[%s]" % (wire.register.name, wire.index)
@@ -330,6 +365,7 @@ class DAGCircuit:
             int: The integer node index for the new op node on the DAG
         """
         # Add a new operation node to the graph
+        self._modified()
         new_node = DAGNode(type="op", op=op, name=op.name, qargs=qargs,
                            cargs=cargs)
         node_index = self._multi_graph.add_node(new_node)
@@ -367,7 +403,9 @@ class DAGCircuit:
         if condition:
             warnings.warn("Use of condition arg is deprecated, set condition in instruction",
                           DeprecationWarning)
-        op.condition = condition if op.condition is None else op.condition
+        if condition and op.condition is None:
+            op = op.to_mutable()
+            op.condition = condition
 
         qargs = qargs or []
         cargs = cargs or []
@@ -402,6 +440,73 @@ class DAGCircuit:
 
         return self._multi_graph[node_index]
 
+    def _apply_operations_back(self, operations):
+        """Apply a sequence of operations to the output of the circuit.
+
+        This is equivalent to calling :meth:`apply_operation_back` for each
+        operation in turn, but the nodes and the edges of all the operations
+        are added to the graph at once.
+
+        Args:
+            operations (iterable): the ``(op, qargs, cargs)`` tuples of the
+                operations, in order.
+        Returns:
+            list[DAGNode]: the nodes of the operations.
+
+        Raises:
+            DAGCircuitError: if a leaf node is connected to multiple outputs
+        """
+        nodes = []
+        node_wires = []
+        last_use = {}
+        for op, qargs, cargs in operations:
+            qargs = qargs or []
+            cargs = cargs or []
+            all_cbits = self._bits_in_condition(op.condition)
+            all_cbits = set(all_cbits).union(cargs)
+
+            self._check_condition(op.name, op.condition)
+            self._check_bits(qargs, self.output_map)
+            self._check_bits(all_cbits, self.output_map)
+
+            wires = list(itertools.chain(qargs, all_cbits))
+            for wire in wires:
+                last_use[wire] = len(nodes)
+            nodes.append(DAGNode(type="op", op=op, name=op.name, qargs=qargs, cargs=cargs))
+            node_wires.append(wires)
+        if not nodes:
+            return nodes
+
+        self._modified()
+        for node, node_index in zip(nodes, self._multi_graph.add_nodes_from(nodes)):
+            node._node_id = node_index
+
+        # Disconnect the output nodes of the wires used by the operations,
+        # then add the edges in the order apply_operation_back would add them
+        wire_names = {}
+        predecessors = {}
+        for wire in last_use:
+            output_index = self.output_map[wire]._node_id
+            ie = self._multi_graph.predecessors(output_index)
+            if len(ie) != 1:
+                raise DAGCircuitError("output node has multiple in-edges")
+            self._multi_graph.remove_edge(ie[0]._node_id, output_index)
+            predecessors[wire] = ie[0]._node_id
+            wire_names[wire] = "%s[%s]" % (wire.register.name, wire.index)
+
+        edges = []
+        for position, (node, wires) in enumerate(zip(nodes, node_wires)):
+            node_index = node._node_id
+            for wire in wires:
+                edges.append((predecessors[wire], node_index,
+                              {'name': wire_names[wire], 'wire': wire}))
+                predecessors[wire] = node_index
+                if last_use[wire] == position:
+                    edges.append((node_index, self.output_map[wire]._node_id,
+                                  {'name': wire_names[wire], 'wire': wire}))
+        self._multi_graph.add_edges_from(edges)
+        return nodes
+
     def apply_operation_front(self, op, qargs, cargs, condition=None):
         """Apply an operation to the input of the circuit.
 
@@ -420,7 +525,9 @@ class DAGCircuit:
             warnings.warn("Use of condition arg is deprecated, set condition in instruction",
                           DeprecationWarning)
 
-        op.condition = condition if op.condition is None else op.condition
+        if condition and op.condition is None:
+            op = op.to_mutable()
+            op.condition = condition
         all_cbits = self._bits_in_condition(op.condition)
         all_cbits.extend(cargs)
 
@@ -903,6 +1010,7 @@ class DAGCircuit:
             to_replay = []
             for sorted_node in in_dag.topological_nodes():
                 if sorted_node.type == "op":
+                    sorted_node.op = sorted_node.op.to_mutable()
                     sorted_node.op.condition = condition
                     to_replay.append(sorted_node)
             for input_node in in_dag.op_nodes():
@@ -964,6 +1072,7 @@ class DAGCircuit:
                                           'on which it would be conditioned.')
 
         # Now that we know the connections, delete node
+        self._modified()
         self._multi_graph.remove_node(node._node_id)
 
         # Iterate over nodes of input_circuit
@@ -1041,6 +1150,7 @@ class DAGCircuit:
                     node.op.num_qubits, node.op.num_clbits,
                     op.num_qubits, op.num_clbits))
 
+        self._modified()
         if inplace:
             node.op = op
             node.name = op.name
@@ -1234,6 +1344,7 @@ class DAGCircuit:
             raise DAGCircuitError('The method remove_op_node only works on op node types. An "%s" '
                                   'node type was wrongly provided.' % node.type)
 
+        self._modified()
         self._multi_graph.remove_node_retain_edges(
             node._node_id, use_outgoing=False,
             condition=lambda edge1, edge2: edge1 == edge2)
@@ -1302,6 +1413,39 @@ class DAGCircuit:
         layers as this is currently implemented. This may not be
         the desired behavior.
         """
+        for layer in self.layer_views():
+            yield {"graph": self._layer_graph(layer), "partition": layer["partition"]}
+
+    def _layer_graph(self, layer):
+        """Return a new DAGCircuit with the op nodes of a layer view of this dag."""
+        # Construct a shallow copy of self
+        new_layer = DAGCircuit()
+        new_layer.name = self.name
+
+        # add in the registers - this adds the input/output nodes
+        for creg in self.cregs.values():
+            new_layer.add_creg(creg)
+        for qreg in self.qregs.values():
+            new_layer.add_qreg(qreg)
+
+        for node in layer["nodes"]:
+            # this creates new DAGNodes in the new_layer
+            new_layer.apply_operation_back(node.op,
+                                           node.qargs,
+                                           node.cargs)
+        return new_layer
+
+    def layer_views(self):
+        """Yield a lightweight view on each of the layers of this DAGCircuit.
+
+        The layers are the ones of :meth:`layers`, without building a new
+        DAGCircuit for each of them. Each returned layer is a dict containing
+        {"nodes": list of op nodes, "partition": list of qubit lists}.
+
+        The nodes of a layer are the DAGNodes of this dag, in the order they
+        were added to it: they must not be modified, and the layers are only
+        valid as long as the dag is not modified.
+        """
         graph_layers = self.multigraph_layers()
         try:
             next(graph_layers)  # Remove input nodes
@@ -1324,30 +1468,14 @@ class DAGCircuit:
             if not op_nodes:
                 return
 
-            # Construct a shallow copy of self
-            new_layer = DAGCircuit()
-            new_layer.name = self.name
-
-            # add in the registers - this adds the input/output nodes
-            for creg in self.cregs.values():
-                new_layer.add_creg(creg)
-            for qreg in self.qregs.values():
-                new_layer.add_qreg(qreg)
-
-            for node in op_nodes:
-                # this creates new DAGNodes in the new_layer
-                new_layer.apply_operation_back(node.op,
-                                               node.qargs,
-                                               node.cargs)
-
             # The quantum registers that have an operation in this layer.
             support_list = [
                 op_node.qargs
-                for op_node in new_layer.op_nodes()
+                for op_node in op_nodes
                 if op_node.name not in {"barrier", "snapshot", "save", "load", "noise"}
             ]
 
-            yield {"graph": new_layer, "partition": support_list}
+            yield {"nodes": op_nodes, "partition": support_list}
 
     def serial_layers(self):
         """Yield a layer for all gates of this circuit.
@@ -1379,6 +1507,21 @@ class DAGCircuit:
             l_dict = {"graph": new_layer, "partition": support_list}
             yield l_dict
 
+    def serial_layer_views(self):
+        """Yield a lightweight view on a layer for all gates of this circuit.
+
+        The layers are the ones of :meth:`serial_layers`, without building a
+        new DAGCircuit for each of them. The layers have the same structure as
+        in layer_views(): their node is the DAGNode of this dag.
+        """
+        for next_node in self.topological_op_nodes():
+            # Save the support of the operation in the layer
+            support_list = []
+            if next_node.name not in ["barrier",
+                                      "snapshot", "save", "load", "noise"]:
+                support_list.append(list(next_node.qargs))
+            yield {"nodes": [next_node], "partition": support_list}
+
     def multigraph_layers(self):
         """Yield layers of the multigraph."""
         first_layer = [x._node_id for x in self.input_map.values()]
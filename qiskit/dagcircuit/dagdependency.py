@@ -22,9 +22,9 @@ import retworkx as rx
 
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.circuit.classicalregister import ClassicalRegister
+from qiskit.circuit.commutation_library import SessionCommutationLibrary
 from qiskit.dagcircuit.exceptions import DAGDependencyError
 from qiskit.dagcircuit.dagdepnode import DAGDepNode
-from qiskit.quantum_info.operators import Operator
 
 
 class DAGDependency:
@@ -89,6 +89,11 @@ class DAGDependency:
         self.duration = None
         self.unit = 'dt'
 
+        # Bitmasks of node ids used to add nodes incrementally: the ancestors
+        # of each node, and the nodes acting on each qubit index.
+        self._predecessor_masks = []
+        self._qubit_index_masks = {}
+
     @property
     def global_phase(self):
         """Return the global phase of the circuit."""
@@ -370,58 +375,22 @@ class DAGDependency:
         self._add_multi_graph_node(new_node)
         self._update_edges()
 
-    def _gather_pred(self, node_id, direct_pred):
-        """Function set an attribute predecessors and gather multiple lists
-        of direct predecessors into a single one.
-
-        Args:
-            node_id (int): label of the considered node in the DAG
-            direct_pred (list): list of direct successors for the given node
-
-        Returns:
-            DAGDependency: A multigraph with update of the attribute ['predecessors']
-            the lists of direct successors are put into a single one
-        """
-        gather = self._multi_graph
-        gather.get_node_data(node_id).predecessors = []
-        for d_pred in direct_pred:
-            gather.get_node_data(node_id).predecessors.append([d_pred])
-            pred = self._multi_graph.get_node_data(d_pred).predecessors
-            gather.get_node_data(node_id).predecessors.append(pred)
-        return gather
-
-    def _gather_succ(self, node_id, direct_succ):
+    def _build_masks(self):
         """
-        Function set an attribute successors and gather multiple lists
-        of direct successors into a single one.
-
-        Args:
-            node_id (int): label of the considered node in the DAG
-            direct_succ (list): list of direct successors for the given node
-
-        Returns:
-            MultiDiGraph: with update of the attribute ['predecessors']
-            the lists of direct successors are put into a single one
+        Rebuild the bitmasks used by _update_edges from the graph, for all the
+        nodes but the last one. It is only needed when nodes were added
+        without add_op_node, e.g. in a copy.
         """
-        gather = self._multi_graph
-        for d_succ in direct_succ:
-            gather.get_node_data(node_id).successors.append([d_succ])
-            succ = gather.get_node_data(d_succ).successors
-            gather.get_node_data(node_id).successors.append(succ)
-        return gather
-
-    def _list_pred(self, node_id):
-        """
-        Use _gather_pred function and merge_no_duplicates to construct
-        the list of predecessors for a given node.
-
-        Args:
-            node_id (int): label of the considered node
-        """
-        direct_pred = self.direct_predecessors(node_id)
-        self._multi_graph = self._gather_pred(node_id, direct_pred)
-        self._multi_graph.get_node_data(node_id).predecessors = list(
-            merge_no_duplicates(*(self._multi_graph.get_node_data(node_id).predecessors)))
+        self._predecessor_masks = []
+        self._qubit_index_masks = {}
+        for node_id in range(len(self._multi_graph) - 1):
+            mask = 0
+            for pred_id in self._multi_graph.adj_direction(node_id, True):
+                mask |= self._predecessor_masks[pred_id] | (1 << pred_id)
+            self._predecessor_masks.append(mask)
+            for qarg in self._multi_graph.get_node_data(node_id).qargs:
+                self._qubit_index_masks[qarg.index] = \
+                    self._qubit_index_masks.get(qarg.index, 0) | (1 << node_id)
 
     def _update_edges(self):
         """
@@ -429,35 +398,53 @@ class DAGDependency:
         for predecessors, the nodes do not commute and
         if the predecessor is reachable. Update the DAGDependency by
         introducing edges and predecessors(attribute)
+
+        Only the earlier nodes acting on a qubit index of the new node may not
+        commute with it. They are visited from the most recent one, and once a
+        predecessor is found its ancestors, which are not reachable anymore,
+        are removed from the nodes to visit at once, the sets of nodes being
+        bitmasks of node ids.
         """
         max_node_id = len(self._multi_graph) - 1
         max_node = self._multi_graph.get_node_data(max_node_id)
+        if len(self._predecessor_masks) != max_node_id:
+            self._build_masks()
+
+        qubit_indices = {qarg.index for qarg in max_node.qargs}
+        candidates = 0
+        for index in qubit_indices:
+            candidates |= self._qubit_index_masks.get(index, 0)
 
-        for current_node_id in range(0, max_node_id):
-            self._multi_graph.get_node_data(current_node_id).reachable = True
         # Check the commutation relation with reachable node, it adds edges if it does not commute
-        for prev_node_id in range(max_node_id - 1, -1, -1):
-            if self._multi_graph.get_node_data(prev_node_id).reachable and not _does_commute(
-                    self._multi_graph.get_node_data(prev_node_id), max_node):
+        predecessors = 0
+        while candidates:
+            prev_node_id = candidates.bit_length() - 1
+            candidates ^= 1 << prev_node_id
+            if not _does_commute(self._multi_graph.get_node_data(prev_node_id), max_node):
                 self._multi_graph.add_edge(prev_node_id, max_node_id, {'commute': False})
-                self._list_pred(max_node_id)
-                list_predecessors = self._multi_graph.get_node_data(max_node_id).predecessors
-                for pred_id in list_predecessors:
-                    self._multi_graph.get_node_data(pred_id).reachable = False
+                predecessors |= self._predecessor_masks[prev_node_id] | (1 << prev_node_id)
+                candidates &= ~predecessors
+
+        self._predecessor_masks.append(predecessors)
+        for index in qubit_indices:
+            self._qubit_index_masks[index] = \
+                self._qubit_index_masks.get(index, 0) | (1 << max_node_id)
+        max_node.predecessors = _mask_to_list(predecessors)
 
     def _add_successors(self):
         """
-        Use _gather_succ and merge_no_duplicates to create the list of successors
-        for each node. Update DAGDependency 'successors' attribute. It has to
-        be used when the DAGDependency() object is complete (i.e. converters).
+        Create the list of successors for each node, from the bitmasks of the
+        successors of its direct successors. Update DAGDependency 'successors'
+        attribute. It has to be used when the DAGDependency() object is
+        complete (i.e. converters).
         """
+        successor_masks = [0] * len(self._multi_graph)
         for node_id in range(len(self._multi_graph) - 1, -1, -1):
-            direct_successors = self.direct_successors(node_id)
-
-            self._multi_graph = self._gather_succ(node_id, direct_successors)
-
-            self._multi_graph.get_node_data(node_id).successors = list(
-                merge_no_duplicates(*self._multi_graph.get_node_data(node_id).successors))
+            mask = 0
+            for succ_id in self._multi_graph.adj_direction(node_id, False):
+                mask |= successor_masks[succ_id] | (1 << succ_id)
+            successor_masks[node_id] = mask
+            self._multi_graph.get_node_data(node_id).successors = _mask_to_list(mask)
 
     def copy(self):
         """
@@ -470,11 +457,15 @@ class DAGDependency:
         dag.name = self.name
         dag.cregs = self.cregs.copy()
         dag.qregs = self.qregs.copy()
+        dag.qubits = self.qubits.copy()
+        dag.clbits = self.clbits.copy()
 
         for node in self.get_nodes():
             dag._multi_graph.add_node(node.copy())
-        for edges in self.get_all_edges():
-            dag._multi_graph.add_edge(edges[0], edges[1], edges[2])
+        # The edges are added in the order they were added to this DAG, so that
+        # the copy enumerates them (e.g. in get_all_edges) in the same order.
+        for src, dest, data in self._multi_graph.weighted_edge_list():
+            dag._multi_graph.add_edge(src, dest, data)
         return dag
 
     def draw(self, scale=0.7, filename=None, style='color'):
@@ -515,6 +506,15 @@ def merge_no_duplicates(*iterables):
             yield val
 
 
+def _mask_to_list(mask):
+    """Return the sorted list of the positions of the bits set in a bitmask."""
+    if not mask:
+        return []
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, 'little')
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), bitorder='little')
+    return np.flatnonzero(bits).tolist()
+
+
 def _does_commute(node1, node2):
     """Function to verify commutation relation between two nodes in the DAG.
 
@@ -562,16 +562,5 @@ def _does_commute(node1, node2):
     if qarg1 == qarg2 and ({node1.name, node2.name} in non_commute_gates):
         return False
 
-    # Create matrices to check commutation relation if no other criteria are matched
-    qarg = list(set(node1.qargs + node2.qargs))
-    qbit_num = len(qarg)
-
-    qarg1 = [qarg.index(q) for q in node1.qargs]
-    qarg2 = [qarg.index(q) for q in node2.qargs]
-
-    id_op = Operator(np.eye(2 ** qbit_num))
-
-    op12 = id_op.compose(node1.op, qargs=qarg1).compose(node2.op, qargs=qarg2)
-    op21 = id_op.compose(node2.op, qargs=qarg2).compose(node1.op, qargs=qarg1)
-
-    return op12 == op21
+    # Check the commutation relation if no other criteria are matched
+    return SessionCommutationLibrary.commute(node1.op, node1.qargs, node2.op, node2.qargs)
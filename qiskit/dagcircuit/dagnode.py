@@ -40,8 +40,9 @@ class DAGNode:
         if condition:
             warnings.warn("Use of condition arg is deprecated, set condition in instruction.",
                           DeprecationWarning)
-        if self._op:
-            self._op.condition = condition if self._op.condition is None else self._op.condition
+        if self._op and condition and self._op.condition is None:
+            self._op = self._op.to_mutable()
+            self._op.condition = condition
         self.condition = self._op.condition if self._op is not None else None
         self._wire = wire
         self._node_id = nid
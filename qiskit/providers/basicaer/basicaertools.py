@@ -14,9 +14,11 @@
 
 """
 
+from functools import lru_cache
 from string import ascii_uppercase, ascii_lowercase
 import numpy as np
 from qiskit.exceptions import QiskitError
+from qiskit.qobj import QasmQobjInstruction
 
 
 def single_gate_params(gate, params=None):
@@ -85,7 +87,12 @@ def einsum_matmul_index(gate_indices, number_of_qubits):
     Returns:
         str: An indices string for the Numpy.einsum function.
     """
+    return _einsum_matmul_index(tuple(gate_indices), number_of_qubits)
 
+
+@lru_cache(maxsize=None)
+def _einsum_matmul_index(gate_indices, number_of_qubits):
+    """Cached implementation of :func:`einsum_matmul_index`."""
     mat_l, mat_r, tens_lin, tens_lout = _einsum_matmul_index_helper(gate_indices,
                                                                     number_of_qubits)
 
@@ -116,7 +123,12 @@ def einsum_vecmul_index(gate_indices, number_of_qubits):
     Returns:
         str: An indices string for the Numpy.einsum function.
     """
+    return _einsum_vecmul_index(tuple(gate_indices), number_of_qubits)
+
 
+@lru_cache(maxsize=None)
+def _einsum_vecmul_index(gate_indices, number_of_qubits):
+    """Cached implementation of :func:`einsum_vecmul_index`."""
     mat_l, mat_r, tens_lin, tens_lout = _einsum_matmul_index_helper(gate_indices,
                                                                     number_of_qubits)
 
@@ -176,3 +188,110 @@ def _einsum_matmul_index_helper(gate_indices, number_of_qubits):
     # Combine indices into matrix multiplication string format
     # for numpy.einsum function
     return mat_left, mat_right, tens_in, tens_out
+
+
+def fuse_gates(instructions):
+    """Fuse the gates of a list of qobj instructions into 1- and 2-qubit unitaries.
+
+    Consecutive unconditional gates whose qubits span at most two qubits are
+    merged into a single ``unitary`` instruction, so that the simulators apply
+    one matrix to the state instead of one per gate. Gates on disjoint qubits
+    are fused independently. The other instructions are kept, and the gates
+    on their qubits that precede them are applied before them.
+
+    Args:
+        instructions (list[QasmQobjInstruction]): the instructions of a qobj
+            experiment.
+
+    Returns:
+        list[QasmQobjInstruction]: the equivalent list of fused instructions.
+    """
+    fused = []
+    # The block of fused gates currently acting on each qubit
+    blocks = {}
+
+    def blocks_on(qubits):
+        return list({id(blocks[qubit]): blocks[qubit]
+                     for qubit in qubits if qubit in blocks}.values())
+
+    def flush(qubit_blocks):
+        for block in qubit_blocks:
+            fused.append(block.instruction())
+            for qubit in block.qubits:
+                del blocks[qubit]
+
+    for operation in instructions:
+        matrix = _fusable_gate_matrix(operation)
+        if matrix is None:
+            if operation.name not in ('barrier', 'id', 'u0'):
+                flush(blocks_on(getattr(operation, 'qubits', [])))
+                fused.append(operation)
+            continue
+        qubits = operation.qubits
+        involved = blocks_on(qubits)
+        if len({qubit for block in involved for qubit in block.qubits}.union(qubits)) > 2:
+            # Apply the blocks that also act on other qubits, and fuse the
+            # gate with the blocks on its own qubits only
+            flush([block for block in involved if not set(block.qubits) <= set(qubits)])
+            involved = [block for block in involved if set(block.qubits) <= set(qubits)]
+        block = _FusedBlock.merge(involved)
+        block.add(operation, matrix)
+        for qubit in block.qubits:
+            blocks[qubit] = block
+    flush(blocks_on(list(blocks)))
+    return fused
+
+
+def _fusable_gate_matrix(operation):
+    """Return the matrix of a gate instruction that can be fused, or None."""
+    if getattr(operation, 'conditional', None) is not None:
+        return None
+    if operation.name in ('U', 'u1', 'u2', 'u3'):
+        return single_gate_matrix(operation.name, getattr(operation, 'params', None))
+    if operation.name in ('CX', 'cx'):
+        return cx_gate_matrix()
+    if operation.name == 'unitary' and len(operation.qubits) <= 2:
+        return np.array(operation.params[0], dtype=complex)
+    return None
+
+
+class _FusedBlock:
+    """A unitary on at most two qubits, product of fused gate instructions."""
+
+    def __init__(self):
+        self.qubits = []
+        self.matrix = np.eye(1, dtype=complex)
+        self.operations = []
+
+    @classmethod
+    def merge(cls, blocks):
+        """Return the tensor product of blocks acting on disjoint qubits."""
+        merged = cls()
+        for block in blocks:
+            merged.qubits.extend(block.qubits)
+            merged.matrix = np.kron(block.matrix, merged.matrix)
+            merged.operations.extend(block.operations)
+        return merged
+
+    def add(self, operation, matrix):
+        """Apply a gate after the block."""
+        for qubit in operation.qubits:
+            if qubit not in self.qubits:
+                self.qubits.append(qubit)
+                self.matrix = np.kron(np.eye(2), self.matrix)
+        num_qubits = len(self.qubits)
+        indices = einsum_matmul_index([self.qubits.index(qubit) for qubit in operation.qubits],
+                                      num_qubits)
+        gate_tensor = np.reshape(matrix, len(operation.qubits) * [2, 2])
+        block_tensor = np.reshape(self.matrix, num_qubits * [2, 2])
+        self.matrix = np.reshape(np.einsum(indices, gate_tensor, block_tensor,
+                                           dtype=complex, casting='no'),
+                                 2 * [2 ** num_qubits])
+        self.operations.append(operation)
+
+    def instruction(self):
+        """Return the instruction of the block."""
+        if len(self.operations) == 1:
+            return self.operations[0]
+        return QasmQobjInstruction(name='unitary', qubits=list(self.qubits),
+                                   params=[self.matrix])
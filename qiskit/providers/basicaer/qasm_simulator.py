@@ -33,7 +33,6 @@ import time
 import logging
 
 from math import log2
-from collections import Counter
 import numpy as np
 
 from qiskit.util import local_hardware_info
@@ -44,6 +43,7 @@ from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import cx_gate_matrix
+from .basicaertools import fuse_gates
 from .basicaertools import einsum_vecmul_index
 
 logger = logging.getLogger(__name__)
@@ -104,7 +104,9 @@ class QasmSimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_statevector": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "gate_fusion": True,
+        "memory_format": "hex"
     }
 
     # Class level variable to return the final state at the end of simulation
@@ -127,6 +129,8 @@ class QasmSimulatorPy(BaseBackend):
         self._memory = False
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._memory_format = self.DEFAULT_OPTIONS["memory_format"]
+        self._gate_fusion = self.DEFAULT_OPTIONS["gate_fusion"]
         self._qobj_config = None
         # TEMP
         self._sample_measure = False
@@ -179,7 +183,7 @@ class QasmSimulatorPy(BaseBackend):
             num_samples (int): The number of memory samples to generate.
 
         Returns:
-            list: A list of memory values in hex format.
+            np.ndarray: An array of the memory values, as integers.
         """
         # Get unique qubits that are actually measured and sort in
         # ascending order
@@ -199,21 +203,48 @@ class QasmSimulatorPy(BaseBackend):
         # Generate samples on measured qubits as ints with qubit
         # position in the bit-string for each int given by the qubit
         # position in the sorted measured_qubits list
-        samples = self._local_random.choice(range(2 ** num_measured),
-                                            num_samples, p=probabilities)
-        # Convert the ints to bitstrings
-        memory = []
-        for sample in samples:
-            classical_memory = self._classical_memory
-            for qubit, cmembit in measure_params:
-                pos = measured_qubits.index(qubit)
-                qubit_outcome = int((sample & (1 << pos)) >> pos)
-                membit = 1 << cmembit
-                classical_memory = (classical_memory & (~membit)) | (qubit_outcome << cmembit)
-            value = bin(classical_memory)[2:]
-            memory.append(hex(int(value, 2)))
+        samples = self._local_random.choice(2 ** num_measured, num_samples, p=probabilities)
+        # Write the outcomes of all the samples into their classical memory,
+        # one measure instruction at a time
+        dtype = self._memory_dtype()
+        memory = np.full(num_samples, self._classical_memory, dtype=dtype)
+        for qubit, cmembit in measure_params:
+            pos = measured_qubits.index(qubit)
+            qubit_outcomes = ((samples >> pos) & 1).astype(dtype)
+            membit = 1 << cmembit
+            memory = (memory & (~membit)) | (qubit_outcomes << cmembit)
         return memory
 
+    def _memory_dtype(self):
+        """Return the dtype of the arrays of classical memory values.
+
+        Memories that do not fit in 64-bit integers are stored as Python
+        integers.
+        """
+        if self._number_of_cmembits < 63:
+            return np.int64
+        return object
+
+    def _format_memory(self, memory):
+        """Compute the counts and the memory of an experiment.
+
+        Args:
+            memory (np.ndarray): The memory values of all the shots, as integers.
+
+        Returns:
+            tuple: pair (counts, memory) where counts is a dict of the number
+            of shots of each memory value in hex format, and memory is the list
+            of memory values in hex format, or the input array of memory values
+            if the ``memory_format`` option is ``'int'``.
+        """
+        values, indices, value_counts = np.unique(memory, return_inverse=True,
+                                                  return_counts=True)
+        hex_values = np.array([hex(int(value)) for value in values], dtype=object)
+        counts = dict(zip(hex_values, value_counts.tolist()))
+        if self._memory_format == 'int':
+            return counts, memory
+        return counts, hex_values[indices].tolist()
+
     def _add_qasm_measure(self, qubit, cmembit, cregbit=None):
         """Apply a measure instruction to a qubit.
 
@@ -278,6 +309,7 @@ class QasmSimulatorPy(BaseBackend):
         # Reset default options
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._memory_format = self.DEFAULT_OPTIONS["memory_format"]
         if backend_options is None:
             backend_options = {}
 
@@ -301,6 +333,19 @@ class QasmSimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for custom gate fusion
+        if 'gate_fusion' in backend_options:
+            self._gate_fusion = backend_options['gate_fusion']
+        elif hasattr(qobj_config, 'gate_fusion'):
+            self._gate_fusion = qobj_config.gate_fusion
+        # Check for custom memory format
+        if 'memory_format' in backend_options:
+            self._memory_format = backend_options['memory_format']
+        elif hasattr(qobj_config, 'memory_format'):
+            self._memory_format = qobj_config.memory_format
+        if self._memory_format not in ('hex', 'int'):
+            raise BasicAerError('invalid memory format: ' +
+                                '{} is not "hex" or "int"'.format(self._memory_format))
 
     def _initialize_statevector(self):
         """Set the initial statevector for simulation"""
@@ -374,16 +419,29 @@ class QasmSimulatorPy(BaseBackend):
         Additional Information:
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
+                * "memory_format": str
+                * "gate_fusion": bool
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
             zero state. This size of this vector must be correct for the number
             of qubits in all experiments in the qobj.
 
+            The "memory_format" option specifies the format of the memory of
+            the experiments, when the memory is returned: "hex" (the default)
+            for a list of hexadecimal strings, or "int" for a numpy array of
+            the memory values as integers.
+
+            The "gate_fusion" option specifies whether to fuse the consecutive
+            gates acting on at most two qubits into a single unitary before
+            applying them to the statevector. The default value is True.
+
             Example::
 
                 backend_options = {
                     "initial_statevector": np.array([1, 0, 0, 1j]) / np.sqrt(2),
+                    "memory_format": "int",
+                    "gate_fusion": False,
                 }
         """
         self._set_options(qobj_config=qobj.config,
@@ -440,7 +498,9 @@ class QasmSimulatorPy(BaseBackend):
                 "data":
                     {
                     "counts": {'0x9: 5, ...},
-                    "memory": ['0x9', '0xF', '0x1D', ..., '0x9']
+                    "memory": ['0x9', '0xF', '0x1D', ..., '0x9'] (or
+                              array([9, 15, 29, ..., 9]) if the
+                              "memory_format" option is "int")
                     },
                 "status": status string for the simulation
                 "success": boolean
@@ -473,6 +533,11 @@ class QasmSimulatorPy(BaseBackend):
         # Check if measure sampling is supported for current circuit
         self._validate_measure_sampling(experiment)
 
+        # Fuse the gates once for all the shots
+        instructions = experiment.instructions
+        if self._gate_fusion:
+            instructions = fuse_gates(instructions)
+
         # List of final counts for all shots
         memory = []
         # Check if we can sample measurements, if so we only perform 1 shot
@@ -491,7 +556,7 @@ class QasmSimulatorPy(BaseBackend):
             # Initialize classical memory to all 0
             self._classical_memory = 0
             self._classical_register = 0
-            for operation in experiment.instructions:
+            for operation in instructions:
                 conditional = getattr(operation, 'conditional', None)
                 if isinstance(conditional, int):
                     conditional_bit_set = (self._classical_register >> conditional) & 1
@@ -589,12 +654,11 @@ class QasmSimulatorPy(BaseBackend):
                     # If sampling we generate all shot samples from the final statevector
                     memory = self._add_sample_measure(measure_sample_ops, self._shots)
                 else:
-                    # Turn classical_memory (int) into bit string and pad zero for unused cmembits
-                    outcome = bin(self._classical_memory)[2:]
-                    memory.append(hex(int(outcome, 2)))
+                    memory.append(self._classical_memory)
 
         # Add data
-        data = {'counts': dict(Counter(memory))}
+        counts, memory = self._format_memory(np.array(memory, dtype=self._memory_dtype()))
+        data = {'counts': counts}
         # Optionally add memory list
         if self._memory:
             data['memory'] = memory
@@ -604,7 +668,7 @@ class QasmSimulatorPy(BaseBackend):
             # Remove empty counts and memory for statevector simulator
             if not data['counts']:
                 data.pop('counts')
-            if 'memory' in data and not data['memory']:
+            if 'memory' in data and len(data['memory']) == 0:
                 data.pop('memory')
         end = time.time()
         return {'name': experiment.header.name,
@@ -109,6 +109,7 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
                 * "chop_threshold": double
+                * "gate_fusion": bool
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
@@ -119,6 +120,10 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             setting small values to zero in the output statevector. The default
             value is 1e-15.
 
+            The "gate_fusion" option specifies whether to fuse the consecutive
+            gates acting on at most two qubits into a single unitary before
+            applying them to the statevector. The default value is True.
+
             Example::
 
                 backend_options = {
@@ -39,6 +39,7 @@ from qiskit.result import Result
 from .exceptions import BasicAerError
 from .basicaertools import single_gate_matrix
 from .basicaertools import cx_gate_matrix
+from .basicaertools import fuse_gates
 from .basicaertools import einsum_matmul_index
 
 logger = logging.getLogger(__name__)
@@ -103,7 +104,8 @@ class UnitarySimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_unitary": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "gate_fusion": True
     }
 
     def __init__(self, configuration=None, provider=None):
@@ -116,6 +118,7 @@ class UnitarySimulatorPy(BaseBackend):
         self._number_of_qubits = 0
         self._initial_unitary = None
         self._chop_threshold = 1e-15
+        self._gate_fusion = True
         self._global_phase = 0
 
     def _add_unitary(self, gate, qubits):
@@ -154,6 +157,7 @@ class UnitarySimulatorPy(BaseBackend):
         # Reset default options
         self._initial_unitary = self.DEFAULT_OPTIONS["initial_unitary"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._gate_fusion = self.DEFAULT_OPTIONS["gate_fusion"]
         if backend_options is None:
             backend_options = {}
 
@@ -184,6 +188,11 @@ class UnitarySimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for custom gate fusion
+        if 'gate_fusion' in backend_options:
+            self._gate_fusion = backend_options['gate_fusion']
+        elif hasattr(qobj_config, 'gate_fusion'):
+            self._gate_fusion = qobj_config.gate_fusion
 
     def _initialize_unitary(self):
         """Set the initial unitary for simulation"""
@@ -221,6 +230,7 @@ class UnitarySimulatorPy(BaseBackend):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_unitary": matrix_like
                 * "chop_threshold": double
+                * "gate_fusion": bool
 
             The "initial_unitary" option specifies a custom initial unitary
             matrix for the simulator to be used instead of the identity
@@ -231,6 +241,10 @@ class UnitarySimulatorPy(BaseBackend):
             setting small values to zero in the output unitary. The default
             value is 1e-15.
 
+            The "gate_fusion" option specifies whether to fuse the consecutive
+            gates acting on at most two qubits into a single unitary before
+            applying them to the unitary matrix. The default value is True.
+
             Example::
 
                 backend_options = {
@@ -311,7 +325,11 @@ class UnitarySimulatorPy(BaseBackend):
         self._validate_initial_unitary()
         self._initialize_unitary()
 
-        for operation in experiment.instructions:
+        instructions = experiment.instructions
+        if self._gate_fusion:
+            instructions = fuse_gates(instructions)
+
+        for operation in instructions:
             if operation.name == 'unitary':
                 qubits = operation.qubits
                 gate = operation.params[0]
@@ -110,15 +110,25 @@ class ParametricPulse(Pulse):
 
         new_parameters = {}
         for op, op_value in self.parameters.items():
-            for parameter, value in value_dict.items():
-                if _is_parameterized(op_value) and parameter in op_value.parameters:
-                    op_value = op_value.assign(parameter, value)
-                    try:
-                        # TODO: ParameterExpression doesn't support complex values
-                        op_value = float(op_value)
-                    except TypeError:
-                        pass
-                new_parameters[op] = op_value
+            if _is_parameterized(op_value) and \
+                    not any(_is_parameterized(value) for value in value_dict.values()):
+                # Bind all the parameters of the expression at once, so that it is
+                # evaluated numerically when it becomes fully bound.
+                binds = {parameter: value for parameter, value in value_dict.items()
+                         if parameter in op_value.parameters}
+                if binds:
+                    op_value = op_value.bind(binds)
+            else:
+                for parameter, value in value_dict.items():
+                    if _is_parameterized(op_value) and parameter in op_value.parameters:
+                        op_value = op_value.assign(parameter, value)
+            if _is_parameterized(op_value) and not op_value.parameters:
+                # TODO: ParameterExpression doesn't support complex values
+                try:
+                    op_value = float(op_value)
+                except TypeError:
+                    pass
+            new_parameters[op] = op_value
         return type(self)(**new_parameters)
 
     def draw(self, dt: float = 1,
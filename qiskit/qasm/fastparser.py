@@ -0,0 +1,361 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Fast OPENQASM front end.
+
+Builds a DAGCircuit directly from the tokens of the common subset of OPENQASM
+2.0 programs: register declarations, ``include "qelib1.inc"``, applications of
+the gates of ``qelib1.inc`` with constant parameters, ``CX``, measurements,
+resets, barriers and ``if`` statements. Programs outside this subset, e.g.
+with gate definitions, and invalid programs are left to the full parser.
+"""
+
+import operator
+import re
+
+import numpy as np
+
+_TOKENS = re.compile(r"""
+    (?P<skip>\s+|//[^\n]*)
+  | (?P<real>(?:[0-9]+|[0-9]*\.[0-9]+|[0-9]+\.)[eE][+-]?[0-9]+|[0-9]*\.[0-9]+|[0-9]+\.)
+  | (?P<int>[0-9]+)
+  | (?P<format>OPENQASM\s+[0-9]+\.[0-9]+)
+  | (?P<id>[a-zA-Z][a-zA-Z0-9_]*)
+  | (?P<string>"[^"]*")
+  | (?P<symbol>->|==|[][(){};,+\-*/^])
+""", re.VERBOSE)
+
+_RESERVED = {'barrier', 'creg', 'gate', 'if', 'measure', 'opaque', 'qreg', 'pi', 'reset',
+             'include'}
+
+# The number of parameters and qubits of the gates of qelib1.inc built as
+# standard gates
+_GATE_SIZES = {
+    'u1': (1, 1), 'u2': (2, 1), 'u3': (3, 1), 'u': (3, 1), 'p': (1, 1),
+    'x': (0, 1), 'y': (0, 1), 'z': (0, 1), 't': (0, 1), 'tdg': (0, 1),
+    's': (0, 1), 'sdg': (0, 1), 'sx': (0, 1), 'sxdg': (0, 1), 'h': (0, 1),
+    'id': (0, 1), 'rx': (1, 1), 'ry': (1, 1), 'rz': (1, 1),
+    'swap': (0, 2), 'rxx': (1, 2), 'rzz': (1, 2), 'cx': (0, 2), 'cy': (0, 2),
+    'cz': (0, 2), 'ch': (0, 2), 'csx': (0, 2), 'crx': (1, 2), 'cry': (1, 2),
+    'crz': (1, 2), 'cu1': (1, 2), 'cp': (1, 2), 'cu': (4, 2), 'cu3': (3, 2),
+    'ccx': (0, 3), 'cswap': (0, 3),
+}
+
+# All the gates declared by qelib1.inc
+_QELIB1_GATES = set(_GATE_SIZES) | {'u0', 'rccx', 'rc3x', 'c3x', 'c3sqrtx', 'c4x'}
+
+_EXTERNAL_FUNCTIONS = {
+    'sin': np.sin,
+    'cos': np.cos,
+    'tan': np.tan,
+    'asin': np.arcsin,
+    'acos': np.arccos,
+    'atan': np.arctan,
+    'exp': np.exp,
+    'ln': np.log,
+    'sqrt': np.sqrt
+}
+
+_BINARY_OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '^': operator.pow
+}
+
+
+class _Unsupported(Exception):
+    """Raised when a program must be handled by the full parser."""
+
+
+def parse_to_dag(data):
+    """Build the DAGCircuit of an OPENQASM 2.0 program without building its AST.
+
+    Args:
+        data (str): the OPENQASM program.
+
+    Returns:
+        DAGCircuit: the DAG of the program, as built by ``ast_to_dag`` from the
+        AST of the program, or None if the program uses features which are
+        left to the full parser (e.g. gate definitions), is invalid or is not
+        a string.
+    """
+    if not isinstance(data, str):
+        return None
+    try:
+        return _DagBuilder(_tokenize(data)).build()
+    except _Unsupported:
+        return None
+
+
+def _tokenize(data):
+    """Return the list of the (kind, value) tokens of a program."""
+    tokens = []
+    position = 0
+    for match in _TOKENS.finditer(data):
+        if match.start() != position:
+            raise _Unsupported()
+        position = match.end()
+        kind = match.lastgroup
+        if kind != 'skip':
+            tokens.append((kind, match.group()))
+    if position != len(data):
+        raise _Unsupported()
+    return tokens
+
+
+class _DagBuilder:
+    """Recursive descent parser of the supported subset of OPENQASM 2.0, adding
+    the operations of the program to a DAGCircuit."""
+
+    def __init__(self, tokens):
+        # pylint: disable=cyclic-import
+        from qiskit.dagcircuit import DAGCircuit
+        self.tokens = tokens
+        self.position = 0
+        self.dag = DAGCircuit()
+        self.qelib1 = False
+        self.condition = None
+
+    def build(self):
+        """Parse the program and return its DAG."""
+        kind, value = self.next()
+        if kind != 'format' or value.split()[1] != '2.0':
+            raise _Unsupported()
+        self.expect(';')
+        while self.position < len(self.tokens):
+            self.statement()
+        return self.dag
+
+    def next(self):
+        """Return the next token and move past it."""
+        if self.position >= len(self.tokens):
+            raise _Unsupported()
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def peek(self):
+        """Return the value of the next token, or None at the end."""
+        if self.position >= len(self.tokens):
+            return None
+        return self.tokens[self.position][1]
+
+    def expect(self, symbol):
+        """Move past the next token, which must be the given symbol."""
+        if self.next() != ('symbol', symbol):
+            raise _Unsupported()
+
+    def integer(self):
+        """Return the value of the next token, which must be an integer."""
+        kind, value = self.next()
+        if kind != 'int' or (len(value) > 1 and value[0] == '0'):
+            raise _Unsupported()
+        return int(value)
+
+    def statement(self):
+        """Parse a statement."""
+        # pylint: disable=cyclic-import
+        from qiskit.circuit import QuantumRegister, ClassicalRegister, Barrier
+        kind, value = self.next()
+        if kind == 'id' and value in ('qreg', 'creg'):
+            name = self.register_name()
+            self.expect('[')
+            size = self.integer()
+            self.expect(']')
+            self.expect(';')
+            if size <= 0:
+                raise _Unsupported()
+            if value == 'qreg':
+                self.dag.add_qreg(QuantumRegister(size, name))
+            else:
+                self.dag.add_creg(ClassicalRegister(size, name))
+        elif (kind, value) == ('id', 'include'):
+            if self.next() != ('string', '"qelib1.inc"') or self.qelib1:
+                raise _Unsupported()
+            self.expect(';')
+            if set(self.dag.qregs).union(self.dag.cregs).intersection(_QELIB1_GATES):
+                raise _Unsupported()
+            self.qelib1 = True
+        elif (kind, value) == ('id', 'barrier'):
+            qubits = [qubit for argument in self.arguments() for qubit in argument]
+            self.expect(';')
+            if len(set(qubits)) != len(qubits):
+                raise _Unsupported()
+            self.dag.apply_operation_back(Barrier(len(qubits)), qubits, [])
+        elif (kind, value) == ('id', 'if'):
+            self.expect('(')
+            kind, name = self.next()
+            if kind != 'id' or name not in self.dag.cregs:
+                raise _Unsupported()
+            self.expect('==')
+            value = self.integer()
+            self.expect(')')
+            if self.peek() in ('barrier', 'if', 'qreg', 'creg', 'include'):
+                raise _Unsupported()
+            self.condition = (self.dag.cregs[name], value)
+            self.statement()
+            self.condition = None
+        else:
+            self.quantum_operation(kind, value)
+
+    def register_name(self):
+        """Return the name of a new register."""
+        kind, name = self.next()
+        if kind != 'id' or not name[0].islower() or name in _RESERVED:
+            raise _Unsupported()
+        if name in self.dag.qregs or name in self.dag.cregs \
+                or (self.qelib1 and name in _QELIB1_GATES):
+            raise _Unsupported()
+        return name
+
+    def quantum_operation(self, kind, name):
+        """Parse the application of a gate, a measurement or a reset."""
+        # pylint: disable=cyclic-import
+        from qiskit.circuit import Measure, Reset
+        from qiskit.circuit.library.standard_gates.x import CXGate
+        from qiskit.converters.ast_to_dag import AstInterpreter
+        if kind != 'id':
+            raise _Unsupported()
+        if name == 'measure':
+            qubits = self.argument(self.dag.qregs)
+            self.expect('->')
+            clbits = self.argument(self.dag.cregs)
+            self.expect(';')
+            if len(qubits) != len(clbits):
+                raise _Unsupported()
+            for qubit, clbit in zip(qubits, clbits):
+                measure = Measure()
+                measure.condition = self.condition
+                self.dag.apply_operation_back(measure, [qubit], [clbit])
+        elif name == 'reset':
+            qubits = self.argument(self.dag.qregs)
+            self.expect(';')
+            for qubit in qubits:
+                reset = Reset()
+                reset.condition = self.condition
+                self.dag.apply_operation_back(reset, [qubit], [])
+        elif name == 'CX':
+            arguments = self.arguments()
+            self.expect(';')
+            if len(arguments) != 2:
+                raise _Unsupported()
+            self.apply_gate(CXGate, [], arguments)
+        elif self.qelib1 and name in _GATE_SIZES:
+            num_params, num_qubits = _GATE_SIZES[name]
+            params = []
+            if self.peek() == '(':
+                self.next()
+                params.append(self.expression())
+                while self.peek() == ',':
+                    self.next()
+                    params.append(self.expression())
+                self.expect(')')
+            arguments = self.arguments()
+            self.expect(';')
+            if len(params) != num_params or len(arguments) != num_qubits:
+                raise _Unsupported()
+            self.apply_gate(AstInterpreter.standard_extension[name], params, arguments)
+        else:
+            raise _Unsupported()
+
+    def apply_gate(self, gate_class, params, arguments):
+        """Apply a gate to its arguments, broadcasting over the registers."""
+        sizes = {len(qubits) for qubits in arguments if len(qubits) > 1}
+        if len(sizes) > 1:
+            raise _Unsupported()
+        for index in range(max(sizes, default=1)):
+            qargs = [qubits[index] if len(qubits) > 1 else qubits[0] for qubits in arguments]
+            if len(set(qargs)) != len(qargs):
+                raise _Unsupported()
+            gate = gate_class(*params)
+            if self.condition is not None:
+                gate = gate.c_if(*self.condition)
+            self.dag.apply_operation_back(gate, qargs, [])
+
+    def arguments(self):
+        """Parse a comma separated list of qubit arguments."""
+        arguments = [self.argument(self.dag.qregs)]
+        while self.peek() == ',':
+            self.next()
+            arguments.append(self.argument(self.dag.qregs))
+        return arguments
+
+    def argument(self, registers):
+        """Parse a register or an indexed bit of one of the registers, and
+        return the list of its bits."""
+        kind, name = self.next()
+        if kind != 'id' or name not in registers:
+            raise _Unsupported()
+        register = registers[name]
+        if self.peek() != '[':
+            return list(register)
+        self.next()
+        index = self.integer()
+        self.expect(']')
+        if index >= register.size:
+            raise _Unsupported()
+        return [register[index]]
+
+    def expression(self):
+        """Parse a sum or difference of terms."""
+        value = self.term()
+        while self.peek() in ('+', '-'):
+            operation = _BINARY_OPERATORS[self.next()[1]]
+            value = operation(value, self.term())
+        return value
+
+    def term(self):
+        """Parse a product or quotient of factors."""
+        value = self.factor()
+        while self.peek() in ('*', '/'):
+            operation = _BINARY_OPERATORS[self.next()[1]]
+            value = operation(value, self.factor())
+        return value
+
+    def factor(self):
+        """Parse a signed power."""
+        if self.peek() == '-':
+            self.next()
+            return -self.factor()
+        if self.peek() == '+':
+            self.next()
+            return +self.factor()
+        value = self.primary()
+        if self.peek() == '^':
+            self.next()
+            value = value ** self.factor()
+        return value
+
+    def primary(self):
+        """Parse a number, pi, a function call or a parenthesized expression."""
+        kind, value = self.next()
+        if kind == 'int':
+            if len(value) > 1 and value[0] == '0':
+                raise _Unsupported()
+            return float(value)
+        if kind == 'real':
+            return float(value)
+        if (kind, value) == ('id', 'pi'):
+            return float(np.pi)
+        if (kind, value) == ('symbol', '('):
+            value = self.expression()
+            self.expect(')')
+            return value
+        if kind == 'id' and value in _EXTERNAL_FUNCTIONS:
+            self.expect('(')
+            argument = self.expression()
+            self.expect(')')
+            return _EXTERNAL_FUNCTIONS[value](argument)
+        raise _Unsupported()
@@ -15,6 +15,7 @@ OPENQASM circuit object.
 """
 from .exceptions import QasmError
 from .qasmparser import QasmParser
+from .fastparser import parse_to_dag
 
 
 class Qasm:
@@ -52,3 +53,20 @@ class Qasm:
         with QasmParser(self._filename) as qasm_p:
             qasm_p.parse_debug(False)
             return qasm_p.parse(self._data)
+
+    def parse_to_dag(self):
+        """Build the DAGCircuit of the program directly from its tokens.
+
+        This skips the parser and the AST for the programs which only declare
+        registers, include ``qelib1.inc`` and apply its gates, measurements,
+        resets, barriers and ``if`` statements.
+
+        Returns:
+            DAGCircuit: the DAG of the program, or None if the program must be
+            handled by :meth:`parse` and ``ast_to_dag``.
+        """
+        if self._filename:
+            with open(self._filename) as ifile:
+                self._data = ifile.read()
+
+        return parse_to_dag(self._data)
@@ -13,16 +13,22 @@
 """OpenQASM parser."""
 
 import os
+import pickle
 import shutil
 import tempfile
 
 import numpy as np
 import ply.yacc as yacc
 
+from qiskit.version import __version__
 from . import node
 from .exceptions import QasmError
 from .qasmlexer import QasmLexer
 
+# The LALR tables of the parser are computed once for each version of Qiskit,
+# and stored in this directory to be read back by the next parsers.
+PARSER_TABLES_DIR = os.path.join(os.path.expanduser("~"), ".qiskit", "qasm")
+
 
 class QasmParser:
     """OPENQASM Parser."""
@@ -35,15 +41,13 @@ class QasmParser:
             filename = ""
         self.lexer = QasmLexer(filename)
         self.tokens = self.lexer.tokens
-        self.parse_dir = tempfile.mkdtemp(prefix='qiskit')
+        self.parse_dir = None
         self.precedence = (
             ('left', '+', '-'),
             ('left', '*', '/'),
             ('left', 'negative', 'positive'),
             ('right', '^'))
-        # For yacc, also, write_tables = Bool and optimize = Bool
-        self.parser = yacc.yacc(module=self, debug=False,
-                                outputdir=self.parse_dir)
+        self.parser = self._build_parser()
         self.qasm = None
         self.parse_deb = False
         self.global_symtab = {}                          # global symtab
@@ -56,9 +60,49 @@ class QasmParser:
         return self
 
     def __exit__(self, *args):
-        if os.path.exists(self.parse_dir):
+        if self.parse_dir is not None and os.path.exists(self.parse_dir):
             shutil.rmtree(self.parse_dir)
 
+    def _build_parser(self):
+        """Build the PLY parser, reading its tables from the cache if possible."""
+        tables_file = _parser_tables_file()
+        if tables_file is None:
+            # For yacc, also, write_tables = Bool and optimize = Bool
+            self.parse_dir = tempfile.mkdtemp(prefix='qiskit')
+            return yacc.yacc(module=self, debug=False, outputdir=self.parse_dir)
+        if os.path.exists(tables_file):
+            try:
+                return yacc.yacc(module=self, debug=False, write_tables=False,
+                                 picklefile=tables_file)
+            except (pickle.UnpicklingError, EOFError, OSError):
+                # The tables file is corrupted: remove it, so that the tables
+                # are computed and written again.
+                _remove_file(tables_file)
+        return self._build_parser_tables(tables_file)
+
+    def _build_parser_tables(self, tables_file):
+        """Build the PLY parser from scratch, and store its tables in ``tables_file``.
+
+        The tables are written to a temporary file of the same directory, which
+        then replaces ``tables_file``, so that a partially written tables file is
+        never read by another parser.
+        """
+        try:
+            handle, tmp_file = tempfile.mkstemp(dir=os.path.dirname(tables_file),
+                                                suffix='.tmp')
+            os.close(handle)
+            # PLY only computes the tables if the pickle file does not exist.
+            os.remove(tmp_file)
+        except OSError:
+            return yacc.yacc(module=self, debug=False, write_tables=False)
+        parser = yacc.yacc(module=self, debug=False, write_tables=False, picklefile=tmp_file)
+        try:
+            os.replace(tmp_file, tables_file)
+        except OSError:
+            # The tables could not be stored: they are computed again by the next parser.
+            _remove_file(tmp_file)
+        return parser
+
     def update_symtab(self, obj):
         """Update a node in the symbol table.
 
@@ -1088,3 +1132,23 @@ class QasmParser:
         ast = self.parser.parse(data, debug=True)
         self.parser.parse(data, debug=True)
         ast.to_string(0)
+
+
+def _remove_file(path):
+    """Remove the file ``path``, if it exists and can be removed."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _parser_tables_file():
+    """Return the file storing the tables of the parser for this version of
+    Qiskit, or None if the tables directory cannot be written to."""
+    try:
+        os.makedirs(PARSER_TABLES_DIR, exist_ok=True)
+    except OSError:
+        return None
+    if not os.access(PARSER_TABLES_DIR, os.W_OK):
+        return None
+    return os.path.join(PARSER_TABLES_DIR, "parsetab-{}.pickle".format(__version__))
@@ -15,16 +15,15 @@
 Decompose a single-qubit unitary via Euler angles.
 """
 
-import math
 import numpy as np
-import scipy.linalg as la
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.library.standard_gates import (PhaseGate, U3Gate,
                                                    U1Gate, RXGate, RYGate,
                                                    RZGate, RGate, SXGate)
 from qiskit.exceptions import QiskitError
-from qiskit.quantum_info.operators.predicates import is_unitary_matrix
+from qiskit.quantum_info.operators.predicates import (is_unitary_matrix,
+                                                      ATOL_DEFAULT, RTOL_DEFAULT)
 
 DEFAULT_ATOL = 1e-12
 
@@ -131,6 +130,39 @@ class OneQubitEulerDecomposer:
                                 atol=atol)
         return circuit
 
+    def decompose_batch(self,
+                        unitaries,
+                        simplify=True,
+                        atol=DEFAULT_ATOL):
+        """Decompose a stack of single qubit gates into circuits.
+
+        The Euler angles of all the unitaries are computed at once.
+
+        Args:
+            unitaries (list or ndarray): 1-qubit unitary matrices, or an array
+                of shape ``(N, 2, 2)``.
+            simplify (bool): reduce gate count in decomposition [Default: True].
+            atol (bool): absolute tolerance for checking angles when simplifing
+                         returnd circuit [Default: 1e-12].
+
+        Returns:
+            list[QuantumCircuit]: the decomposed single-qubit gate circuits
+
+        Raises:
+            QiskitError: if input is invalid or synthesis fails.
+        """
+        unitaries = np.asarray(unitaries, dtype=complex)
+        if unitaries.ndim != 3 or unitaries.shape[1:] != (2, 2):
+            raise QiskitError("OneQubitEulerDecomposer: "
+                              "expected a stack of 2x2 input matrices")
+        products = np.matmul(unitaries.conj().transpose(0, 2, 1), unitaries)
+        if not np.allclose(products, np.eye(2), rtol=RTOL_DEFAULT, atol=ATOL_DEFAULT):
+            raise QiskitError("OneQubitEulerDecomposer: "
+                              "input matrix is not unitary.")
+        thetas, phis, lams, _ = self._params(unitaries)
+        return [self._circuit(theta, phi, lam, simplify=simplify, atol=atol)
+                for theta, phi, lam in zip(thetas, phis, lams)]
+
     @property
     def basis(self):
         """The decomposition basis."""
@@ -158,10 +190,11 @@ class OneQubitEulerDecomposer:
         """Return the Euler angles for input array.
 
         Args:
-            unitary (np.ndarray): 2x2 unitary matrix.
+            unitary (np.ndarray): 2x2 unitary matrix, or a stack of them of
+                shape ``(N, 2, 2)``.
 
         Returns:
-            tuple: (theta, phi, lambda).
+            tuple: (theta, phi, lambda), arrays of length ``N`` for a stack.
         """
         theta, phi, lam, _ = self._params(unitary)
         return theta, phi, lam
@@ -170,29 +203,34 @@ class OneQubitEulerDecomposer:
         """Return the Euler angles and phase for input array.
 
         Args:
-            unitary (np.ndarray): 2x2 unitary matrix.
+            unitary (np.ndarray): 2x2 unitary matrix, or a stack of them of
+                shape ``(N, 2, 2)``.
 
         Returns:
-            tuple: (theta, phi, lambda, phase).
+            tuple: (theta, phi, lambda, phase), arrays of length ``N`` for a
+            stack.
         """
         return self._params(unitary)
 
     @staticmethod
     def _params_zyz(mat):
         """Return the euler angles and phase for the ZYZ basis."""
+        # An np.matrix input would turn the broadcast product below into a
+        # matrix product
+        mat = np.asarray(mat, dtype=complex)
         # We rescale the input matrix to be special unitary (det(U) = 1)
         # This ensures that the quaternion representation is real
-        coeff = la.det(mat)**(-0.5)
+        coeff = np.linalg.det(mat)**(-0.5)
         phase = -np.angle(coeff)
-        su_mat = coeff * mat  # U in SU(2)
+        su_mat = coeff[..., np.newaxis, np.newaxis] * mat  # U in SU(2)
         # OpenQASM SU(2) parameterization:
         # U[0, 0] = exp(-i(phi+lambda)/2) * cos(theta/2)
         # U[0, 1] = -exp(-i(phi-lambda)/2) * sin(theta/2)
         # U[1, 0] = exp(i(phi-lambda)/2) * sin(theta/2)
         # U[1, 1] = exp(i(phi+lambda)/2) * cos(theta/2)
-        theta = 2 * math.atan2(abs(su_mat[1, 0]), abs(su_mat[0, 0]))
-        phiplambda = 2 * np.angle(su_mat[1, 1])
-        phimlambda = 2 * np.angle(su_mat[1, 0])
+        theta = 2 * np.arctan2(np.abs(su_mat[..., 1, 0]), np.abs(su_mat[..., 0, 0]))
+        phiplambda = 2 * np.angle(su_mat[..., 1, 1])
+        phimlambda = 2 * np.angle(su_mat[..., 1, 0])
         phi = (phiplambda + phimlambda) / 2.0
         lam = (phiplambda - phimlambda) / 2.0
         return theta, phi, lam, phase
@@ -208,16 +246,13 @@ class OneQubitEulerDecomposer:
         """Return the euler angles and phase for the XYX basis."""
         # We use the fact that
         # Rx(a).Ry(b).Rx(c) = H.Rz(a).Ry(-b).Rz(c).H
-        mat_zyz = 0.5 * np.array(
-            [[
-                mat[0, 0] + mat[0, 1] + mat[1, 0] + mat[1, 1],
-                mat[0, 0] - mat[0, 1] + mat[1, 0] - mat[1, 1]
-            ],
-             [
-                 mat[0, 0] + mat[0, 1] - mat[1, 0] - mat[1, 1],
-                 mat[0, 0] - mat[0, 1] - mat[1, 0] + mat[1, 1]
-             ]],
-            dtype=complex)
+        mat = np.asarray(mat, dtype=complex)
+        m00, m01 = mat[..., 0, 0], mat[..., 0, 1]
+        m10, m11 = mat[..., 1, 0], mat[..., 1, 1]
+        mat_zyz = 0.5 * np.stack(
+            [np.stack([m00 + m01 + m10 + m11, m00 - m01 + m10 - m11], axis=-1),
+             np.stack([m00 + m01 - m10 - m11, m00 - m01 - m10 + m11], axis=-1)],
+            axis=-2)
         theta, phi, lam, phase = OneQubitEulerDecomposer._params_zyz(mat_zyz)
         return -theta, phi, lam, phase
 
@@ -25,6 +25,7 @@ arXiv:1811.12926 [quant-ph] (2018).
 """
 import math
 import warnings
+from collections import OrderedDict
 
 import numpy as np
 import scipy.linalg as la
@@ -35,11 +36,14 @@ from qiskit.circuit.library.standard_gates.x import CXGate
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators import Operator
 from qiskit.quantum_info.operators.predicates import is_unitary_matrix
-from qiskit.quantum_info.synthesis.weyl import weyl_coordinates
+from qiskit.quantum_info.synthesis.weyl import weyl_coordinates, weyl_coordinates_batch
 from qiskit.quantum_info.synthesis.one_qubit_decompose import OneQubitEulerDecomposer
 
 _CUTOFF_PRECISION = 1e-12
 
+# the number of decompositions kept by each TwoQubitBasisDecomposer
+_MAX_DECOMPOSITIONS = 1024
+
 
 def euler_angles_1q(unitary_matrix):
     """DEPRECATED: Compute Euler angles for a single-qubit gate.
@@ -293,6 +297,8 @@ class TwoQubitBasisDecomposer():
     def __init__(self, gate, basis_fidelity=1.0, euler_basis=None):
         self.gate = gate
         self.basis_fidelity = basis_fidelity
+        # the decompositions of the last targets, keyed on the rounded target matrix
+        self._decompositions = OrderedDict()
 
         basis = self.basis = TwoQubitWeylDecomposition(Operator(gate).data)
         if euler_basis is not None:
@@ -473,6 +479,12 @@ class TwoQubitBasisDecomposer():
         if not is_unitary_matrix(target):
             raise QiskitError("TwoQubitBasisDecomposer: target matrix is not unitary.")
 
+        # repeated targets are decomposed once
+        key = ((np.round(target, 12) + 0.).tobytes(), basis_fidelity)
+        if key in self._decompositions:
+            self._decompositions.move_to_end(key)
+            return self._decompositions[key].copy()
+
         target_decomposed = TwoQubitWeylDecomposition(target)
         traces = self.traces(target_decomposed)
         expected_fidelities = [trace_to_fid(traces[i]) * basis_fidelity**i for i in range(4)]
@@ -490,7 +502,26 @@ class TwoQubitBasisDecomposer():
         return_circuit.compose(decomposition_euler[2*best_nbasis], [q[0]], inplace=True)
         return_circuit.compose(decomposition_euler[2*best_nbasis+1], [q[1]], inplace=True)
 
-        return return_circuit
+        self._decompositions[key] = return_circuit
+        if len(self._decompositions) > _MAX_DECOMPOSITIONS:
+            self._decompositions.popitem(last=False)
+        return return_circuit.copy()
+
+    def decompose_batch(self, targets, basis_fidelity=None):
+        """Decompose a list of two-qubit unitaries, see :meth:`__call__`.
+
+        Targets which are equal up to rounding are decomposed once.
+
+        Args:
+            targets (list or ndarray): two-qubit unitaries, or an array of
+                shape ``(N, 4, 4)``.
+            basis_fidelity (float): fidelity to be assumed for applications
+                of the basis gate.
+
+        Returns:
+            list[QuantumCircuit]: the decompositions of the targets.
+        """
+        return [self(target, basis_fidelity) for target in targets]
 
     def num_basis_gates(self, unitary):
         """ Computes the number of basis gates needed in
@@ -501,13 +532,34 @@ class TwoQubitBasisDecomposer():
         if hasattr(unitary, 'to_matrix'):
             unitary = unitary.to_matrix()
         unitary = np.asarray(unitary, dtype=complex)
-        a, b, c = weyl_coordinates(unitary)[:]
-        traces = [4*(np.cos(a)*np.cos(b)*np.cos(c)+1j*np.sin(a)*np.sin(b)*np.sin(c)),
-                  4*(np.cos(np.pi/4-a)*np.cos(self.basis.b-b)*np.cos(c) +
-                     1j*np.sin(np.pi/4-a)*np.sin(self.basis.b-b)*np.sin(c)),
-                  4*np.cos(c),
-                  4]
-        return np.argmax([trace_to_fid(traces[i]) * self.basis_fidelity**i for i in range(4)])
+        return self._num_basis_gates(weyl_coordinates(unitary))
+
+    def num_basis_gates_batch(self, unitaries):
+        """Computes the number of basis gates needed in
+        the decompositions of a stack of unitaries.
+
+        Args:
+            unitaries (list or ndarray): two-qubit unitaries, or an array of
+                shape ``(N, 4, 4)``.
+
+        Returns:
+            ndarray: the number of basis gates for each unitary.
+        """
+        unitaries = np.asarray(unitaries, dtype=complex).reshape(-1, 4, 4)
+        if not unitaries.size:
+            return np.zeros(0, dtype=int)
+        return self._num_basis_gates(weyl_coordinates_batch(unitaries))
+
+    def _num_basis_gates(self, coordinates):
+        """Computes the number of basis gates from the Weyl coordinates of one
+        unitary, or of a stack of unitaries along the first axis."""
+        a, b, c = coordinates[..., 0], coordinates[..., 1], coordinates[..., 2]
+        traces = np.stack([4*(np.cos(a)*np.cos(b)*np.cos(c)+1j*np.sin(a)*np.sin(b)*np.sin(c)),
+                           4*(np.cos(np.pi/4-a)*np.cos(self.basis.b-b)*np.cos(c) +
+                              1j*np.sin(np.pi/4-a)*np.sin(self.basis.b-b)*np.sin(c)),
+                           4*np.cos(c) + 0j,
+                           np.full(np.shape(a), 4, dtype=complex)], axis=-1)
+        return np.argmax(trace_to_fid(traces) * self.basis_fidelity**np.arange(4), axis=-1)
 
 
 two_qubit_cnot_decompose = TwoQubitBasisDecomposer(CXGate())
@@ -15,7 +15,6 @@
 """
 
 import numpy as np
-import scipy.linalg as la
 from qiskit.exceptions import QiskitError
 
 _B = (1.0/np.sqrt(2)) * np.array([[1, 1j, 0, 0],
@@ -35,59 +34,78 @@ def weyl_coordinates(U):
     Returns:
         ndarray: Array of Weyl coordinates.
 
+    Raises:
+        QiskitError: Computed coordinates not in Weyl chamber.
+    """
+    return weyl_coordinates_batch(np.asarray(U)[np.newaxis])[0]
+
+
+def weyl_coordinates_batch(unitaries):
+    """Computes the Weyl coordinates for
+    a stack of two-qubit unitary matrices.
+
+    Args:
+        unitaries (ndarray): Input two-qubit unitaries, of shape ``(N, 4, 4)``.
+
+    Returns:
+        ndarray: Array of Weyl coordinates, of shape ``(N, 3)``.
+
     Raises:
         QiskitError: Computed coordinates not in Weyl chamber.
     """
     pi2 = np.pi/2
     pi4 = np.pi/4
 
-    U = U / la.det(U)**(0.25)
-    Up = _Bd.dot(U).dot(_B)
-    M2 = Up.T.dot(Up)
+    U = np.asarray(unitaries, dtype=complex).reshape(-1, 4, 4)
+    U = U / (np.linalg.det(U)**(0.25))[:, np.newaxis, np.newaxis]
+    Up = np.matmul(np.matmul(_Bd, U), _B)
+    M2 = np.matmul(Up.transpose(0, 2, 1), Up)
 
     # M2 is a symmetric complex matrix. We need to decompose it as M2 = P D P^T where
     # P ∈ SO(4), D is diagonal with unit-magnitude elements.
     # D, P = la.eig(M2)  # this can fail for certain kinds of degeneracy
+    D = np.empty((len(M2), 4), dtype=complex)
+    todo = np.arange(len(M2))
     for _ in range(3):  # FIXME: this randomized algorithm is horrendous
-        M2real = np.random.normal()*M2.real + np.random.normal()*M2.imag
-        _, P = la.eigh(M2real)
-        D = P.T.dot(M2).dot(P).diagonal()
-        if np.allclose(P.dot(np.diag(D)).dot(P.T), M2, rtol=1.0e-10, atol=1.0e-10):
+        if not todo.size:
             break
-    else:
+        M2todo = M2[todo]
+        M2real = np.random.normal()*M2todo.real + np.random.normal()*M2todo.imag
+        _, P = np.linalg.eigh(M2real)
+        Dtodo = np.einsum('nji,njk,nki->ni', P, M2todo, P)
+        PDPt = np.einsum('nij,nj,nkj->nik', P, Dtodo, P)
+        done = np.all(np.isclose(PDPt, M2todo, rtol=1.0e-10, atol=1.0e-10), axis=(1, 2))
+        D[todo[done]] = Dtodo[done]
+        todo = todo[~done]
+    if todo.size:
         raise QiskitError("TwoQubitWeylDecomposition: failed to diagonalize M2. "
                           "Please submit this output to "
                           "https://github.com/Qiskit/qiskit-terra/issues/4159 "
-                          "Input %s" % U.tolist())
+                          "Input %s" % U[todo].tolist())
 
     d = -np.angle(D)/2
-    d[3] = -d[0]-d[1]-d[2]
-    cs = np.mod((d[:3]+d[3])/2, 2*np.pi)
+    d[:, 3] = -d[:, 0]-d[:, 1]-d[:, 2]
+    cs = np.mod((d[:, :3]+d[:, 3:])/2, 2*np.pi)
 
     # Reorder the eigenvalues to get in the Weyl chamber
     cstemp = np.mod(cs, pi2)
     np.minimum(cstemp, pi2-cstemp, cstemp)
-    order = np.argsort(cstemp)[[1, 2, 0]]
-    cs = cs[order]
-    d[:3] = d[order]
+    order = np.argsort(cstemp, axis=1)[:, [1, 2, 0]]
+    cs = np.take_along_axis(cs, order, axis=1)
 
     # Flip into Weyl chamber
-    if cs[0] > pi2:
-        cs[0] -= 3*pi2
-    if cs[1] > pi2:
-        cs[1] -= 3*pi2
-    conjs = 0
-    if cs[0] > pi4:
-        cs[0] = pi2-cs[0]
-        conjs += 1
-    if cs[1] > pi4:
-        cs[1] = pi2-cs[1]
-        conjs += 1
-    if cs[2] > pi2:
-        cs[2] -= 3*pi2
-    if conjs == 1:
-        cs[2] = pi2-cs[2]
-    if cs[2] > pi4:
-        cs[2] -= pi2
-
-    return cs[[1, 0, 2]]
+    cs[cs[:, 0] > pi2, 0] -= 3*pi2
+    cs[cs[:, 1] > pi2, 1] -= 3*pi2
+    conjs = np.zeros(len(cs), dtype=int)
+    flip = cs[:, 0] > pi4
+    cs[flip, 0] = pi2-cs[flip, 0]
+    conjs += flip
+    flip = cs[:, 1] > pi4
+    cs[flip, 1] = pi2-cs[flip, 1]
+    conjs += flip
+    cs[cs[:, 2] > pi2, 2] -= 3*pi2
+    flip = conjs == 1
+    cs[flip, 2] = pi2-cs[flip, 2]
+    cs[cs[:, 2] > pi4, 2] -= pi2
+
+    return cs[:, [1, 0, 2]]
@@ -180,3 +180,28 @@ class Counts(dict):
                 int_key = int(bitstring.replace(" ", ""), 2)
                 out_dict[int_key] = value
             return out_dict
+
+    def marginal(self, indices):
+        """Return the counts marginalized over the bits at some indices
+
+        Args:
+            indices (list(int)): the indices of the bits to keep, the least
+                significant bit being at index 0.
+
+        Returns:
+            Counts: the counts of the outcomes of the bits at ``indices``, in
+                increasing order from the least significant bit.
+        Raises:
+            QiskitError: If an index is out of range or the Counts object
+                contains counts for dit strings
+        """
+        num_clbits = self.memory_slots or max(
+            (len(bitstring.replace(" ", "")) for bitstring in self), default=0)
+        if not set(indices).issubset(range(num_clbits)):
+            raise exceptions.QiskitError(
+                'indices must be in range [0, {}].'.format(num_clbits - 1))
+        int_counts = self.int_outcomes()
+        indices = sorted(indices)
+        marginal = postprocess._marginalize_outcomes(list(int_counts),
+                                                     list(int_counts.values()), indices)
+        return Counts(marginal, time_taken=self.time_taken, memory_slots=len(indices))
@@ -43,16 +43,66 @@ def _separate_bitstring(bitstring, creg_sizes):
     return ' '.join(substrings)
 
 
+def _marginalize_outcomes(outcomes, values, indices):
+    """Marginalize integer outcomes over the bits at some indices.
+
+    Bit ``k`` of the marginal outcome of an outcome is its bit ``indices[k]``.
+    The bits are gathered by runs of consecutive indices, with NumPy when the
+    outcomes fit in 64 bits, and the values of equal marginal outcomes summed.
+
+    Args:
+        outcomes (list[int]): the outcomes.
+        values (list): the counts of the outcomes.
+        indices (list[int]): the indices of the bits to keep, in increasing order.
+
+    Returns:
+        dict: the nonzero sums of the counts of the marginal outcomes, sorted by
+        marginal outcome.
+    """
+    # (source index, length, target index) of the runs of consecutive indices
+    runs = []
+    for target, index in enumerate(indices):
+        if runs and index == runs[-1][0] + runs[-1][1]:
+            runs[-1][1] += 1
+        else:
+            runs.append([index, 1, target])
+
+    if not outcomes:
+        return {}
+    if max(outcomes).bit_length() <= 64:
+        keys = np.array(outcomes, dtype=np.uint64)
+        marginal = np.zeros(len(keys), dtype=np.uint64)
+        for source, length, target in runs:
+            mask = np.uint64((1 << length) - 1)
+            marginal |= ((keys >> np.uint64(source)) & mask) << np.uint64(target)
+        order = np.argsort(marginal, kind='stable')
+        marginal = marginal[order]
+        starts = np.flatnonzero(np.concatenate(([True], marginal[1:] != marginal[:-1])))
+        totals = np.add.reduceat(np.asarray(values)[order], starts)
+        return {outcome: total
+                for outcome, total in zip(marginal[starts].tolist(), totals.tolist())
+                if total != 0}
+
+    # Outcomes of more than 64 bits are gathered as Python integers
+    totals = {}
+    for outcome, value in zip(outcomes, values):
+        marginal = 0
+        for source, length, target in runs:
+            marginal |= ((outcome >> source) & ((1 << length) - 1)) << target
+        totals[marginal] = totals.get(marginal, 0) + value
+    return {outcome: totals[outcome] for outcome in sorted(totals) if totals[outcome] != 0}
+
+
 def format_counts_memory(shot_memory, header=None):
     """
     Format a single bitstring (memory) from a single shot experiment.
 
-    - The hexadecimals are expanded to bitstrings
+    - The hexadecimals and integers are expanded to bitstrings
 
     - Spaces are inserted at register divisions.
 
     Args:
-        shot_memory (str): result of a single experiment.
+        shot_memory (str or int): result of a single experiment.
         header (dict): the experiment header dictionary containing
             useful information for postprocessing. creg_sizes
             are a nested list where the inner element is a list
@@ -62,7 +112,9 @@ def format_counts_memory(shot_memory, header=None):
     Returns:
         dict: a formatted memory
     """
-    if shot_memory.startswith('0x'):
+    if not isinstance(shot_memory, str):
+        shot_memory = bin(int(shot_memory))[2:]
+    elif shot_memory.startswith('0x'):
         shot_memory = _hex_to_bin(shot_memory)
     if header:
         creg_sizes = header.get('creg_sizes', None)
@@ -12,13 +12,12 @@
 
 """Utility functions for working with Results."""
 
-from functools import reduce
-from re import match
-from copy import deepcopy
+import copy
 
 from qiskit.exceptions import QiskitError
+from qiskit.result.counts import Counts
 from qiskit.result.result import Result
-from qiskit.result.postprocess import _bin_to_hex
+from qiskit.result.postprocess import _bin_to_hex, _marginalize_outcomes
 
 
 def marginal_counts(result, indices=None, inplace=False):
@@ -42,15 +41,25 @@ def marginal_counts(result, indices=None, inplace=False):
     """
     if isinstance(result, Result):
         if not inplace:
-            result = deepcopy(result)
-        for i, experiment_result in enumerate(result.results):
-            counts = result.get_counts(i)
-            new_counts = _marginalize(counts, indices)
-            new_counts_hex = {}
-            for k, v in new_counts.items():
-                new_counts_hex[_bin_to_hex(k)] = v
-            experiment_result.data.counts = new_counts_hex
-            experiment_result.header.memory_slots = len(indices)
+            # Only the counts and the headers of the experiments are replaced,
+            # the rest of the result is shared with the original one
+            result = copy.copy(result)
+            result.results = [copy.copy(experiment_result)
+                              for experiment_result in result.results]
+            for experiment_result in result.results:
+                experiment_result.data = copy.copy(experiment_result.data)
+                if hasattr(experiment_result, 'header'):
+                    experiment_result.header = copy.copy(experiment_result.header)
+        if indices is not None:
+            for i, experiment_result in enumerate(result.results):
+                counts = result.get_counts(i)
+                if isinstance(counts, Counts):
+                    new_counts_hex = counts.marginal(indices).hex_raw
+                else:
+                    new_counts_hex = {_bin_to_hex(k): v
+                                      for k, v in _marginalize(counts, indices).items()}
+                experiment_result.data.counts = new_counts_hex
+                experiment_result.header.memory_slots = len(indices)
     else:
         result = _marginalize(result, indices)
 
@@ -80,34 +89,23 @@ def _marginalize(counts, indices=None):
     if not set(indices).issubset(set(range(num_clbits))):
         raise QiskitError('indices must be in range [0, {}].'.format(num_clbits-1))
 
-    # Sort the indices to keep in decending order
-    # Since bitstrings have qubit-0 as least significant bit
-    indices = sorted(indices, reverse=True)
-
-    # Generate bitstring keys for indices to keep
-    meas_keys = count_keys(len(indices))
-
-    # Get regex match strings for suming outcomes of other qubits
-    rgx = []
-    for key in meas_keys:
-        def _helper(x, y):
-            if y in indices:
-                return key[indices.index(y)] + x
-            return '\\d' + x
-        rgx.append(reduce(_helper, range(num_clbits), ''))
-
-    # Build the return list
-    meas_counts = []
-    for m in rgx:
-        c = 0
-        for key, val in counts.items():
-            if match(m, key.replace(' ', '')):
-                c += val
-        meas_counts.append(c)
-
-    # Return as counts dict on desired indices only
-    ret = {}
-    for key, val in zip(meas_keys, meas_counts):
-        if val != 0:
-            ret[key] = val
-    return ret
+    # Sort the indices to keep in ascending order, bit k of the marginal
+    # outcomes being bit indices[k] of the outcomes, since bitstrings have
+    # qubit-0 as least significant bit
+    indices = sorted(indices)
+    keys = [key.replace(' ', '') for key in counts]
+    values = list(counts.values())
+
+    try:
+        outcomes = [int(key, 2) for key in keys]
+    except ValueError:
+        # Dit strings are marginalized as strings
+        totals = {}
+        for key, val in zip(keys, values):
+            key = ''.join(key[-1 - index] for index in reversed(indices))
+            totals[key] = totals.get(key, 0) + val
+        return {key: totals[key] for key in sorted(totals) if totals[key] != 0}
+
+    key_format = '0{}b'.format(len(indices))
+    return {format(outcome, key_format): val
+            for outcome, val in _marginalize_outcomes(outcomes, values, indices).items()}
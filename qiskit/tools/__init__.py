@@ -24,6 +24,8 @@ Parallel Routines
    :toctree: ../stubs/
 
    parallel_map
+   parallel_imap
+   ParallelPool
 
 Monitoring
 ==========
@@ -37,5 +39,5 @@ Monitoring
 
 """
 
-from .parallel import parallel_map
+from .parallel import parallel_map, parallel_imap, ParallelPool
 from .monitor import (job_monitor, backend_monitor, backend_overview)
@@ -50,7 +50,12 @@ from the multiprocessing library.
 
 import os
 import platform
+import hashlib
+from collections import OrderedDict
 from concurrent.futures import ProcessPoolExecutor
+
+import dill
+
 from qiskit.exceptions import QiskitError
 from qiskit.util import local_hardware_info
 from qiskit.tools.events.pubsub import Publisher
@@ -62,14 +67,317 @@ if os.getenv('QISKIT_IN_PARALLEL') is None:
 # Number of local physical cpus
 CPU_COUNT = local_hardware_info()['cpus']
 
+# Stack of the ``ParallelPool`` instances currently entered as context managers.
+_ACTIVE_POOLS = []
+
+# Objects preloaded inside a worker process of a ``ParallelPool``.
+_WORKER_STATE = {}
+
+# Objects lazily deserialized by ``worker_cached_loads``, least recently used first.
+_WORKER_CACHE = OrderedDict()
+
+# Maximum number of entries kept in ``_WORKER_CACHE``.
+_WORKER_CACHE_SIZE = 4
+
+# Number of instructions a chunk of circuits should roughly hold for the inter-process
+# round trip of the chunk to be negligible compared to the work done on it.
+CHUNK_TARGET_SIZE = 2000
+
+# Minimum number of chunks per worker process, to keep the load balanced.
+_CHUNKS_PER_PROCESS = 4
+
+
+class _SerializedCircuit:
+    """A circuit sent to or from a worker process in the QPY format, which is
+    smaller and faster to load than the pickle of the circuit."""
+
+    __slots__ = ('data',)
+
+    def __init__(self, circuit):
+        from qiskit.circuit import qpy_serialization
+
+        self.data = qpy_serialization.dumps(circuit)
+
+    def circuit(self):
+        """Return the serialized circuit."""
+        from qiskit.circuit import qpy_serialization
+
+        return qpy_serialization.loads(self.data)[0]
+
+
+def _serialize_circuits(obj):
+    """Replace the circuits of a value or result, or of a tuple, by their QPY serialization."""
+    from qiskit.circuit import QuantumCircuit
+
+    if isinstance(obj, QuantumCircuit):
+        return _SerializedCircuit(obj)
+    if type(obj) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return tuple(_SerializedCircuit(item) if isinstance(item, QuantumCircuit) else item
+                     for item in obj)
+    return obj
+
+
+def _deserialize_circuits(obj):
+    """Inverse of :func:`_serialize_circuits`."""
+    if isinstance(obj, _SerializedCircuit):
+        return obj.circuit()
+    if type(obj) is tuple:  # pylint: disable=unidiomatic-typecheck
+        return tuple(item.circuit() if isinstance(item, _SerializedCircuit) else item
+                     for item in obj)
+    return obj
+
 
 def _task_wrapper(param):
     (task, value, task_args, task_kwargs) = param
-    return task(value, *task_args, **task_kwargs)
+    result = task(_deserialize_circuits(value), *task_args, **task_kwargs)
+    return _serialize_circuits(result)
+
+
+def _set_parallel_flag():
+    os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+
+
+def _value_size(value):
+    """Estimate the amount of work for a value of ``parallel_map`` from its circuit size."""
+    from qiskit.circuit import QuantumCircuit
+
+    if isinstance(value, tuple) and value:
+        value = value[0]
+    if isinstance(value, QuantumCircuit):
+        return max(1, len(value.data))
+    return None
+
+
+def _chunk_size(values, num_processes):
+    """Choose the number of values sent at once to a worker process.
+
+    Small circuits are grouped so that a chunk holds about ``CHUNK_TARGET_SIZE``
+    instructions, while keeping at least a few chunks per process. Values that
+    are not circuits are sent one at a time.
+    """
+    sizes = [_value_size(value) for value in values]
+    if None in sizes:
+        return 1
+    max_chunk = max(1, len(values) // (_CHUNKS_PER_PROCESS * num_processes))
+    mean_size = sum(sizes) / len(sizes)
+    return int(min(max(1, CHUNK_TARGET_SIZE // mean_size), max_chunk))
+
+
+def _pool_initializer(preloaded):
+    """Initializer run once in every worker process of a ``ParallelPool``."""
+    os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+    # Importing qiskit here pays the import cost once per worker, instead of
+    # on the first task sent to it when the workers are spawned.
+    import qiskit  # pylint: disable=unused-import
+
+    _WORKER_STATE.clear()
+    _WORKER_CACHE.clear()
+    for key, payload in preloaded.items():
+        _WORKER_STATE[key] = dill.loads(payload)
+
+
+def _pool_warm_up(_):
+    return os.getpid()
+
+
+def _schedule_state(pass_manager):
+    return pass_manager._schedule_version, pass_manager.max_iteration
+
+
+def worker_cached_loads(payload):
+    """Deserialize a ``dill`` payload, caching the result in the current worker.
+
+    Inside a worker of a :class:`ParallelPool` the last few distinct payloads
+    are kept deserialized, so a payload sent repeatedly to the same worker is
+    only deserialized once. Outside of a pool this is equivalent to
+    ``dill.loads(payload)``.
+
+    Args:
+        payload (bytes): the serialized object.
+
+    Returns:
+        object: the deserialized object.
+    """
+    if os.getenv('QISKIT_IN_PARALLEL') != 'TRUE':
+        return dill.loads(payload)
+    key = hashlib.sha1(payload).hexdigest()
+    if key in _WORKER_CACHE:
+        _WORKER_CACHE.move_to_end(key)
+        return _WORKER_CACHE[key]
+    value = dill.loads(payload)
+    _WORKER_CACHE[key] = value
+    if len(_WORKER_CACHE) > _WORKER_CACHE_SIZE:
+        _WORKER_CACHE.popitem(last=False)
+    return value
+
+
+def worker_preloaded(key):
+    """Return an object preloaded in the current ``ParallelPool`` worker.
+
+    Args:
+        key (str): the key the object was preloaded with.
+
+    Returns:
+        object: the preloaded object.
+
+    Raises:
+        QiskitError: if there is no object preloaded under ``key``.
+    """
+    try:
+        return _WORKER_STATE[key]
+    except KeyError:
+        raise QiskitError('No object preloaded with key "%s" in this worker.' % key)
+
+
+def active_pool():
+    """Return the innermost :class:`ParallelPool` entered as a context manager.
+
+    Returns:
+        ParallelPool: the active pool, or ``None`` if there is none.
+    """
+    if _ACTIVE_POOLS and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE':
+        return _ACTIVE_POOLS[-1]
+    return None
+
+
+class ParallelPool:
+    """A long-lived pool of worker processes reused by :func:`parallel_map`.
+
+    By default, every call to :func:`parallel_map` spawns a new set of
+    processes and tears them down once all the tasks finished. When many small
+    batches are run, process start-up dominates the run time. A
+    ``ParallelPool`` keeps its workers alive between calls instead. While the
+    pool is entered as a context manager, it is used by every
+    :func:`parallel_map` call, and therefore by :func:`~qiskit.compiler.transpile`,
+    :meth:`~qiskit.transpiler.PassManager.run` and
+    :func:`~qiskit.compiler.assemble`::
+
+        from qiskit.tools.parallel import ParallelPool
+
+        with ParallelPool(num_processes=4, pass_managers=[pm]):
+            for batch in batches:
+                results.append(pm.run(batch))
+
+    Pass managers given in ``pass_managers`` are serialized once and
+    deserialized once per worker, so that :meth:`PassManager.run` only needs
+    to send the circuits to the workers. The preloaded copy is only used
+    while no passes are appended to, replaced in or removed from the pass
+    manager, and while its ``max_iteration`` is unchanged. Changes made to the
+    pass objects themselves are not detected.
+    """
+
+    def __init__(self, num_processes=CPU_COUNT, warm_up=True, pass_managers=None,
+                 preload=None):
+        """Create a new pool. The worker processes are started when the pool is entered.
+
+        Args:
+            num_processes (int): Number of worker processes.
+            warm_up (bool): If ``True``, start all the workers and import
+                qiskit in them when the pool is started, instead of on the
+                first submitted tasks.
+            pass_managers (list[PassManager]): Pass managers to preload in
+                every worker.
+            preload (dict): Additional objects to preload in every worker,
+                keyed by name. They can be retrieved from a task running in
+                the pool with :func:`worker_preloaded`.
+        """
+        self.num_processes = num_processes
+        self.warm_up = warm_up
+        self._executor = None
+        self._preloaded = {}
+        for key, obj in (preload or {}).items():
+            self._preloaded[key] = dill.dumps(obj)
+        # The preloaded pass managers by identity, so that running them does not
+        # need to serialize them again. They are kept referenced, so that their
+        # identity is not reused while the pool exists.
+        self._pass_managers = {}
+        for pass_manager in pass_managers or []:
+            payload = dill.dumps(pass_manager)
+            key = hashlib.sha1(payload).hexdigest()
+            self._preloaded[key] = payload
+            self._pass_managers[id(pass_manager)] = (pass_manager, key,
+                                                     _schedule_state(pass_manager))
+
+    @property
+    def running(self):
+        """Whether the worker processes of the pool are started."""
+        return self._executor is not None
+
+    def preloaded_key(self, payload):
+        """Return the key of a serialized object preloaded in the workers.
+
+        Args:
+            payload (bytes): the ``dill`` serialization of the object.
+
+        Returns:
+            str: the key of the preloaded object, or ``None`` if it is not preloaded.
+        """
+        key = hashlib.sha1(payload).hexdigest()
+        if key in self._preloaded:
+            return key
+        return None
+
+    def pass_manager_key(self, pass_manager):
+        """Return the key of a pass manager preloaded in the workers.
+
+        Args:
+            pass_manager (PassManager): one of the ``pass_managers`` of the pool.
+
+        Returns:
+            str: the key of the preloaded pass manager, or ``None`` if it is not
+            preloaded or if its schedule changed since the pool was created.
+        """
+        entry = self._pass_managers.get(id(pass_manager))
+        if entry is None or entry[2] != _schedule_state(pass_manager):
+            return None
+        return entry[1]
+
+    def start(self):
+        """Start the worker processes of the pool.
+
+        Returns:
+            ParallelPool: the pool itself.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.num_processes,
+                                                 initializer=_pool_initializer,
+                                                 initargs=(self._preloaded,))
+            if self.warm_up:
+                list(self._executor.map(_pool_warm_up, range(self.num_processes)))
+        return self
+
+    def shutdown(self):
+        """Stop the worker processes of the pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def map(self, function, iterable, chunksize=1):
+        """Map ``function`` over ``iterable`` using the workers of the pool.
+
+        Args:
+            function (callable): a picklable function.
+            iterable (iterable): the values to map ``function`` over.
+            chunksize (int): number of values sent at once to a worker.
+
+        Returns:
+            iterator: the results, in the order of ``iterable``.
+        """
+        return self.start()._executor.map(function, iterable, chunksize=chunksize)
+
+    def __enter__(self):
+        self.start()
+        _ACTIVE_POOLS.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        _ACTIVE_POOLS.remove(self)
+        self.shutdown()
 
 
 def parallel_map(  # pylint: disable=dangerous-default-value
-        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT):
+        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT,
+        pool=None, chunksize=None):
     """
     Parallel execution of a mapping of `values` to the function `task`. This
     is functionally equivalent to::
@@ -85,7 +393,13 @@ def parallel_map(  # pylint: disable=dangerous-default-value
                             function is to be evaluated.
         task_args (list): Optional additional arguments to the ``task`` function.
         task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
-        num_processes (int): Number of processes to spawn.
+        num_processes (int): Number of processes to spawn. Ignored when a
+            :class:`ParallelPool` is used.
+        pool (ParallelPool): The pool of worker processes to run the tasks
+            on. If ``None``, the pool entered as a context manager is used, if
+            any, otherwise a new set of processes is spawned for this call.
+        chunksize (int): Number of values sent at once to a worker process.
+            If ``None``, it is chosen from the size of the circuits in ``values``.
 
     Returns:
         result: The result list contains the value of
@@ -112,17 +426,29 @@ def parallel_map(  # pylint: disable=dangerous-default-value
         nfinished[0] += 1
         Publisher().publish("terra.parallel.done", nfinished[0])
 
+    if pool is None:
+        pool = active_pool()
+    if pool is not None:
+        num_processes = pool.num_processes
+
     # Run in parallel if not Win and not in parallel already
     if platform.system() != 'Windows' and num_processes > 1 \
        and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE':
         os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
         try:
             results = []
-            with ProcessPoolExecutor(max_workers=num_processes) as executor:
-                param = map(lambda value: (task, value, task_args, task_kwargs), values)
-                future = executor.map(_task_wrapper, param)
+            if chunksize is None:
+                chunksize = _chunk_size(values, num_processes)
+            param = map(lambda value: (task, _serialize_circuits(value), task_args, task_kwargs),
+                        values)
+            if pool is not None:
+                results = list(pool.map(_task_wrapper, param, chunksize=chunksize))
+            else:
+                with ProcessPoolExecutor(max_workers=num_processes) as executor:
+                    future = executor.map(_task_wrapper, param, chunksize=chunksize)
 
-            results = list(future)
+                results = list(future)
+            results = [_deserialize_circuits(result) for result in results]
             Publisher().publish("terra.parallel.done", len(results))
 
         except (KeyboardInterrupt, Exception) as error:
@@ -147,3 +473,88 @@ def parallel_map(  # pylint: disable=dangerous-default-value
         _callback(0)
     Publisher().publish("terra.parallel.finish")
     return results
+
+
+def parallel_imap(  # pylint: disable=dangerous-default-value
+        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT,
+        pool=None, chunksize=None):
+    """
+    Streaming variant of :func:`parallel_map`. This is functionally equivalent to::
+
+        for value in values:
+            yield task(value, *task_args, **task_kwargs)
+
+    The results are yielded in the order of ``values`` as soon as they are
+    available, so that the caller can start working on the first results while
+    the following ones are still being computed. The worker processes are
+    released once the generator is exhausted or closed.
+
+    Args:
+        task (func): Function that is to be called for each value in ``values``.
+        values (array_like): List or array of values for which the ``task``
+                            function is to be evaluated.
+        task_args (list): Optional additional arguments to the ``task`` function.
+        task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
+        num_processes (int): Number of processes to spawn. Ignored when a
+            :class:`ParallelPool` is used.
+        pool (ParallelPool): The pool of worker processes to run the tasks
+            on. If ``None``, the pool entered as a context manager is used, if
+            any, otherwise a new set of processes is spawned for this call.
+        chunksize (int): Number of values sent at once to a worker process.
+            If ``None``, it is chosen from the size of the circuits in ``values``.
+
+    Yields:
+        Any: The value of ``task(value, *task_args, **task_kwargs)`` for each
+        value in ``values``.
+
+    Raises:
+        QiskitError: If user interrupts via keyboard.
+
+    Events:
+        terra.parallel.start: The collection of parallel tasks are about to start.
+        terra.parallel.done: One of the parallel task has finished.
+        terra.parallel.finish: All the parallel tasks have finished.
+    """
+    values = list(values)
+    if len(values) == 0:
+        return
+
+    Publisher().publish("terra.parallel.start", len(values))
+
+    if pool is None:
+        pool = active_pool()
+    if pool is not None:
+        num_processes = pool.num_processes
+
+    if platform.system() != 'Windows' and num_processes > 1 and len(values) > 1 \
+       and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE':
+        if chunksize is None:
+            chunksize = _chunk_size(values, num_processes)
+        param = map(lambda value: (task, _serialize_circuits(value), task_args, task_kwargs),
+                    values)
+        executor = None
+        try:
+            if pool is not None:
+                results = pool.map(_task_wrapper, param, chunksize=chunksize)
+            else:
+                # The workers flag themselves as running in parallel, since the
+                # flag of this process is not set while results are consumed.
+                executor = ProcessPoolExecutor(max_workers=num_processes,
+                                               initializer=_set_parallel_flag)
+                results = executor.map(_task_wrapper, param, chunksize=chunksize)
+            for nfinished, result in enumerate(results, 1):
+                Publisher().publish("terra.parallel.done", nfinished)
+                yield _deserialize_circuits(result)
+        except KeyboardInterrupt:
+            raise QiskitError('Keyboard interrupt in parallel_imap.')
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+            Publisher().publish("terra.parallel.finish")
+        return
+
+    for nfinished, value in enumerate(values, 1):
+        result = task(value, *task_args, **task_kwargs)
+        Publisher().publish("terra.parallel.done", nfinished)
+        yield result
+    Publisher().publish("terra.parallel.finish")
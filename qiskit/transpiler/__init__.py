@@ -380,6 +380,7 @@ Pass Manager Construction
    PassManagerConfig
    PropertySet
    FlowController
+   TranspileProfile
 
 Layout and Topology
 -------------------
@@ -421,6 +422,7 @@ from .runningpassmanager import FlowController
 from .passmanager import PassManager
 from .passmanager_config import PassManagerConfig
 from .propertyset import PropertySet
+from .profiling import TranspileProfile
 from .exceptions import TranspilerError, TranspilerAccessError
 from .fencedobjs import FencedDAGCircuit, FencedPropertySet
 from .basepasses import AnalysisPass, TransformationPass
@@ -98,7 +98,12 @@ class BasePass(metaclass=MetaPass):
 
 class AnalysisPass(BasePass):  # pylint: disable=abstract-method
     """An analysis pass: change property set, not DAG."""
-    pass
+
+    # Whether the results of the pass only depend on the DAG it runs on, so
+    # that they remain valid as long as the DAG is not modified. Passes which
+    # keep a state between their runs (e.g. to detect a fixed point) set it to
+    # False, to run again after every transformation pass.
+    stateless = True
 
 
 class TransformationPass(BasePass):  # pylint: disable=abstract-method
@@ -19,12 +19,54 @@ CNOT gates. The object has a distance function that can be used to map quantum c
 onto a device with this coupling.
 """
 import io
+from collections import OrderedDict
+
 import numpy as np
 import scipy.sparse as sp
 import scipy.sparse.csgraph as cs
 import networkx as nx
 from qiskit.transpiler.exceptions import CouplingError
 
+# Maximum number of coupling graphs whose shortest paths are kept in
+# ``_SHORTEST_PATHS``.
+SHORTEST_PATHS_CACHE_SIZE = 16
+
+# Least-recently-used cache of the adjacency, distance and predecessor matrices
+# of the coupling graphs, keyed on their physical qubits and edges, shared by
+# all the CouplingMap instances with the same graph.
+_SHORTEST_PATHS = OrderedDict()
+
+
+def _shortest_paths(physical_qubits, edges):
+    """Return the adjacency matrix, the undirected distance matrix and the
+    predecessor matrix of a coupling graph, computed by breadth-first searches
+    from all the qubits, or taken from the cache.
+
+    The matrices are shared and read-only. The distance of two qubits which
+    are not connected is ``inf``, and the predecessor of a qubit on the
+    shortest paths from a qubit it is not connected to is negative.
+    """
+    key = (physical_qubits, edges)
+    try:
+        _SHORTEST_PATHS.move_to_end(key)
+        return _SHORTEST_PATHS[key]
+    except KeyError:
+        pass
+
+    size = physical_qubits[-1] + 1 if physical_qubits else 0
+    edge_array = np.array(edges, dtype=int).reshape(-1, 2)
+    adjacency = sp.csr_matrix((np.ones(len(edge_array), dtype=int),
+                               (edge_array[:, 0], edge_array[:, 1])), shape=(size, size))
+    dist_matrix, predecessors = cs.shortest_path(adjacency, directed=False, unweighted=True,
+                                                 return_predecessors=True)
+    dist_matrix.setflags(write=False)
+    predecessors.setflags(write=False)
+    paths = (adjacency, dist_matrix, predecessors)
+    _SHORTEST_PATHS[key] = paths
+    if len(_SHORTEST_PATHS) > SHORTEST_PATHS_CACHE_SIZE:
+        _SHORTEST_PATHS.popitem(last=False)
+    return paths
+
 
 class CouplingMap:
     """
@@ -46,8 +88,10 @@ class CouplingMap:
         self.description = description
         # the coupling map graph
         self.graph = nx.DiGraph()
-        # a dict of dicts from node pairs to distances
+        # a matrix of the undirected distances between the physical qubits
         self._dist_matrix = None
+        # the adjacency, distance and predecessor matrices of the graph
+        self._shortest_paths = None
         # a sorted list of physical qubits (integers) in this coupling map
         self._qubit_list = None
         # a sorted list of physical qubits (integers) in this coupling map
@@ -85,6 +129,7 @@ class CouplingMap:
                 "The physical qubit %s is already in the coupling graph" % physical_qubit)
         self.graph.add_node(physical_qubit)
         self._dist_matrix = None  # invalidate
+        self._shortest_paths = None  # invalidate
         self._qubit_list = None  # invalidate
 
     def add_edge(self, src, dst):
@@ -100,6 +145,7 @@ class CouplingMap:
             self.add_physical_qubit(dst)
         self.graph.add_edge(src, dst)
         self._dist_matrix = None  # invalidate
+        self._shortest_paths = None  # invalidate
         self._is_symmetric = None  # invalidate
 
     def subgraph(self, nodelist):
@@ -140,22 +186,38 @@ class CouplingMap:
         """
         return self.graph.neighbors(physical_qubit)
 
+    def _get_shortest_paths(self):
+        """Return the adjacency, distance and predecessor matrices of the graph."""
+        if self._shortest_paths is None:
+            self._shortest_paths = _shortest_paths(tuple(self.physical_qubits),
+                                                   tuple(sorted(self.graph.edges())))
+        return self._shortest_paths
+
     def _compute_distance_matrix(self):
         """Compute the full distance matrix on pairs of nodes.
 
-        The distance map self._dist_matrix is computed from the graph using
-        all_pairs_shortest_path_length.
+        The distance map self._dist_matrix is computed from the graph by
+        breadth-first searches from all the nodes, and shared with the other
+        coupling maps with the same graph.
         """
         if not self.is_connected():
             raise CouplingError("coupling graph not connected")
-        lengths = nx.all_pairs_shortest_path_length(self.graph.to_undirected(as_view=True))
-        lengths = dict(lengths)
-        size = len(lengths)
-        cmap = np.zeros((size, size))
-        for idx in range(size):
-            cmap[idx, np.fromiter(lengths[idx].keys(), dtype=int)] = np.fromiter(
-                lengths[idx].values(), dtype=int)
-        self._dist_matrix = cmap
+        self._dist_matrix = self._get_shortest_paths()[1]
+
+    @property
+    def distance_matrix(self):
+        """Return the read-only matrix of the undirected distances between
+        the physical qubits.
+
+        Returns:
+            ndarray: the distances, indexed by the pairs of physical qubits.
+
+        Raises:
+            CouplingError: if the coupling graph is not connected.
+        """
+        if self._dist_matrix is None:
+            self._compute_distance_matrix()
+        return self._dist_matrix
 
     def distance(self, physical_qubit1, physical_qubit2):
         """Returns the undirected distance between physical_qubit1 and physical_qubit2.
@@ -170,9 +232,9 @@ class CouplingMap:
         Raises:
             CouplingError: if the qubits do not exist in the CouplingMap
         """
-        if physical_qubit1 not in self.physical_qubits:
+        if physical_qubit1 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit1,))
-        if physical_qubit2 not in self.physical_qubits:
+        if physical_qubit2 not in self.graph:
             raise CouplingError("%s not in coupling graph" % (physical_qubit2,))
         if self._dist_matrix is None:
             self._compute_distance_matrix()
@@ -189,12 +251,19 @@ class CouplingMap:
         Raises:
             CouplingError: When there is no path between physical_qubit1, physical_qubit2.
         """
-        try:
-            return nx.shortest_path(self.graph.to_undirected(as_view=True), source=physical_qubit1,
-                                    target=physical_qubit2)
-        except nx.exception.NetworkXNoPath:
-            raise CouplingError(
-                "Nodes %s and %s are not connected" % (str(physical_qubit1), str(physical_qubit2)))
+        for physical_qubit in (physical_qubit1, physical_qubit2):
+            if physical_qubit not in self.graph:
+                raise CouplingError("%s not in coupling graph" % (physical_qubit,))
+        predecessors = self._get_shortest_paths()[2][physical_qubit1]
+        path = [physical_qubit2]
+        while path[-1] != physical_qubit1:
+            predecessor = int(predecessors[path[-1]])
+            if predecessor < 0:
+                raise CouplingError("Nodes %s and %s are not connected"
+                                    % (str(physical_qubit1), str(physical_qubit2)))
+            path.append(predecessor)
+        path.reverse()
+        return path
 
     @property
     def is_symmetric(self):
@@ -216,6 +285,7 @@ class CouplingMap:
             if (dest, src) not in edges:
                 self.add_edge(dest, src)
         self._dist_matrix = None  # invalidate
+        self._shortest_paths = None  # invalidate
         self._is_symmetric = None  # invalidate
 
     def _check_symmetry(self):
@@ -18,6 +18,8 @@ Virtual (qu)bits are tuples, e.g. `(QuantumRegister(3, 'qr'), 2)` or simply `qr[
 Physical (qu)bits are integers.
 """
 
+import numpy as np
+
 from qiskit.circuit.quantumregister import Qubit
 from qiskit.transpiler.exceptions import LayoutError
 from qiskit.converters import isinstanceint
@@ -324,3 +326,106 @@ class Layout():
             else:
                 raise LayoutError("The list should contain elements of the Bits or NoneTypes")
         return out
+
+
+class ArrayLayout:
+    """Layout of virtual qubits, numbered by their position in a list of qubits,
+    on physical qubits, stored in two integer arrays.
+
+    ``virtual_to_physical[v]`` is the physical qubit of the virtual qubit ``v`` and
+    ``physical_to_virtual[p]`` is the virtual qubit on the physical qubit ``p``, or
+    -1 if there is none. Swapping two physical qubits is done in place in
+    constant time, and undone by swapping them again. It is meant for the inner
+    loops of the routing passes, which convert from and to :class:`Layout` at
+    their boundaries.
+    """
+
+    __slots__ = ('virtual_to_physical', 'physical_to_virtual')
+
+    def __init__(self, virtual_to_physical, num_physical_qubits=None):
+        """Create a layout from the physical qubits of the virtual qubits.
+
+        Args:
+            virtual_to_physical (list[int]): the physical qubit of each virtual qubit.
+            num_physical_qubits (int): the number of physical qubits. Defaults to
+                one more than the largest physical qubit of the layout.
+
+        Raises:
+            LayoutError: if the physical qubits are negative, out of range or not
+                distinct.
+        """
+        self.virtual_to_physical = np.array(virtual_to_physical, dtype=np.intp).reshape(-1)
+        size = len(self.virtual_to_physical)
+        if num_physical_qubits is None:
+            num_physical_qubits = int(self.virtual_to_physical.max()) + 1 if size else 0
+        if size and (self.virtual_to_physical.min() < 0
+                     or self.virtual_to_physical.max() >= num_physical_qubits):
+            raise LayoutError('The physical qubits must be in range(%d).' % num_physical_qubits)
+        self.physical_to_virtual = np.full(num_physical_qubits, -1, dtype=np.intp)
+        self.physical_to_virtual[self.virtual_to_physical] = np.arange(size)
+        if np.count_nonzero(self.physical_to_virtual >= 0) != size:
+            raise LayoutError('Duplicate values not permitted; Layout is bijective.')
+
+    def __repr__(self):
+        return 'ArrayLayout(%s, %d)' % (self.virtual_to_physical.tolist(),
+                                        len(self.physical_to_virtual))
+
+    def __len__(self):
+        return len(self.virtual_to_physical)
+
+    @classmethod
+    def from_layout(cls, layout, qubits, num_physical_qubits=None):
+        """Return the array layout of a list of virtual qubits in a :class:`Layout`.
+
+        Args:
+            layout (Layout): the layout of the virtual qubits.
+            qubits (list[Qubit]): the virtual qubits, numbered by their position.
+            num_physical_qubits (int): the number of physical qubits.
+
+        Returns:
+            ArrayLayout: the layout of the qubits.
+
+        Raises:
+            LayoutError: if a qubit is not in the layout.
+        """
+        v2p = layout.get_virtual_bits()
+        try:
+            virtual_to_physical = [v2p[qubit] for qubit in qubits]
+        except KeyError as ex:
+            raise LayoutError('The qubit %s is not in the layout.' % (ex.args[0],))
+        return cls(virtual_to_physical, num_physical_qubits)
+
+    def to_layout(self, qubits):
+        """Return the :class:`Layout` of the virtual qubits.
+
+        Args:
+            qubits (list[Qubit]): the virtual qubits, numbered by their position.
+
+        Returns:
+            Layout: the layout of the qubits.
+        """
+        return Layout(dict(zip(qubits, self.virtual_to_physical.tolist())))
+
+    def copy(self):
+        """Returns a copy of the layout."""
+        layout = ArrayLayout.__new__(ArrayLayout)
+        layout.virtual_to_physical = self.virtual_to_physical.copy()
+        layout.physical_to_virtual = self.physical_to_virtual.copy()
+        return layout
+
+    def swap(self, physical1, physical2):
+        """Swap the virtual qubits of two physical qubits in place.
+
+        Args:
+            physical1 (int): a physical qubit.
+            physical2 (int): another physical qubit.
+        """
+        p2v = self.physical_to_virtual
+        virtual1 = p2v[physical1]
+        virtual2 = p2v[physical2]
+        p2v[physical1] = virtual2
+        p2v[physical2] = virtual1
+        if virtual1 >= 0:
+            self.virtual_to_physical[virtual1] = physical2
+        if virtual2 >= 0:
+            self.virtual_to_physical[virtual2] = physical1
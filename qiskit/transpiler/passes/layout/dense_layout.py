@@ -127,12 +127,8 @@ class DenseLayout(AnalysisPass):
         if num_qubits == 0:
             return []
 
-        device_qubits = self.coupling_map.size()
-
-        cmap = np.asarray(self.coupling_map.get_edges())
-        data = np.ones_like(cmap[:, 0])
-        sp_cmap = sp.coo_matrix((data, (cmap[:, 0], cmap[:, 1])),
-                                shape=(device_qubits, device_qubits)).tocsr()
+        # The adjacency matrix is shared with the other users of the coupling map
+        sp_cmap = self.coupling_map._get_shortest_paths()[0]
         best = 0
         best_map = None
         best_error = np.inf
@@ -144,16 +140,15 @@ class DenseLayout(AnalysisPass):
 
             connection_count = 0
             sub_graph = []
+            subset = set(bfs[:num_qubits].tolist())
             for i in range(num_qubits):
                 node_idx = bfs[i]
                 for j in range(sp_cmap.indptr[node_idx],
                                sp_cmap.indptr[node_idx + 1]):
                     node = sp_cmap.indices[j]
-                    for counter in range(num_qubits):
-                        if node == bfs[counter]:
-                            connection_count += 1
-                            sub_graph.append([node_idx, node])
-                            break
+                    if node in subset:
+                        connection_count += 1
+                        sub_graph.append([node_idx, node])
 
             if self.backend_prop:
                 curr_error = 0
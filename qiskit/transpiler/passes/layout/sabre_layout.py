@@ -22,10 +22,12 @@ from qiskit.transpiler.passes.layout.full_ancilla_allocation import FullAncillaA
 from qiskit.transpiler.passes.layout.enlarge_with_ancilla import EnlargeWithAncilla
 from qiskit.transpiler.passes.layout.apply_layout import ApplyLayout
 from qiskit.transpiler.passes.routing import SabreSwap
+from qiskit.transpiler.passes.routing.sabre_swap import _trial_seeds
 from qiskit.transpiler.passmanager import PassManager
 from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.tools.parallel import parallel_map
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +52,7 @@ class SabreLayout(AnalysisPass):
     """
 
     def __init__(self, coupling_map, routing_pass=None, seed=None,
-                 max_iterations=3):
+                 max_iterations=3, trials=1):
         """SabreLayout initializer.
 
         Args:
@@ -58,12 +60,24 @@ class SabreLayout(AnalysisPass):
             routing_pass (BasePass): the routing pass to use while iterating.
             seed (int): seed for setting a random first trial layout.
             max_iterations (int): number of forward-backward iterations.
+            trials (int): number of independent searches for a layout, run in
+                parallel from random first layouts with different seeds. The
+                first trial uses ``seed`` and the others seeds drawn from it.
+                The circuit is routed with the layout found by each trial, and
+                the layout needing the fewest swaps is kept, and among those the
+                one giving the lowest depth.
+
+        Raises:
+            TranspilerError: if ``trials`` is lower than 1.
         """
         super().__init__()
+        if trials < 1:
+            raise TranspilerError('The number of trials must be at least 1, got %s.' % trials)
         self.coupling_map = coupling_map
         self.routing_pass = routing_pass
         self.seed = seed
         self.max_iterations = max_iterations
+        self.trials = trials
 
     def run(self, dag):
         """Run the SabreLayout pass on `dag`.
@@ -77,22 +91,37 @@ class SabreLayout(AnalysisPass):
         if len(dag.qubits) > self.coupling_map.size():
             raise TranspilerError('More virtual qubits exist than physical.')
 
-        # Choose a random initial_layout.
         if self.seed is None:
             self.seed = np.random.randint(0, np.iinfo(np.int32).max)
-        rng = np.random.default_rng(self.seed)
+
+        circ = dag_to_circuit(dag)
+        if self.trials == 1:
+            if self.routing_pass is None:
+                self.routing_pass = SabreSwap(self.coupling_map, 'decay', seed=self.seed)
+            self.property_set['layout'] = self._find_layout(circ, self.seed)
+            return
+
+        results = parallel_map(_sabre_layout_trial, _trial_seeds(self.seed, self.trials),
+                               task_args=(circ, self.coupling_map, self.routing_pass,
+                                          self.max_iterations))
+        scores = [(num_swaps, depth) for _, num_swaps, depth in results]
+        best_trial = scores.index(min(scores))
+        logger.info('Trial %d kept, num_swaps and depth of the trials: %s', best_trial, scores)
+        self.property_set['layout'] = Layout(dict(zip(dag.qubits, results[best_trial][0])))
+
+    def _find_layout(self, circ, seed):
+        """Return the layout found by forward-backward iterations from a random
+        first layout chosen with a seed."""
+        # Choose a random initial_layout.
+        rng = np.random.default_rng(seed)
 
         physical_qubits = rng.choice(self.coupling_map.size(),
-                                     len(dag.qubits), replace=False)
+                                     len(circ.qubits), replace=False)
         physical_qubits = rng.permutation(physical_qubits)
-        initial_layout = Layout({q: dag.qubits[i]
+        initial_layout = Layout({q: circ.qubits[i]
                                  for i, q in enumerate(physical_qubits)})
 
-        if self.routing_pass is None:
-            self.routing_pass = SabreSwap(self.coupling_map, 'decay', seed=self.seed)
-
         # Do forward-backward iterations.
-        circ = dag_to_circuit(dag)
         for i in range(self.max_iterations):
             for _ in ('forward', 'backward'):
                 pm = self._layout_and_route_passmanager(initial_layout)
@@ -112,7 +141,7 @@ class SabreLayout(AnalysisPass):
             logger.info('new initial layout')
             logger.info(initial_layout)
 
-        self.property_set['layout'] = initial_layout
+        return initial_layout
 
     def _layout_and_route_passmanager(self, initial_layout):
         """Return a passmanager for a full layout and routing.
@@ -143,3 +172,20 @@ class SabreLayout(AnalysisPass):
         final_layout = {v: pass_final_layout[qubit_map[v]]
                         for v, _ in initial_layout.get_virtual_bits().items()}
         return Layout(final_layout)
+
+
+def _sabre_layout_trial(seed, circ, coupling_map, routing_pass, max_iterations):
+    """Find a layout with a seed and route the circuit with it.
+
+    Returns:
+        tuple(list[int], int, int): the physical qubits of the qubits of the
+        circuit in the layout, and the number of swaps and the depth of the
+        routed circuit.
+    """
+    if routing_pass is None:
+        routing_pass = SabreSwap(coupling_map, 'decay', seed=seed)
+    layout_pass = SabreLayout(coupling_map, routing_pass, seed, max_iterations)
+    layout = layout_pass._find_layout(circ, seed)
+    routed_circ = layout_pass._layout_and_route_passmanager(layout).run(circ)
+    return ([layout[qubit] for qubit in circ.qubits], routed_circ.count_ops().get('swap', 0),
+            routed_circ.depth())
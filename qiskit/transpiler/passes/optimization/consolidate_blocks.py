@@ -15,7 +15,10 @@
 """Replace each block of consecutive gates by a single Unitary node."""
 
 
-from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit
+import numpy as np
+
+from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit, Gate
+from qiskit.circuit.exceptions import CircuitError
 from qiskit.quantum_info.operators import Operator
 from qiskit.quantum_info.synthesis import TwoQubitBasisDecomposer
 from qiskit.extensions import UnitaryGate
@@ -79,6 +82,9 @@ class ConsolidateBlocks(TransformationPass):
         # compute ordered indices for the global circuit wires
         global_index_map = {wire: idx for idx, wire in enumerate(dag.qubits)}
 
+        # the matrices of the gates, shared by all the blocks of the dag
+        matrix_cache = {}
+
         blocks = self.property_set['block_list']
         # just to make checking if a node is in any block easier
         all_block_nodes = {nd for bl in blocks for nd in bl}
@@ -108,23 +114,30 @@ class ConsolidateBlocks(TransformationPass):
                 # so update the blocks list to include this block
                 blocks = blocks[:block_count] + [[node]] + blocks[block_count:]
 
-        # create the dag from the updated list of blocks
+        # compute the unitaries of the blocks to consolidate
         basis_gate_name = self.decomposer.gate.name
-        for block in blocks:
+        unitaries = {}
+        for block_id, block in enumerate(blocks):
             if len(block) == 1 and (block[0].name != basis_gate_name
                                     or block[0].op.is_parameterized()):
                 # an intermediate node that was added into the overall list
-                new_dag.apply_operation_back(block[0].op, block[0].qargs,
-                                             block[0].cargs)
+                continue
+            # find the qubits involved in this block
+            block_qargs = set()
+            block_cargs = set()
+            for nd in block:
+                block_qargs |= set(nd.qargs)
+                if nd.condition:
+                    block_cargs |= set(nd.condition[0])
+            block_index_map = self._block_qargs_to_indices(block_qargs,
+                                                           global_index_map)
+            if len(block_qargs) <= 2 and not block_cargs and all(
+                    isinstance(nd.op, Gate) for nd in block):
+                # multiply the gate matrices directly
+                unitary = UnitaryGate(self._block_to_matrix(block, block_index_map,
+                                                            matrix_cache))
             else:
-                # find the qubits involved in this block
-                block_qargs = set()
-                block_cargs = set()
-                for nd in block:
-                    block_qargs |= set(nd.qargs)
-                    if nd.condition:
-                        block_cargs |= set(nd.condition[0])
-                # convert block to a sub-circuit, then simulate unitary and add
+                # convert block to a sub-circuit, then simulate unitary
                 q = QuantumRegister(len(block_qargs))
                 # if condition in node, add clbits to circuit
                 if len(block_cargs) > 0:
@@ -132,33 +145,98 @@ class ConsolidateBlocks(TransformationPass):
                     subcirc = QuantumCircuit(q, c)
                 else:
                     subcirc = QuantumCircuit(q)
-                block_index_map = self._block_qargs_to_indices(block_qargs,
-                                                               global_index_map)
-                basis_count = 0
                 for nd in block:
-                    if nd.op.name == basis_gate_name:
-                        basis_count += 1
                     subcirc.append(nd.op, [q[block_index_map[i]] for i in nd.qargs])
                 unitary = UnitaryGate(Operator(subcirc))  # simulates the circuit
+            unitaries[block_id] = (unitary, block_qargs, block_index_map)
 
-                max_2q_depth = 20  # If depth > 20, there will be 1q gates to consolidate.
-                if (  # pylint: disable=too-many-boolean-expressions
-                        self.force_consolidate
-                        or unitary.num_qubits > 2
-                        or self.decomposer.num_basis_gates(unitary) < basis_count
-                        or len(subcirc) > max_2q_depth
-                        or (self.basis_gates is not None
-                            and not set(subcirc.count_ops()).issubset(self.basis_gates))
-                ):
-                    new_dag.apply_operation_back(
-                        UnitaryGate(unitary),
-                        sorted(block_qargs, key=lambda x: block_index_map[x]))
-                else:
-                    for nd in block:
-                        new_dag.apply_operation_back(nd.op, nd.qargs, nd.cargs)
+        # count the basis gates needed by all the 2-qubit unitaries at once
+        num_basis_gates = {}
+        if not self.force_consolidate:
+            two_qubit_ids = [block_id for block_id, (unitary, _, _) in unitaries.items()
+                             if unitary.num_qubits == 2]
+            counts = self.decomposer.num_basis_gates_batch(
+                [unitaries[block_id][0].to_matrix() for block_id in two_qubit_ids])
+            num_basis_gates = dict(zip(two_qubit_ids, counts))
+
+        # create the dag from the updated list of blocks
+        for block_id, block in enumerate(blocks):
+            if block_id not in unitaries:
+                new_dag.apply_operation_back(block[0].op, block[0].qargs,
+                                             block[0].cargs)
+                continue
+            unitary, block_qargs, block_index_map = unitaries[block_id]
+            basis_count = sum(1 for nd in block if nd.op.name == basis_gate_name)
+
+            max_2q_depth = 20  # If depth > 20, there will be 1q gates to consolidate.
+            if (  # pylint: disable=too-many-boolean-expressions
+                    self.force_consolidate
+                    or unitary.num_qubits > 2
+                    or num_basis_gates.get(block_id, 0) < basis_count
+                    or len(block) > max_2q_depth
+                    or (self.basis_gates is not None
+                        and not {nd.op.name for nd in block}.issubset(self.basis_gates))
+            ):
+                new_dag.apply_operation_back(
+                    UnitaryGate(unitary),
+                    sorted(block_qargs, key=lambda x: block_index_map[x]))
+            else:
+                for nd in block:
+                    new_dag.apply_operation_back(nd.op, nd.qargs, nd.cargs)
 
         return new_dag
 
+    def _block_to_matrix(self, block, block_index_map, matrix_cache):
+        """Compute the unitary matrix of a block of gates on at most 2 qubits.
+
+        Args:
+            block (list): list of the nodes of the block, in topological order
+            block_index_map (dict): mapping from each qubit of the block to its
+                wire position within the block
+            matrix_cache (dict): matrices of the gates already seen, keyed on
+                the gate and its wire positions within the block
+
+        Returns:
+            ndarray: the unitary matrix of the block
+        """
+        num_qubits = len(block_index_map)
+        block_unitary = np.eye(2 ** num_qubits, dtype=complex)
+        for nd in block:
+            positions = tuple(block_index_map[q] for q in nd.qargs)
+            key = None
+            matrix = None
+            # only the matrices defined by the gate classes are cached, as
+            # gates defined by a circuit can share their name and parameters
+            if type(nd.op).to_matrix is not Gate.to_matrix:
+                key = (type(nd.op), nd.op.name, tuple(nd.op.params),
+                       getattr(nd.op, 'ctrl_state', None), positions, num_qubits)
+                try:
+                    matrix = matrix_cache.get(key)
+                except TypeError:  # unhashable parameters, e.g. of a UnitaryGate
+                    key = None
+            if matrix is None:
+                matrix = self._gate_matrix(nd.op, positions, num_qubits)
+                if key is not None:
+                    matrix_cache[key] = matrix
+            block_unitary = matrix.dot(block_unitary)
+        return block_unitary
+
+    def _gate_matrix(self, gate, positions, num_qubits):
+        """Compute the matrix of a gate acting on the given wire positions of a
+        block of at most 2 qubits."""
+        try:
+            matrix = gate.to_matrix()
+        except CircuitError:
+            matrix = Operator(gate).data
+        if num_qubits == 1 or positions == (0, 1):
+            return matrix
+        if positions == (0,):
+            return np.kron(np.eye(2), matrix)
+        if positions == (1,):
+            return np.kron(matrix, np.eye(2))
+        # positions == (1, 0): swap the qubits of the gate
+        return matrix.reshape(2, 2, 2, 2).transpose(1, 0, 3, 2).reshape(4, 4)
+
     def _block_qargs_to_indices(self, block_qargs, global_index_map):
         """Map each qubit in block_qargs to its wire position among the block's wires.
 
@@ -15,7 +15,10 @@
 from itertools import groupby
 import logging
 
-from qiskit.circuit import QuantumCircuit, QuantumRegister
+import numpy as np
+
+from qiskit.circuit import Gate
+from qiskit.circuit.exceptions import CircuitError
 from qiskit.quantum_info import Operator
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.quantum_info import OneQubitEulerDecomposer
@@ -69,17 +72,21 @@ class Optimize1qGatesDecomposition(TransformationPass):
         decomposer = OneQubitEulerDecomposer(self.basis)
         runs = dag.collect_runs(self.euler_basis_names[self.basis])
         runs = _split_runs_on_parameters(runs)
-        for run in runs:
-            # Don't try to optimize a single 1q gate
-            if len(run) <= 1:
-                continue
-            q = QuantumRegister(1, "q")
-            qc = QuantumCircuit(1)
+        # Don't try to optimize a single 1q gate
+        runs = [run for run in runs if len(run) > 1]
+        if not runs:
+            return dag
+
+        # the matrices of the gates, shared by all the runs of the dag
+        matrix_cache = {}
+        unitaries = np.empty((len(runs), 2, 2), dtype=complex)
+        for index, run in enumerate(runs):
+            unitary = np.eye(2, dtype=complex)
             for gate in run:
-                qc.append(gate.op, [q[0]], [])
+                unitary = _gate_matrix(gate.op, matrix_cache).dot(unitary)
+            unitaries[index] = unitary
 
-            operator = Operator(qc)
-            new_circ = decomposer(operator)
+        for run, new_circ in zip(runs, decomposer.decompose_batch(unitaries)):
             new_dag = circuit_to_dag(new_circ)
             dag.substitute_node_with_dag(run[0], new_dag)
             # Delete the other nodes in the run
@@ -88,6 +95,22 @@ class Optimize1qGatesDecomposition(TransformationPass):
         return dag
 
 
+def _gate_matrix(op, matrix_cache):
+    """Return the matrix of a single qubit gate, caching the matrices of the
+    gate classes which define their own."""
+    if type(op).to_matrix is Gate.to_matrix:
+        return Operator(op).data
+    key = (type(op), tuple(op.params))
+    matrix = matrix_cache.get(key)
+    if matrix is None:
+        try:
+            matrix = op.to_matrix()
+        except CircuitError:
+            matrix = Operator(op).data
+        matrix_cache[key] = matrix
+    return matrix
+
+
 def _split_runs_on_parameters(runs):
     """Finds runs containing parameterized gates and splits them into sequential
     runs excluding the parameterized gates.
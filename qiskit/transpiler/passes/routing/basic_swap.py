@@ -61,12 +61,12 @@ class BasicSwap(TransformationPass):
         trivial_layout = Layout.generate_trivial_layout(canonical_register)
         current_layout = trivial_layout.copy()
 
-        for layer in dag.serial_layers():
-            subdag = layer['graph']
+        for layer in dag.serial_layer_views():
+            node = layer['nodes'][0]
 
-            for gate in subdag.two_qubit_ops():
-                physical_q0 = current_layout[gate.qargs[0]]
-                physical_q1 = current_layout[gate.qargs[1]]
+            if len(node.qargs) == 2 and node.name not in ['snapshot', 'barrier']:
+                physical_q0 = current_layout[node.qargs[0]]
+                physical_q1 = current_layout[node.qargs[1]]
                 if self.coupling_map.distance(physical_q0, physical_q1) != 1:
                     # Insert a new layer with the SWAP(s).
                     swap_layer = DAGCircuit()
@@ -93,7 +93,9 @@ class BasicSwap(TransformationPass):
                     for swap in range(len(path) - 2):
                         current_layout.swap(path[swap], path[swap + 1])
 
-            order = current_layout.reorder_bits(new_dag.qubits)
-            new_dag.compose(subdag, qubits=order)
+            new_dag.apply_operation_back(node.op,
+                                         [new_dag.qubits[current_layout[qarg]]
+                                          for qarg in node.qargs],
+                                         node.cargs)
 
         return new_dag
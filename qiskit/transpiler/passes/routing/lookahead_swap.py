@@ -98,7 +98,7 @@ class LookaheadSwap(TransformationPass):
         current_layout = trivial_layout.copy()
 
         mapped_gates = []
-        ordered_virtual_gates = list(dag.serial_layers())
+        ordered_virtual_gates = list(dag.serial_layer_views())
         gates_remaining = ordered_virtual_gates.copy()
 
         while gates_remaining:
@@ -246,7 +246,7 @@ def _map_free_gates(layout, gates, coupling_map):
         # Gates without a partition (barrier, snapshot, save, load, noise) may
         # still have associated qubits. Look for them in the qargs.
         if not gate['partition']:
-            qubits = [n for n in gate['graph'].nodes() if n.type == 'op'][0].qargs
+            qubits = gate['nodes'][0].qargs
 
             if not qubits:
                 continue
@@ -298,11 +298,11 @@ def _score_step(step):
 
 def _transform_gate_for_layout(gate, layout):
     """Return op implementing a virtual gate on given layout."""
-    mapped_op_node = deepcopy([n for n in gate['graph'].nodes() if n.type == 'op'][0])
+    mapped_op_node = deepcopy(gate['nodes'][0])
 
     device_qreg = QuantumRegister(len(layout.get_physical_bits()), 'q')
     mapped_qargs = [device_qreg[layout[a]] for a in mapped_op_node.qargs]
-    mapped_op_node.qargs = mapped_op_node.op.qargs = mapped_qargs
+    mapped_op_node.qargs = mapped_qargs
 
     return mapped_op_node
 
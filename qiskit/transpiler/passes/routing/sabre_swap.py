@@ -20,8 +20,8 @@ import numpy as np
 from qiskit.circuit.library.standard_gates import SwapGate
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
-from qiskit.transpiler.layout import Layout
-from qiskit.dagcircuit import DAGNode
+from qiskit.transpiler.layout import ArrayLayout
+from qiskit.tools.parallel import parallel_map
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +64,7 @@ class SabreSwap(TransformationPass):
     `arXiv:1809.02573 <https://arxiv.org/pdf/1809.02573.pdf>`_
     """
 
-    def __init__(self, coupling_map, heuristic='basic', seed=None):
+    def __init__(self, coupling_map, heuristic='basic', seed=None, trials=1):
         r"""SabreSwap initializer.
 
         Args:
@@ -72,6 +72,10 @@ class SabreSwap(TransformationPass):
             heuristic (str): The type of heuristic to use when deciding best
                 swap strategy ('basic' or 'lookahead' or 'decay').
             seed (int): random seed used to tie-break among candidate swaps.
+            trials (int): number of independent routings of the circuit, run
+                in parallel with different seeds. The first trial uses ``seed``
+                and the others seeds drawn from it. The routing with the fewest
+                swaps is kept, and among those the one with the lowest depth.
 
         Additional Information:
 
@@ -115,14 +119,23 @@ class SabreSwap(TransformationPass):
                     \frac{1}{\left|{F}\right|} \sum_{gate \in F} D[\pi(gate.q_1)][\pi(gate.q2)]\\
                     + W *\frac{1}{\left|{E}\right|} \sum_{gate \in E} D[\pi(gate.q_1)][\pi(gate.q2)]
                     }
+
+        Raises:
+            TranspilerError: if ``trials`` is lower than 1.
         """
 
         super().__init__()
+        if trials < 1:
+            raise TranspilerError('The number of trials must be at least 1, got %s.' % trials)
         self.coupling_map = coupling_map
         self.heuristic = heuristic
         self.seed = seed
+        self.trials = trials
         self.applied_gates = None
         self.qubits_decay = None
+        self._qubit_indices = None
+        self._dist_matrix = None
+        self._edges = None
 
     def run(self, dag):
         """Run the SabreSwap pass on `dag`.
@@ -141,20 +154,49 @@ class SabreSwap(TransformationPass):
         if len(dag.qubits) > self.coupling_map.size():
             raise TranspilerError('More virtual qubits exist than physical.')
 
-        rng = np.random.default_rng(self.seed)
+        # Assume bidirectional couplings, fixing gate direction is easy later.
+        self.coupling_map.make_symmetric()
+
+        if self.trials == 1:
+            mapped_dag, final_layout = self._route(dag, self.seed)
+        else:
+            results = parallel_map(_sabre_swap_trial, _trial_seeds(self.seed, self.trials),
+                                   task_args=(dag, self.coupling_map, self.heuristic))
+            scores = [(mapped_dag.count_ops().get('swap', 0), mapped_dag.depth())
+                      for mapped_dag, _ in results]
+            best_trial = scores.index(min(scores))
+            logger.info('Trial %d kept, num_swaps and depth of the trials: %s',
+                        best_trial, scores)
+            mapped_dag, final_layout = results[best_trial]
+
+        self.property_set['final_layout'] = final_layout
+
+        return mapped_dag
+
+    def _route(self, dag, seed):
+        """Route a DAG with a seed.
+
+        Returns:
+            tuple(DAGCircuit, Layout): the routed DAG and the final layout of
+            the qubits of the DAG.
+        """
+        rng = np.random.default_rng(seed)
 
         # Preserve input DAG's name, regs, wire_map, etc. but replace the graph.
         mapped_dag = dag._copy_circuit_metadata()
 
-        # Assume bidirectional couplings, fixing gate direction is easy later.
-        self.coupling_map.make_symmetric()
+        self._dist_matrix = self.coupling_map.distance_matrix
+        self._edges = set(self.coupling_map.get_edges())
 
+        # The virtual qubits are numbered by their index in the canonical
+        # register, and start on the physical qubits with the same numbers.
         canonical_register = dag.qregs['q']
-        current_layout = Layout.generate_trivial_layout(canonical_register)
+        self._qubit_indices = {qubit: index for index, qubit in enumerate(canonical_register)}
+        current_layout = ArrayLayout(range(len(canonical_register)), len(self._dist_matrix))
 
         # A decay factor for each qubit used to heuristically penalize recently
         # used qubits (to encourage parallelism).
-        self.qubits_decay = {qubit: 1 for qubit in dag.qubits}
+        self.qubits_decay = np.ones(len(canonical_register))
 
         # Start algorithm from the front layer and iterate until all gates done.
         num_search_steps = 0
@@ -166,20 +208,17 @@ class SabreSwap(TransformationPass):
             # Remove as many immediately applicable gates as possible
             for node in front_layer:
                 if len(node.qargs) == 2:
-                    v0, v1 = node.qargs
-                    physical_qubits = (current_layout[v0], current_layout[v1])
-                    if physical_qubits in self.coupling_map.get_edges():
+                    physical_qubits = tuple(self._physical_qubits(node.qargs, current_layout))
+                    if physical_qubits in self._edges:
                         execute_gate_list.append(node)
                 else:  # Single-qubit gates as well as barriers are free
                     execute_gate_list.append(node)
 
             if execute_gate_list:
                 for node in execute_gate_list:
-                    new_node = _transform_gate_for_layout(node, current_layout)
-                    mapped_dag.apply_operation_back(new_node.op,
-                                                    new_node.qargs,
-                                                    new_node.cargs,
-                                                    new_node.condition)
+                    qargs = [canonical_register[physical] for physical in
+                             self._physical_qubits(node.qargs, current_layout)]
+                    mapped_dag.apply_operation_back(deepcopy(node.op), qargs, node.cargs)
                     front_layer.remove(node)
                     self.applied_gates.add(node)
                     for successor in dag.quantum_successors(node):
@@ -203,25 +242,21 @@ class SabreSwap(TransformationPass):
             # the best swap and insert it. When two or more swaps tie
             # for best score, pick one randomly.
             extended_set = self._obtain_extended_set(dag, front_layer)
-            swap_candidates = self._obtain_swaps(front_layer, current_layout)
-            swap_scores = dict.fromkeys(swap_candidates, 0)
-            for swap_qubits in swap_scores:
-                trial_layout = current_layout.copy()
-                trial_layout.swap(*swap_qubits)
-                score = self._score_heuristic(self.heuristic,
-                                              front_layer,
-                                              extended_set,
-                                              trial_layout,
-                                              swap_qubits)
-                swap_scores[swap_qubits] = score
-            min_score = min(swap_scores.values())
-            best_swaps = [k for k, v in swap_scores.items() if v == min_score]
-            best_swaps.sort(key=lambda x: (x[0].index, x[1].index))
-            best_swap = rng.choice(best_swaps)
-            swap_node = DAGNode(op=SwapGate(), qargs=best_swap, type='op')
-            swap_node = _transform_gate_for_layout(swap_node, current_layout)
-            mapped_dag.apply_operation_back(swap_node.op, swap_node.qargs)
-            current_layout.swap(*best_swap)
+            swap_candidates = sorted(self._obtain_swaps(front_layer, current_layout))
+            swap_scores = self._score_heuristic(self.heuristic,
+                                                front_layer,
+                                                extended_set,
+                                                current_layout,
+                                                np.array(swap_candidates, dtype=np.intp))
+            min_score = swap_scores.min()
+            best_swaps = [swap for swap, score in zip(swap_candidates, swap_scores)
+                          if score == min_score]
+            best_swap = best_swaps[rng.choice(len(best_swaps))]
+            physical1, physical2 = (int(current_layout.virtual_to_physical[virtual])
+                                    for virtual in best_swap)
+            mapped_dag.apply_operation_back(SwapGate(), [canonical_register[physical1],
+                                                         canonical_register[physical2]])
+            current_layout.swap(physical1, physical2)
 
             num_search_steps += 1
             if num_search_steps % DECAY_RESET_INTERVAL == 0:
@@ -234,19 +269,22 @@ class SabreSwap(TransformationPass):
             logger.debug('SWAP Selection...')
             logger.debug('extended_set: %s',
                          [(n.name, n.qargs) for n in extended_set])
-            logger.debug('swap scores: %s', swap_scores)
+            logger.debug('swap scores: %s', dict(zip(swap_candidates, swap_scores.tolist())))
             logger.debug('best swap: %s', best_swap)
             logger.debug('qubits decay: %s', self.qubits_decay)
 
-        self.property_set['final_layout'] = current_layout
-
-        return mapped_dag
+        return mapped_dag, current_layout.to_layout(canonical_register)
 
     def _reset_qubits_decay(self):
         """Reset all qubit decay factors to 1 upon request (to forget about
         past penalizations).
         """
-        self.qubits_decay = {k: 1 for k in self.qubits_decay.keys()}
+        self.qubits_decay.fill(1)
+
+    def _physical_qubits(self, qargs, layout):
+        """Return the list of the physical qubits of virtual qubits."""
+        v2p = layout.virtual_to_physical
+        return [int(v2p[self._qubit_indices[qubit]]) for qubit in qargs]
 
     def _is_resolved(self, node, dag):
         """Return True if all of a node's predecessors in dag are applied.
@@ -292,55 +330,81 @@ class SabreSwap(TransformationPass):
         on virtual qubits that corresponds to one of those physical couplings
         is a candidate SWAP.
 
-        Candidate swaps are sorted so SWAP(i,j) and SWAP(j,i) are not duplicated.
+        The swaps are pairs of virtual qubit numbers, sorted so SWAP(i,j) and
+        SWAP(j,i) are not duplicated.
         """
         candidate_swaps = set()
+        p2v = current_layout.physical_to_virtual
         for node in front_layer:
             for virtual in node.qargs:
-                physical = current_layout[virtual]
+                virtual = self._qubit_indices[virtual]
+                physical = int(current_layout.virtual_to_physical[virtual])
                 for neighbor in self.coupling_map.neighbors(physical):
-                    virtual_neighbor = current_layout[neighbor]
-                    swap = sorted([virtual, virtual_neighbor],
-                                  key=lambda q: (q.register.name, q.index))
-                    candidate_swaps.add(tuple(swap))
+                    virtual_neighbor = int(p2v[neighbor])
+                    if virtual_neighbor < 0:
+                        continue
+                    candidate_swaps.add((min(virtual, virtual_neighbor),
+                                         max(virtual, virtual_neighbor)))
 
         return candidate_swaps
 
-    def _score_heuristic(self, heuristic, front_layer, extended_set, layout, swap_qubits=None):
-        """Return a heuristic score for a trial layout.
+    def _gate_distances(self, gates, layout, swaps):
+        """Return the sums of the distances between the physical qubits of the
+        2-qubit gates for the trial layouts resulting from the swaps.
+
+        The trial layouts are not built: the physical qubits of the gates are
+        gathered from the layout for all the swaps at once, and those of the
+        swapped virtual qubits exchanged.
+        """
+        if not gates:
+            return np.zeros(len(swaps))
+        v2p = layout.virtual_to_physical
+        virtual = np.array([[self._qubit_indices[qubit] for qubit in node.qargs]
+                            for node in gates], dtype=np.intp)[np.newaxis]
+        first = swaps[:, 0, np.newaxis, np.newaxis]
+        second = swaps[:, 1, np.newaxis, np.newaxis]
+        physical = np.where(virtual == first, v2p[second],
+                            np.where(virtual == second, v2p[first], v2p[virtual]))
+        return self._dist_matrix[physical[..., 0], physical[..., 1]].sum(axis=1)
+
+    def _score_heuristic(self, heuristic, front_layer, extended_set, layout, swaps):
+        """Return the heuristic scores of the trial layouts resulting from swaps.
 
         Assuming a trial layout has resulted from a SWAP, we now assign a cost
         to it. The goodness of a layout is evaluated based on how viable it makes
-        the remaining virtual gates that must be applied.
+        the remaining virtual gates that must be applied. The swaps are given as
+        an array of pairs of virtual qubit numbers, and all of them are scored at
+        once.
         """
         if heuristic == 'basic':
-            return sum(self.coupling_map.distance(*[layout[q] for q in node.qargs])
-                       for node in front_layer)
+            return self._gate_distances(front_layer, layout, swaps)
 
         elif heuristic == 'lookahead':
-            first_cost = self._score_heuristic('basic', front_layer, [], layout)
+            first_cost = self._gate_distances(front_layer, layout, swaps)
             first_cost /= len(front_layer)
 
-            second_cost = self._score_heuristic('basic', extended_set, [], layout)
-            second_cost = 0.0 if not extended_set else second_cost / len(extended_set)
+            second_cost = self._gate_distances(extended_set, layout, swaps)
+            if extended_set:
+                second_cost /= len(extended_set)
 
             return first_cost + EXTENDED_SET_WEIGHT * second_cost
 
         elif heuristic == 'decay':
-            return max(self.qubits_decay[swap_qubits[0]], self.qubits_decay[swap_qubits[1]]) * \
-                   self._score_heuristic('lookahead', front_layer, extended_set, layout)
+            decay = np.maximum(self.qubits_decay[swaps[:, 0]], self.qubits_decay[swaps[:, 1]])
+            return decay * self._score_heuristic('lookahead', front_layer, extended_set,
+                                                 layout, swaps)
 
         else:
             raise TranspilerError('Heuristic %s not recognized.' % heuristic)
 
 
-def _transform_gate_for_layout(op_node, layout):
-    """Return node implementing a virtual op on given layout."""
-    mapped_op_node = deepcopy(op_node)
+def _trial_seeds(seed, trials):
+    """Return the seeds of independent trials: ``seed`` itself for the first
+    trial, so a single trial is unchanged, and seeds drawn from it for the others."""
+    rng = np.random.default_rng(seed)
+    return [seed] + rng.integers(np.iinfo(np.int32).max, size=trials - 1).tolist()
 
-    device_qreg = op_node.qargs[0].register
-    premap_qargs = op_node.qargs
-    mapped_qargs = map(lambda x: device_qreg[layout[x]], premap_qargs)
-    mapped_op_node.qargs = mapped_op_node.op.qargs = list(mapped_qargs)
 
-    return mapped_op_node
+def _sabre_swap_trial(seed, dag, coupling_map, heuristic):
+    """Route a DAG with a seed, returning the routed DAG and its final layout."""
+    return SabreSwap(coupling_map, heuristic, seed=seed)._route(dag, seed)
@@ -67,6 +67,9 @@ class StochasticSwap(TransformationPass):
         self.qregs = None
         self.rng = None
         self.trivial_layout = None
+        # the shared distance matrix of the coupling map, and the writable
+        # copies of it and of its square passed to the swap trials
+        self._cdists = None
 
     def run(self, dag):
         """Run the StochasticSwap pass on `dag`.
@@ -172,7 +175,11 @@ class StochasticSwap(TransformationPass):
         best_circuit = None  # initialize best swap circuit
         best_layout = None  # initialize best final layout
 
-        cdist2 = coupling._dist_matrix**2
+        distance_matrix = coupling.distance_matrix
+        if self._cdists is None or self._cdists[0] is not distance_matrix:
+            cdist = np.array(distance_matrix)
+            self._cdists = (distance_matrix, cdist, cdist ** 2)
+        _, cdist, cdist2 = self._cdists
         # Scaling matrix
         scale = np.zeros((num_qubits, num_qubits))
 
@@ -186,7 +193,6 @@ class StochasticSwap(TransformationPass):
                 trial_circuit.add_qreg(qubit.register)
 
         edges = np.asarray(coupling.get_edges(), dtype=np.int32).ravel()
-        cdist = coupling._dist_matrix
         for trial in range(trials):
             logger.debug("layer_permutation: trial %s", trial)
             # This is one Trial --------------------------------------
@@ -227,29 +233,22 @@ class StochasticSwap(TransformationPass):
         best_lay = best_layout.to_layout(qregs)
         return True, best_circuit, best_depth, best_lay
 
-    def _layer_update(self, i, best_layout, best_depth,
-                      best_circuit, layer_list):
-        """Provide a DAGCircuit for a new mapped layer.
+    def _layer_update(self, dagcircuit_output, layer, best_layout, best_depth,
+                      best_circuit):
+        """Add a new mapped layer to the output DAGCircuit.
 
         Args:
-            i (int): layer number
+            dagcircuit_output (DAGCircuit): the output DAGCircuit that the
+                _mapper method is building
+            layer (dict): the layer, a view from DAGCircuit layer_views()
+                or serial_layer_views() method
             best_layout (Layout): layout returned from _layer_permutation
             best_depth (int): depth returned from _layer_permutation
             best_circuit (DAGCircuit): swap circuit returned from _layer_permutation
-            layer_list (list): list of DAGCircuit objects for each layer,
-                output of DAGCircuit layers() method
-
-        Returns:
-            DAGCircuit: a DAGCircuit object to append to the output DAGCircuit
-                that the _mapper method is building.
         """
         layout = best_layout
         logger.debug("layer_update: layout = %s", layout)
         logger.debug("layer_update: self.trivial_layout = %s", self.trivial_layout)
-        dagcircuit_output = DAGCircuit()
-        for qubit in layout.get_virtual_bits().keys():
-            if qubit.register not in dagcircuit_output.qregs.values():
-                dagcircuit_output.add_qreg(qubit.register)
 
         # Output any swaps
         if best_depth > 0:
@@ -259,14 +258,12 @@ class StochasticSwap(TransformationPass):
         else:
             logger.debug("layer_update: there are no swaps in this layer")
         # Output this layer
-        layer_circuit = layer_list[i]["graph"]
-        for creg in layer_circuit.cregs.values():
-            dagcircuit_output.add_creg(creg)
-
-        order = layout.reorder_bits(dagcircuit_output.qubits)
-        dagcircuit_output.compose(layer_circuit, qubits=order)
-
-        return dagcircuit_output
+        qubits = dagcircuit_output.qubits
+        for node in layer["nodes"]:
+            dagcircuit_output.apply_operation_back(node.op,
+                                                   [qubits[layout[qarg]]
+                                                    for qarg in node.qargs],
+                                                   node.cargs)
 
     def _mapper(self, circuit_graph, coupling_graph, trials=20):
         """Map a DAGCircuit onto a CouplingMap using swap gates.
@@ -286,12 +283,6 @@ class StochasticSwap(TransformationPass):
             TranspilerError: if there was any error during the mapping
                 or with the parameters.
         """
-        # Schedule the input circuit by calling layers()
-        layerlist = list(circuit_graph.layers())
-        logger.debug("schedule:")
-        for i, v in enumerate(layerlist):
-            logger.debug("    %d: %s", i, v["partition"])
-
         qubit_subset = self.trivial_layout.get_virtual_bits().keys()
 
         # Find swap circuit to precede each layer of input circuit
@@ -303,8 +294,10 @@ class StochasticSwap(TransformationPass):
 
         logger.debug("trivial_layout = %s", layout)
 
-        # Iterate over layers
-        for i, layer in enumerate(layerlist):
+        # Iterate over the layers of the input circuit, without copying them
+        logger.debug("schedule:")
+        for i, layer in enumerate(circuit_graph.layer_views()):
+            logger.debug("    %d: %s", i, layer["partition"])
 
             # Attempt to find a permutation for this layer
             success_flag, best_circuit, best_depth, best_layout \
@@ -319,10 +312,10 @@ class StochasticSwap(TransformationPass):
             if not success_flag:
                 logger.debug("mapper: failed, layer %d, "
                              "retrying sequentially", i)
-                serial_layerlist = list(layer["graph"].serial_layers())
+                layer_graph = circuit_graph._layer_graph(layer)
 
                 # Go through each gate in the layer
-                for j, serial_layer in enumerate(serial_layerlist):
+                for j, serial_layer in enumerate(layer_graph.serial_layer_views()):
 
                     success_flag, best_circuit, best_depth, best_layout = \
                         self._layer_permutation(
@@ -343,24 +336,22 @@ class StochasticSwap(TransformationPass):
                     # for each inner iteration
                     layout = best_layout
                     # Update the DAG
-                    dagcircuit_output.compose(
-                        self._layer_update(j,
-                                           best_layout,
-                                           best_depth,
-                                           best_circuit,
-                                           serial_layerlist))
+                    self._layer_update(dagcircuit_output,
+                                       serial_layer,
+                                       best_layout,
+                                       best_depth,
+                                       best_circuit)
 
             else:
                 # Update the record of qubit positions for each iteration
                 layout = best_layout
 
                 # Update the DAG
-                dagcircuit_output.compose(
-                    self._layer_update(i,
-                                       best_layout,
-                                       best_depth,
-                                       best_circuit,
-                                       layerlist))
+                self._layer_update(dagcircuit_output,
+                                   layer,
+                                   best_layout,
+                                   best_depth,
+                                   best_circuit)
 
         # This is the final edgemap. We might use it to correctly replace
         # any measurements that needed to be removed earlier.
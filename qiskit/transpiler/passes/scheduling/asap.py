@@ -70,7 +70,8 @@ class ASAPSchedule(TransformationPass):
             start_time = max(qubit_time_available[q] for q in node.qargs)
             pad_with_delays(node.qargs, until=start_time, unit=time_unit)
 
-            new_node = new_dag.apply_operation_back(node.op, node.qargs, node.cargs, node.condition)
+            new_node = new_dag.apply_operation_back(node.op.to_mutable(), node.qargs, node.cargs,
+                                                    node.condition)
             duration = self.durations.get(node.op, node.qargs, unit=time_unit)
             # set duration for each instruction (tricky but necessary)
             new_node.op.duration = duration
@@ -25,6 +25,9 @@ class DAGFixedPoint(AnalysisPass):
     ``property_set['dag_fixed_point']`` as a boolean.
     """
 
+    # The pass compares the values of its successive runs
+    stateless = False
+
     def run(self, dag):
         """Run the DAGFixedPoint pass on `dag`."""
         if self.property_set['_dag_fixed_point_previous_dag'] is None:
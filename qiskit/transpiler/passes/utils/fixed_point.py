@@ -25,6 +25,9 @@ class FixedPoint(AnalysisPass):
     as a boolean.
     """
 
+    # The pass compares the values of its successive runs
+    stateless = False
+
     def __init__(self, property_to_check):
         """FixedPoint initializer.
 
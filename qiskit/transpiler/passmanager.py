@@ -18,11 +18,13 @@ from typing import Union, List, Callable, Dict, Any
 import dill
 
 from qiskit.visualization import pass_manager_drawer
-from qiskit.tools.parallel import parallel_map
+from qiskit.tools.parallel import (parallel_map, active_pool, worker_cached_loads,
+                                   worker_preloaded)
 from qiskit.circuit import QuantumCircuit
 from .basepasses import BasePass
 from .exceptions import TranspilerError
 from .runningpassmanager import RunningPassManager
+from .profiling import TranspileProfile
 
 
 class PassManager:
@@ -58,6 +60,9 @@ class PassManager:
         # Populated via PassManager.append().
 
         self._pass_sets = []
+        # Number of changes of the schedule, which tells whether a copy of the
+        # pass manager preloaded in a ParallelPool is still up to date.
+        self._schedule_version = 0
         if passes is not None:
             self.append(passes)
         self.max_iteration = max_iteration
@@ -91,6 +96,7 @@ class PassManager:
 
         passes = PassManager._normalize_passes(passes)
         self._pass_sets.append({'passes': passes, 'flow_controllers': flow_controller_conditions})
+        self._schedule_version += 1
 
     def replace(
             self,
@@ -126,6 +132,7 @@ class PassManager:
                                       'flow_controllers': flow_controller_conditions}
         except IndexError:
             raise TranspilerError('Index to replace %s does not exists' % index)
+        self._schedule_version += 1
 
     def remove(self, index: int) -> None:
         """Removes a particular pass in the scheduler.
@@ -140,6 +147,7 @@ class PassManager:
             del self._pass_sets[index]
         except IndexError:
             raise TranspilerError('Index to replace %s does not exists' % index)
+        self._schedule_version += 1
 
     def __setitem__(self, index, item):
         self.replace(index, item)
@@ -184,7 +192,8 @@ class PassManager:
             self,
             circuits: Union[QuantumCircuit, List[QuantumCircuit]],
             output_name: str = None,
-            callback: Callable = None
+            callback: Callable = None,
+            profile: TranspileProfile = None
     ) -> Union[QuantumCircuit, List[QuantumCircuit]]:
         """Run all the passes on the specified ``circuits``.
 
@@ -218,15 +227,19 @@ class PassManager:
                         count = kwargs['count']
                         ...
 
+            profile: A profile in which to record the statistics of every pass run
+                (wall time, DAG size, peak memory), including the ones run in parallel
+                worker processes.
+
         Returns:
             The transformed circuit(s).
         """
         if isinstance(circuits, QuantumCircuit):
-            return self._run_single_circuit(circuits, output_name, callback)
+            return self._run_single_circuit(circuits, output_name, callback, profile)
         elif len(circuits) == 1:
-            return self._run_single_circuit(circuits[0], output_name, callback)
+            return self._run_single_circuit(circuits[0], output_name, callback, profile)
         else:
-            return self._run_several_circuits(circuits, output_name, callback)
+            return self._run_several_circuits(circuits, output_name, callback, profile)
 
     def _create_running_passmanager(self) -> RunningPassManager:
         running_passmanager = RunningPassManager(self.max_iteration)
@@ -235,17 +248,27 @@ class PassManager:
         return running_passmanager
 
     @staticmethod
-    def _in_parallel(circuit, pm_dill=None) -> QuantumCircuit:
-        """Task used by the parallel map tools from ``_run_several_circuits``."""
-        running_passmanager = dill.loads(pm_dill)._create_running_passmanager()
-        result = running_passmanager.run(circuit)
-        return result
+    def _in_parallel(circuit, pm_dill=None, pm_key=None, profile_memory=None):
+        """Task used by the parallel map tools from ``_run_several_circuits``.
+
+        When ``profile_memory`` is set, the profile of the run is returned with the circuit.
+        """
+        if pm_key is not None:
+            pass_manager = worker_preloaded(pm_key)
+        else:
+            pass_manager = worker_cached_loads(pm_dill)
+        running_passmanager = pass_manager._create_running_passmanager()
+        if profile_memory is None:
+            return running_passmanager.run(circuit)
+        profile = TranspileProfile(memory=profile_memory)
+        return running_passmanager.run(circuit, profile=profile), profile
 
     def _run_several_circuits(
             self,
             circuits: List[QuantumCircuit],
             output_name: str = None,
-            callback: Callable = None
+            callback: Callable = None,
+            profile: TranspileProfile = None
     ) -> List[QuantumCircuit]:
         """Run all the passes on the specified ``circuits``.
 
@@ -254,6 +277,7 @@ class PassManager:
             output_name: The output circuit name. If ``None``, it will be set to the same as the
                 input circuit name.
             callback: A callback function that will be called after each pass execution.
+            profile: A profile in which to record the statistics of the passes.
 
         Returns:
             The transformed circuits.
@@ -262,14 +286,28 @@ class PassManager:
         del output_name
         del callback
 
-        return parallel_map(PassManager._in_parallel, circuits,
-                            task_kwargs={'pm_dill': dill.dumps(self)})
+        pool = active_pool()
+        pm_key = pool.pass_manager_key(self) if pool is not None else None
+        if pm_key is not None:
+            # The workers already hold this pass manager, only send its key.
+            task_kwargs = {'pm_key': pm_key}
+        else:
+            task_kwargs = {'pm_dill': dill.dumps(self)}
+        if profile is None:
+            return parallel_map(PassManager._in_parallel, circuits, task_kwargs=task_kwargs)
+
+        task_kwargs['profile_memory'] = profile.memory
+        results = parallel_map(PassManager._in_parallel, circuits, task_kwargs=task_kwargs)
+        for _, circuit_profile in results:
+            profile.merge(circuit_profile)
+        return [circuit for circuit, _ in results]
 
     def _run_single_circuit(
             self,
             circuit: QuantumCircuit,
             output_name: str = None,
-            callback: Callable = None
+            callback: Callable = None,
+            profile: TranspileProfile = None
     ) -> QuantumCircuit:
         """Run all the passes on a ``circuit``.
 
@@ -278,6 +316,7 @@ class PassManager:
             output_name: The output circuit name. If ``None``, it will be set to the same as the
                 input circuit name.
             callback: A callback function that will be called after each pass execution.
+            profile: A profile in which to record the statistics of the passes.
 
         Returns:
             The transformed circuit.
@@ -285,7 +324,8 @@ class PassManager:
         running_passmanager = self._create_running_passmanager()
         if callback is None and self.callback:  # TODO to remove with __init__(callback)
             callback = self.callback
-        result = running_passmanager.run(circuit, output_name=output_name, callback=callback)
+        result = running_passmanager.run(circuit, output_name=output_name, callback=callback,
+                                         profile=profile)
         self.property_set = running_passmanager.property_set
         return result
 
@@ -0,0 +1,212 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Aggregated profile of the passes run by pass managers."""
+
+import json
+import tracemalloc
+from collections import OrderedDict
+
+
+class TranspileProfile:
+    """Statistics of the passes run while transpiling one or more circuits.
+
+    For every pass (identified by its name), the profile aggregates the number
+    of times it ran, its wall time, the size of the DAG before and after it and,
+    if ``memory`` is set, the peak memory it allocated. The statistics of the
+    circuits transpiled in parallel worker processes are merged into it.
+
+    .. code-block:: python
+
+        from qiskit.compiler import transpile
+        from qiskit.transpiler import TranspileProfile
+
+        profile = TranspileProfile()
+        transpile(circuits, backend, profile=profile)
+        print(profile.to_text(sort_by='time'))
+
+        import pandas
+        dataframe = pandas.DataFrame(profile.records())
+    """
+
+    # The columns of the text report: key in the records, header and format.
+    _COLUMNS = [('calls', 'ncalls', '{:>8d}'),
+                ('time', 'tottime', '{:>10.4f}'),
+                ('time_per_call', 'percall', '{:>10.4f}'),
+                ('max_time', 'maxtime', '{:>10.4f}'),
+                ('mean_size_before', 'size_in', '{:>10.1f}'),
+                ('mean_size_after', 'size_out', '{:>10.1f}'),
+                ('peak_memory', 'peak_mem', '{:>10}')]
+
+    def __init__(self, memory=False):
+        """Create an empty profile.
+
+        Args:
+            memory (bool): Whether to measure the peak memory allocated by each pass
+                with :mod:`tracemalloc`. This slows down the passes significantly.
+        """
+        self.memory = memory
+        self.num_circuits = 0
+        self._passes = OrderedDict()
+
+    def __len__(self):
+        return len(self._passes)
+
+    def __contains__(self, name):
+        return name in self._passes
+
+    def __getitem__(self, name):
+        return dict(self._passes[name])
+
+    def start_pass(self):
+        """Start measuring the memory allocated by a pass.
+
+        Returns:
+            bool: whether the memory tracing was started, and must be stopped by
+            :meth:`stop_pass`.
+        """
+        if not self.memory or tracemalloc.is_tracing():
+            return False
+        tracemalloc.start()
+        return True
+
+    def stop_pass(self, started):
+        """Stop measuring the memory allocated by a pass.
+
+        Args:
+            started (bool): the value returned by :meth:`start_pass`.
+
+        Returns:
+            int: the peak memory allocated by the pass in bytes, or ``None`` if it
+            was not measured.
+        """
+        if not started:
+            return None
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak
+
+    def add(self, name, time, size_before, size_after, peak_memory=None):
+        """Record one run of a pass.
+
+        Args:
+            name (str): the name of the pass.
+            time (float): the wall time of the run, in seconds.
+            size_before (int): the number of operations of the DAG before the pass.
+            size_after (int): the number of operations of the DAG after the pass.
+            peak_memory (int): the peak memory allocated by the pass in bytes, if known.
+        """
+        stats = self._passes.get(name)
+        if stats is None:
+            stats = self._passes[name] = {'calls': 0, 'time': 0.0, 'max_time': 0.0,
+                                          'size_before': 0, 'size_after': 0,
+                                          'peak_memory': None}
+        stats['calls'] += 1
+        stats['time'] += time
+        stats['max_time'] = max(stats['max_time'], time)
+        stats['size_before'] += size_before
+        stats['size_after'] += size_after
+        if peak_memory is not None:
+            stats['peak_memory'] = max(stats['peak_memory'] or 0, peak_memory)
+
+    def merge(self, other):
+        """Add the statistics of another profile to this one.
+
+        Args:
+            other (TranspileProfile): the profile to merge.
+        """
+        self.num_circuits += other.num_circuits
+        for name, other_stats in other._passes.items():
+            stats = self._passes.get(name)
+            if stats is None:
+                self._passes[name] = dict(other_stats)
+                continue
+            stats['calls'] += other_stats['calls']
+            stats['time'] += other_stats['time']
+            stats['max_time'] = max(stats['max_time'], other_stats['max_time'])
+            stats['size_before'] += other_stats['size_before']
+            stats['size_after'] += other_stats['size_after']
+            if other_stats['peak_memory'] is not None:
+                stats['peak_memory'] = max(stats['peak_memory'] or 0,
+                                           other_stats['peak_memory'])
+
+    @property
+    def total_time(self):
+        """The total wall time of all the passes, in seconds."""
+        return sum(stats['time'] for stats in self._passes.values())
+
+    def records(self, sort_by=None):
+        """Return the statistics as a list with one flat dictionary per pass.
+
+        The list can be passed directly to ``pandas.DataFrame``.
+
+        Args:
+            sort_by (str): a key of the records to sort them by, in decreasing
+                order. By default the passes are in the order they first ran.
+
+        Returns:
+            list[dict]: the statistics of every pass.
+        """
+        records = []
+        for name, stats in self._passes.items():
+            calls = stats['calls']
+            record = {'pass': name}
+            record.update(stats)
+            record['time_per_call'] = stats['time'] / calls
+            record['mean_size_before'] = stats['size_before'] / calls
+            record['mean_size_after'] = stats['size_after'] / calls
+            records.append(record)
+        if sort_by is not None:
+            records.sort(key=lambda record: (record[sort_by] is not None, record[sort_by]),
+                         reverse=True)
+        return records
+
+    def to_dict(self):
+        """Return the profile as a JSON-serializable dictionary."""
+        return {'num_circuits': self.num_circuits, 'total_time': self.total_time,
+                'passes': self.records()}
+
+    def to_json(self, **kwargs):
+        """Return the profile as a JSON string.
+
+        Args:
+            **kwargs: keyword arguments passed to :func:`json.dumps`.
+
+        Returns:
+            str: the JSON representation of :meth:`to_dict`.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_text(self, sort_by='time'):
+        """Return the profile as a table in the style of :mod:`cProfile` statistics.
+
+        Args:
+            sort_by (str): a key of the records to sort the passes by, in decreasing order.
+
+        Returns:
+            str: the text report.
+        """
+        lines = ['{} pass runs on {} circuit(s) in {:.4f} seconds'.format(
+            sum(stats['calls'] for stats in self._passes.values()), self.num_circuits,
+            self.total_time), '']
+        lines.append(' '.join('{:>{}}'.format(header, 8 if key == 'calls' else 10)
+                              for key, header, _ in self._COLUMNS) + '  pass')
+        for record in self.records(sort_by=sort_by):
+            cells = []
+            for key, _, cell_format in self._COLUMNS:
+                value = record[key]
+                cells.append(cell_format.format('-' if value is None else value))
+            lines.append(' '.join(cells) + '  ' + record['pass'])
+        return '\n'.join(lines)
+
+    def __str__(self):
+        return self.to_text()
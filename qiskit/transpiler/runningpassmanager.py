@@ -56,6 +56,9 @@ class RunningPassManager:
 
         self.count = 0
 
+        # the TranspileProfile recording the statistics of the passes, if profiling.
+        self.profile = None
+
     def append(self, passes, **flow_controller_conditions):
         """Append a Pass to the schedule of passes.
 
@@ -90,7 +93,7 @@ class RunningPassManager:
                 raise TranspilerError('The flow controller parameter %s is not callable' % name)
         return flow_controller
 
-    def run(self, circuit, output_name=None, callback=None):
+    def run(self, circuit, output_name=None, callback=None, profile=None):
         """Run all the passes on a QuantumCircuit
 
         Args:
@@ -98,6 +101,7 @@ class RunningPassManager:
             output_name (str): The output circuit name. If not given, the same as the
                                input circuit
             callback (callable): A callback function that will be called after each pass execution.
+            profile (TranspileProfile): A profile in which to record the statistics of the passes.
         Returns:
             QuantumCircuit: Transformed circuit.
         """
@@ -107,6 +111,9 @@ class RunningPassManager:
 
         if callback:
             self.callback = callback
+        if profile is not None:
+            self.profile = profile
+            profile.num_circuits += 1
 
         for passset in self.working_list:
             for pass_ in passset:
@@ -141,10 +148,11 @@ class RunningPassManager:
 
         # Run the pass itself, if not already run
         if pass_ not in self.valid_passes:
+            version = dag.version
             dag = self._run_this_pass(pass_, dag)
 
             # update the valid_passes property
-            self._update_valid_passes(pass_)
+            self._update_valid_passes(pass_, dag_modified=dag.version != version)
 
         return dag
 
@@ -152,9 +160,21 @@ class RunningPassManager:
         pass_.property_set = self.property_set
         if pass_.is_transformation_pass:
             # Measure time if we have a callback or logging set
+            if self.profile is not None:
+                # Transformation passes may modify the dag in place.
+                size_before = dag.size()
+                tracing = self.profile.start_pass()
             start_time = time()
-            new_dag = pass_.run(dag)
-            end_time = time()
+            try:
+                new_dag = pass_.run(dag)
+            finally:
+                end_time = time()
+                if self.profile is not None:
+                    peak_memory = self.profile.stop_pass(tracing)
+            if self.profile is not None:
+                self.profile.add(pass_.name(), end_time - start_time, size_before,
+                                 new_dag.size() if isinstance(new_dag, DAGCircuit) else 0,
+                                 peak_memory)
             run_time = end_time - start_time
             # Execute the callback function if one is set
             if self.callback:
@@ -165,7 +185,8 @@ class RunningPassManager:
                 self.count += 1
             self._log_pass(start_time, end_time, pass_.name())
             if isinstance(new_dag, DAGCircuit):
-                new_dag.calibrations = dag.calibrations
+                if new_dag is not dag:
+                    new_dag.calibrations = dag.calibrations
             else:
                 raise TranspilerError("Transformation passes should return a transformed dag."
                                       "The pass %s is returning a %s" % (type(pass_).__name__,
@@ -173,9 +194,18 @@ class RunningPassManager:
             dag = new_dag
         elif pass_.is_analysis_pass:
             # Measure time if we have a callback or logging set
+            if self.profile is not None:
+                tracing = self.profile.start_pass()
             start_time = time()
-            pass_.run(FencedDAGCircuit(dag))
-            end_time = time()
+            try:
+                pass_.run(FencedDAGCircuit(dag))
+            finally:
+                end_time = time()
+                if self.profile is not None:
+                    peak_memory = self.profile.stop_pass(tracing)
+            if self.profile is not None:
+                size = dag.size()
+                self.profile.add(pass_.name(), end_time - start_time, size, size, peak_memory)
             run_time = end_time - start_time
             # Execute the callback function if one is set
             if self.callback:
@@ -194,10 +224,20 @@ class RunningPassManager:
             name, (end_time - start_time) * 1000)
         logger.info(log_msg)
 
-    def _update_valid_passes(self, pass_):
+    def _update_valid_passes(self, pass_, dag_modified=True):
         self.valid_passes.add(pass_)
-        if not pass_.is_analysis_pass:  # Analysis passes preserve all
-            self.valid_passes.intersection_update(set(pass_.preserves))
+        if pass_.is_analysis_pass:  # Analysis passes preserve all
+            return
+        preserves = set(pass_.preserves)
+        if dag_modified:
+            self.valid_passes.intersection_update(preserves)
+        else:
+            # The analyses of the unmodified DAG are still valid, except the
+            # ones keeping a state between their runs (e.g. the fixed point
+            # passes, which must run again to find that nothing changed).
+            self.valid_passes = {valid_pass for valid_pass in self.valid_passes
+                                 if valid_pass in preserves or
+                                 (valid_pass.is_analysis_pass and valid_pass.stateless)}
 
 
 class FlowController():
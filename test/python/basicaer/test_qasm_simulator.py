@@ -263,6 +263,49 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
         for mem in memory:
             self.assertIn(mem, ['10 00', '10 11'])
 
+    def test_memory_int_format(self):
+        """Test memory as an array of integers."""
+        qr = QuantumRegister(4, 'qr')
+        cr0 = ClassicalRegister(2, 'cr0')
+        cr1 = ClassicalRegister(2, 'cr1')
+        circ = QuantumCircuit(qr, cr0, cr1)
+        circ.h(qr[0])
+        circ.cx(qr[0], qr[1])
+        circ.x(qr[3])
+        circ.measure(qr[0], cr0[0])
+        circ.measure(qr[1], cr0[1])
+        circ.measure(qr[2], cr1[0])
+        circ.measure(qr[3], cr1[1])
+
+        shots = 50
+        qobj = assemble(transpile(circ, backend=self.backend), shots=shots, memory=True,
+                        seed_simulator=self.seed)
+        result = self.backend.run(qobj, backend_options={'memory_format': 'int'}).result()
+        memory = result.data(0)['memory']
+        self.assertIsInstance(memory, np.ndarray)
+        self.assertEqual(len(memory), shots)
+        self.assertTrue(set(memory.tolist()) <= {0b1000, 0b1011})
+        self.assertEqual(result.get_counts(0),
+                         {'10 00': np.count_nonzero(memory == 0b1000),
+                          '10 11': np.count_nonzero(memory == 0b1011)})
+        for mem in result.get_memory():
+            self.assertIn(mem, ['10 00', '10 11'])
+
+    def test_memory_formats_agree(self):
+        """Test the int and hex memory formats give the same samples."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circ = QuantumCircuit(qr, cr)
+        circ.h(qr)
+        circ.measure(qr, cr)
+
+        qobj = assemble(transpile(circ, backend=self.backend), shots=1000, memory=True,
+                        seed_simulator=self.seed)
+        hex_memory = self.backend.run(qobj).result().data(0)['memory']
+        int_memory = self.backend.run(
+            qobj, backend_options={'memory_format': 'int'}).result().data(0)['memory']
+        self.assertEqual(hex_memory, [hex(value) for value in int_memory])
+
     def test_unitary(self):
         """Test unitary gate instruction"""
         max_qubits = 4
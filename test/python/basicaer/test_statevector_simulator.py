@@ -18,7 +18,8 @@ import numpy as np
 from qiskit.providers.basicaer import StatevectorSimulatorPy
 from qiskit.test import ReferenceCircuits
 from qiskit.test import providers
-from qiskit import QuantumRegister, QuantumCircuit, execute
+from qiskit import QuantumRegister, QuantumCircuit, execute, transpile, assemble
+from qiskit.circuit.random import random_circuit
 from qiskit.quantum_info.random import random_unitary
 from qiskit.quantum_info import state_fidelity
 
@@ -114,6 +115,15 @@ class StatevectorSimulatorTest(providers.BackendTestCase):
         expected = np.exp(1j * 0.6) * np.repeat([[0], [1]], [n_qubits**2-1, 1])
         self.assertTrue(np.allclose(actual, expected))
 
+    def test_gate_fusion(self):
+        """Test the statevector is the same with and without gate fusion"""
+        circuit = random_circuit(5, 12, max_operands=3, seed=42)
+        qobj = assemble(transpile(circuit, self.backend, seed_transpiler=42))
+        fused = self.backend.run(qobj).result().get_statevector(0)
+        unfused = self.backend.run(qobj, backend_options={'gate_fusion': False}
+                                   ).result().get_statevector(0)
+        np.testing.assert_allclose(fused, unfused, atol=1e-10)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,14 +16,16 @@ import unittest
 
 import numpy as np
 
-from qiskit import execute
+from qiskit import execute, transpile, assemble
 from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
 from qiskit.providers.basicaer import UnitarySimulatorPy
+from qiskit.providers.basicaer.basicaertools import fuse_gates
+from qiskit.circuit.random import random_circuit
 from qiskit.quantum_info.operators.predicates import matrix_equal
 from qiskit.test import ReferenceCircuits
 from qiskit.test import providers
 from qiskit.quantum_info.random import random_unitary
-from qiskit.quantum_info import process_fidelity
+from qiskit.quantum_info import process_fidelity, Operator
 
 
 class BasicAerUnitarySimulatorPyTest(providers.BackendTestCase):
@@ -117,6 +119,33 @@ class BasicAerUnitarySimulatorPyTest(providers.BackendTestCase):
                 fidelity = process_fidelity(unitary_target, unitary_out)
                 self.assertGreater(fidelity, 0.999)
 
+    def test_gate_fusion(self):
+        """Test the unitary is the same with and without gate fusion"""
+        circuit = random_circuit(4, 12, max_operands=2, seed=42)
+        qobj = assemble(transpile(circuit, self.backend, seed_transpiler=42))
+        fused = self.backend.run(qobj).result().get_unitary(0)
+        unfused = self.backend.run(qobj, backend_options={'gate_fusion': False}
+                                   ).result().get_unitary(0)
+        self.assertTrue(matrix_equal(fused, unfused, atol=1e-10))
+
+    def test_fuse_gates(self):
+        """Test the gates on at most two qubits are fused into unitaries"""
+        qr = QuantumRegister(3)
+        circuit = QuantumCircuit(qr)
+        circuit.h(qr[0])
+        circuit.h(qr[1])
+        circuit.cx(qr[0], qr[1])
+        circuit.t(qr[2])
+        circuit.cx(qr[1], qr[2])
+        circuit.h(qr[2])
+        qobj = assemble(transpile(circuit, self.backend))
+        instructions = fuse_gates(qobj.experiments[0].instructions)
+        self.assertEqual([(instruction.name, instruction.qubits)
+                          for instruction in instructions],
+                         [('unitary', [0, 1]), ('unitary', [2, 1])])
+        unitary = self.backend.run(qobj).result().get_unitary(0)
+        self.assertTrue(matrix_equal(unitary, Operator(circuit).data, ignore_phase=True))
+
 
 if __name__ == '__main__':
     unittest.main()
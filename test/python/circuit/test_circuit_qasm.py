@@ -12,6 +12,7 @@
 
 """Test Qiskit's QuantumCircuit class."""
 
+import io
 from math import pi
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
@@ -171,6 +172,8 @@ my_gate qr[0];
 my_gate_{1} qr[0];
 my_gate_{0} qr[0];\n""".format(my_gate_inst3_id, my_gate_inst2_id)
         self.assertEqual(circuit.qasm(), expected_qasm)
+        self.assertEqual(circuit.qasm(), expected_qasm)
+        self.assertEqual([inst.name for inst, _, _ in circuit.data], ['my_gate'] * 3)
 
     def test_circuit_qasm_pi(self):
         """Test circuit qasm() method with pi params.
@@ -212,3 +215,28 @@ nG0(pi,pi/2) q[0],r[0];\n"""
         qc = QuantumCircuit.from_qasm_str(original_str)
 
         self.assertEqual(original_str, qc.qasm())
+
+    def test_circuit_qasm_streaming(self):
+        """Test iter_qasm() and dump_qasm() give the program of qasm()."""
+        composite_circ = QuantumCircuit(2, name="composite_circ")
+        composite_circ.h(0)
+        composite_circ.cx(0, 1)
+        composite_circ_instr = composite_circ.to_instruction()
+
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        qc = QuantumCircuit(qr, cr)
+        qc.append(composite_circ_instr, [0, 1])
+        qc.append(random_unitary(4, seed=42), [1, 0])
+        qc.rz(pi / 4, 0).c_if(cr, 1)
+        qc.measure(qr, cr)
+        expected_qasm = qc.qasm()
+
+        statements = list(qc.iter_qasm())
+        self.assertEqual(statements[:3], ['OPENQASM 2.0;\n', 'include "qelib1.inc";\n',
+                                          'gate composite_circ q0,q1 { h q0; cx q0,q1; }\n'])
+        self.assertEqual(''.join(statements), expected_qasm)
+
+        file = io.StringIO()
+        qc.dump_qasm(file)
+        self.assertEqual(file.getvalue(), expected_qasm)
@@ -0,0 +1,113 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""Test Qiskit's CommutationLibrary class."""
+
+import os
+import tempfile
+
+from qiskit.test import QiskitTestCase
+
+from qiskit.circuit import CommutationLibrary, QuantumCircuit, QuantumRegister, Parameter
+from qiskit.circuit.library import (CXGate, CZGate, HGate, RXGate, RZGate, RZZGate,
+                                    SwapGate, U3Gate, XGate, ZGate)
+
+
+class TestCommutationLibrary(QiskitTestCase):
+    """Test the commutation relations computed and stored by the library."""
+
+    def setUp(self):
+        super().setUp()
+        self.qr = QuantumRegister(3)
+        self.library = CommutationLibrary()
+
+    def test_disjoint_qubits(self):
+        """Test that operations on disjoint qubits commute."""
+        qr = self.qr
+        self.assertTrue(self.library.commute(HGate(), [qr[0]], XGate(), [qr[1]]))
+        self.assertEqual(len(self.library), 0)
+
+    def test_commute_by_bases(self):
+        """Test the relations decided without computing matrices."""
+        qr = self.qr
+        theta = Parameter('theta')
+        self.assertTrue(self.library.commute(CXGate(), [qr[0], qr[1]],
+                                             RZGate(theta), [qr[0]]))
+        self.assertTrue(self.library.commute(CXGate(), [qr[0], qr[1]],
+                                             CXGate(), [qr[0], qr[2]]))
+        self.assertTrue(self.library.commute(CXGate(), [qr[0], qr[1]],
+                                             CXGate(), [qr[2], qr[1]]))
+        self.assertTrue(self.library.commute(CZGate(), [qr[0], qr[1]],
+                                             RZZGate(0.5), [qr[1], qr[2]]))
+        self.assertEqual(len(self.library), 0)
+
+    def test_commute_by_matrices(self):
+        """Test the relations computed from the matrices of the operations."""
+        qr = self.qr
+        self.assertFalse(self.library.commute(CXGate(), [qr[0], qr[1]],
+                                              CXGate(), [qr[1], qr[0]]))
+        self.assertFalse(self.library.commute(HGate(), [qr[0]], ZGate(), [qr[0]]))
+        self.assertTrue(self.library.commute(SwapGate(), [qr[0], qr[1]],
+                                             CZGate(), [qr[0], qr[1]]))
+        self.assertTrue(self.library.commute(U3Gate(0, 0, 0.3), [qr[0]],
+                                             RZGate(0.1), [qr[0]]))
+        self.assertEqual(len(self.library), 4)
+
+    def test_cached_relations(self):
+        """Test that a relation is stored independently of the qubits."""
+        qr = self.qr
+        self.assertFalse(self.library.commute(RXGate(0.1), [qr[0]], ZGate(), [qr[0]]))
+        self.assertFalse(self.library.commute(RXGate(0.1), [qr[2]], ZGate(), [qr[2]]))
+        self.assertEqual(len(self.library), 1)
+        self.library.clear()
+        self.assertEqual(len(self.library), 0)
+
+    def test_relations_not_shared(self):
+        """Test that operations with the same name and parameters do not share relations."""
+        qr = self.qr
+        self.assertFalse(self.library.commute(CXGate(), [qr[0], qr[1]],
+                                              CXGate(), [qr[1], qr[0]]))
+        self.assertFalse(self.library.commute(CXGate(ctrl_state=0), [qr[0], qr[1]],
+                                              CXGate(), [qr[1], qr[0]]))
+        self.assertEqual(len(self.library), 2)
+
+        commuting = QuantumCircuit(1, name='my_gate')
+        commuting.z(0)
+        non_commuting = QuantumCircuit(1, name='my_gate')
+        non_commuting.x(0)
+        self.assertTrue(self.library.commute(commuting.to_gate(), [qr[0]],
+                                             ZGate(), [qr[0]]))
+        self.assertFalse(self.library.commute(non_commuting.to_gate(), [qr[0]],
+                                              ZGate(), [qr[0]]))
+        self.assertEqual(len(self.library), 2)
+
+    def test_max_size(self):
+        """Test that the least recently used relations are discarded."""
+        qr = self.qr
+        library = CommutationLibrary(max_size=2)
+        for angle in [0.1, 0.2, 0.3]:
+            self.assertFalse(library.commute(RXGate(angle), [qr[0]], ZGate(), [qr[0]]))
+        self.assertEqual(len(library), 2)
+
+    def test_save_load(self):
+        """Test saving the library to a file and loading it back."""
+        qr = self.qr
+        self.library.commute(CXGate(), [qr[0], qr[1]], CXGate(), [qr[1], qr[0]])
+        self.library.commute(SwapGate(), [qr[0], qr[1]], CZGate(), [qr[0], qr[1]])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'commutations.pickle')
+            self.library.save(filename)
+            library = CommutationLibrary()
+            library.load(filename)
+        self.assertEqual(len(library), 2)
+        self.assertEqual(library._cache, self.library._cache)
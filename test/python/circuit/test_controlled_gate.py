@@ -1061,7 +1061,7 @@ class TestOpenControlledToMatrix(QiskitTestCase):
             free_params[1] = 3
         elif gate_class in [MCXGate]:
             free_params[0] = 3
-        cgate = gate_class(*free_params)
+        cgate = gate_class(*free_params).to_mutable()
         cgate.ctrl_state = ctrl_state
 
         base_mat = Operator(cgate.base_gate).data
@@ -0,0 +1,102 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test bulk binding of parameterized circuits."""
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector, ParameterBinder
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.test import QiskitTestCase
+
+
+class TestParameterBinder(QiskitTestCase):
+    """Test the ParameterBinder."""
+
+    def setUp(self):
+        super().setUp()
+        self.theta = Parameter('θ')
+        self.phi = Parameter('φ')
+        self.circuit = QuantumCircuit(2, global_phase=self.phi / 2)
+        self.circuit.ry(self.theta, 0)
+        self.circuit.cx(0, 1)
+        self.circuit.rz(2 * self.phi + self.theta, 1)
+        self.circuit.u3(self.theta, self.phi, 0.5, 0)
+
+    def test_bind_matches_bind_parameters(self):
+        """Test the bound circuits match QuantumCircuit.bind_parameters."""
+        values = np.random.RandomState(seed=42).random_sample((5, 2))
+        binder = ParameterBinder(self.circuit, [self.theta, self.phi])
+        bound_circuits = binder.bind(values)
+
+        self.assertEqual(len(bound_circuits), 5)
+        for (theta, phi), bound in zip(values, bound_circuits):
+            expected = self.circuit.bind_parameters({self.theta: theta, self.phi: phi})
+            self.assertEqual(bound, expected)
+            self.assertEqual(bound.parameters, set())
+            self.assertAlmostEqual(bound.global_phase, phi / 2)
+
+    def test_template_unchanged(self):
+        """Test binding leaves the parameterized circuit untouched."""
+        binder = ParameterBinder(self.circuit)
+        binder.bind([[0.1, 0.2]])
+        self.assertEqual(self.circuit.parameters, {self.theta, self.phi})
+        self.assertIsInstance(self.circuit.data[0][0].params[0], Parameter)
+
+    def test_value_formats(self):
+        """Test the accepted formats for the values to bind."""
+        binder = ParameterBinder(self.circuit, [self.theta, self.phi])
+        expected = binder.evaluate([[0.1, 0.2], [0.3, 0.4]])
+        from_dict = binder.evaluate({self.theta: [0.1, 0.3], self.phi: [0.2, 0.4]})
+        from_binds = binder.evaluate([{self.theta: 0.1, self.phi: 0.2},
+                                      {self.phi: 0.4, self.theta: 0.3}])
+        np.testing.assert_allclose(from_dict, expected)
+        np.testing.assert_allclose(from_binds, expected)
+
+    def test_parameter_vector(self):
+        """Test binding a circuit parameterized by a ParameterVector."""
+        circuit = RealAmplitudes(3, reps=2)
+        params = ParameterVector('θ', circuit.num_parameters)
+        circuit = circuit.assign_parameters(params)
+        values = np.arange(2 * circuit.num_parameters).reshape(2, -1) / 10
+
+        bound_circuits = ParameterBinder(circuit, [params]).bind({params: values})
+        for row, bound in zip(values, bound_circuits):
+            self.assertEqual(bound, circuit.bind_parameters({params: row}))
+
+    def test_parameter_mismatch(self):
+        """Test an error is raised when the parameters do not match the circuit."""
+        with self.assertRaises(CircuitError):
+            ParameterBinder(self.circuit, [self.theta])
+        with self.assertRaises(CircuitError):
+            ParameterBinder(self.circuit, [self.theta, self.phi, self.theta])
+        binder = ParameterBinder(self.circuit)
+        with self.assertRaises(CircuitError):
+            binder.bind([[0.1, 0.2, 0.3]])
+        with self.assertRaises(CircuitError):
+            binder.bind({self.theta: [0.1]})
+
+    def test_extra_parameters(self):
+        """Test the values of parameters not in the circuit are ignored."""
+        unused = Parameter('unused')
+        binder = ParameterBinder(self.circuit, [self.theta, unused, self.phi])
+        bound = binder.bind([[0.1, 7, 0.2]])[0]
+        self.assertEqual(bound, self.circuit.bind_parameters({self.theta: 0.1, self.phi: 0.2}))
+
+    def test_division_by_zero(self):
+        """Test values making an expression infinite raise."""
+        circuit = QuantumCircuit(1)
+        circuit.rz(1 / self.theta, 0)
+        with self.assertRaises(ZeroDivisionError):
+            ParameterBinder(circuit).bind([[0]])
@@ -611,7 +611,6 @@ class TestParameters(QiskitTestCase):
         self.assertEqual(len(qobj.experiments), 1)
         self.assertEqual(len(qobj.experiments[0].instructions), 4)
         self.assertTrue(all(len(inst.params) == 1
-                            and isinstance(inst.params[0], ParameterExpression)
                             and float(inst.params[0]) == 1
                             for inst in qobj.experiments[0].instructions))
 
@@ -940,6 +939,42 @@ class TestParameterExpressions(QiskitTestCase):
         bound_expr = (x + y).bind({x: 2.3, y: 0.8})
         self.assertEqual(int(bound_expr), 3)
 
+    def test_evaluate(self):
+        """Verify numeric evaluation of an expression, on scalars and arrays."""
+        x = Parameter('x')
+        y = Parameter('y')
+        expr = 2 * x - x * y / 4
+
+        self.assertAlmostEqual(expr.evaluate({x: 1.5, y: 2}), 2.25)
+        values = expr.evaluate({x: numpy.array([1.5, 0.5]), y: numpy.array([2, 4])})
+        numpy.testing.assert_allclose(values, [2.25, 0.5])
+        with self.assertRaises(CircuitError):
+            expr.evaluate({x: 1.5})
+
+    def test_compiled_is_cached(self):
+        """Verify the compiled function of an expression is reused."""
+        x = Parameter('x')
+        y = Parameter('y')
+        expr = x * x + y
+
+        function = expr.compiled([x, y])
+        self.assertIs(expr.compiled([x, y]), function)
+        self.assertEqual(function(3, 1), 10)
+        self.assertEqual(expr.compiled([y, x])(3, 1), 4)
+        with self.assertRaises(CircuitError):
+            expr.compiled([x])
+
+    def test_bind_float_matches_symbolic(self):
+        """Verify fully binding with floats matches the symbolic substitution."""
+        x = Parameter('x')
+        y = Parameter('y')
+        expr = (x + 0.5) * y / 3 - x
+
+        bound_expr = expr.bind({x: 0.3, y: 1.7})
+        self.assertEqual(bound_expr.parameters, set())
+        self.assertAlmostEqual(float(bound_expr), (0.3 + 0.5) * 1.7 / 3 - 0.3)
+        self.assertAlmostEqual(float(bound_expr), float(expr.bind({x: 0.3}).bind({y: 1.7})))
+
     def test_raise_if_cast_to_int_when_not_fully_bound(self):
         """Verify raises if casting to int and not fully bound."""
 
@@ -0,0 +1,160 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""Test the QPY serialization of circuits."""
+
+import io
+import pickle
+
+from qiskit.test import QiskitTestCase
+
+from qiskit.circuit import (QuantumCircuit, QuantumRegister, ClassicalRegister,
+                            AncillaRegister, Parameter, Gate)
+from qiskit.circuit import qpy_serialization
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.library import CXGate, XGate
+from qiskit.quantum_info import random_unitary
+
+
+class TestQpySerialization(QiskitTestCase):
+    """Test the round trip of circuits through the QPY format."""
+
+    def assertRoundTrip(self, circuit):
+        """Assert a circuit is loaded back unchanged."""
+        new_circuit = qpy_serialization.loads(qpy_serialization.dumps(circuit))[0]
+        self.assertEqual(new_circuit, circuit)
+        self.assertEqual(new_circuit.name, circuit.name)
+        self.assertEqual(new_circuit.qregs, circuit.qregs)
+        self.assertEqual(new_circuit.cregs, circuit.cregs)
+        return new_circuit
+
+    def test_standard_gates(self):
+        """Test a circuit of standard gates, measurements, resets and barriers."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr, name='standard', global_phase=0.5)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.u3(0.1, 0.2, -0.3, 2)
+        circuit.ccx(0, 1, 2)
+        circuit.barrier()
+        circuit.reset(1)
+        circuit.measure(qr, cr)
+        circuit.x(0).c_if(cr, 5)
+        new_circuit = self.assertRoundTrip(circuit)
+        self.assertEqual(new_circuit.global_phase, 0.5)
+        self.assertEqual(new_circuit.data[-1][0].condition, (new_circuit.cregs[0], 5))
+
+    def test_gate_attributes(self):
+        """Test the labels, control states and durations of standard gates."""
+        circuit = QuantumCircuit(2)
+        circuit.append(XGate(label='my_x'), [0])
+        circuit.append(CXGate(ctrl_state=0), [0, 1])
+        circuit.rz(0.1, 1)
+        circuit.data[-1][0].duration = 160
+        new_circuit = self.assertRoundTrip(circuit)
+        self.assertEqual(new_circuit.data[0][0].label, 'my_x')
+        self.assertEqual(new_circuit.data[1][0].ctrl_state, 0)
+        self.assertEqual(new_circuit.data[2][0].duration, 160)
+
+    def test_parameters(self):
+        """Test parameters and parameter expressions are loaded as the same objects."""
+        theta = Parameter('theta')
+        phi = Parameter('phi')
+        circuit = QuantumCircuit(2, global_phase=theta / 2)
+        circuit.rx(theta, 0)
+        circuit.ry(2 * theta + phi, 1)
+        circuit.rzz(phi * theta - 1, 0, 1)
+        new_circuit = self.assertRoundTrip(circuit)
+        self.assertEqual(new_circuit.parameters, {theta, phi})
+        bound = new_circuit.bind_parameters({theta: 0.5, phi: 0.25})
+        self.assertEqual(bound, circuit.bind_parameters({theta: 0.5, phi: 0.25}))
+
+    def test_custom_instructions(self):
+        """Test custom gates and instructions are loaded with their definitions."""
+        sub_circuit = QuantumCircuit(2, 1, name='sub')
+        sub_circuit.h(0)
+        sub_circuit.cx(0, 1)
+        sub_circuit.measure(1, 0)
+        instruction = sub_circuit.to_instruction()
+
+        theta = Parameter('theta')
+        gate_circuit = QuantumCircuit(2, name='gate')
+        gate_circuit.rz(theta, 1)
+        gate_circuit.cx(1, 0)
+        gate = gate_circuit.to_gate()
+
+        circuit = QuantumCircuit(3, 1)
+        circuit.append(instruction, [0, 1], [0])
+        circuit.append(gate, [1, 2])
+        circuit.append(instruction, [1, 2], [0])
+        circuit.append(Gate('opaque', 1, [0.5]), [2])
+        new_circuit = self.assertRoundTrip(circuit)
+        self.assertIs(new_circuit.data[0][0], new_circuit.data[2][0])
+        self.assertEqual(new_circuit.data[1][0].definition, gate.definition)
+        self.assertEqual(new_circuit.parameters, {theta})
+        self.assertIsNone(new_circuit.data[3][0].definition)
+
+    def test_unitary_and_pickled_operations(self):
+        """Test unitary gates and the operations stored as pickles."""
+        circuit = QuantumCircuit(2)
+        circuit.append(random_unitary(4, seed=1234), [0, 1])
+        circuit.initialize([0, 1], 0)
+        circuit.delay(100, 1)
+        self.assertRoundTrip(circuit)
+
+    def test_ancilla_registers(self):
+        """Test the kind of the registers is kept."""
+        circuit = QuantumCircuit(QuantumRegister(2, 'q'), AncillaRegister(1, 'anc'))
+        circuit.cx(0, 2)
+        new_circuit = self.assertRoundTrip(circuit)
+        self.assertIsInstance(new_circuit.qregs[1], AncillaRegister)
+
+    def test_several_circuits(self):
+        """Test writing several circuits to a file."""
+        theta = Parameter('theta')
+        circuits = []
+        for index in range(3):
+            circuit = QuantumCircuit(index + 1, name='circuit%d' % index)
+            circuit.rx(theta, index)
+            circuits.append(circuit)
+        file_obj = io.BytesIO()
+        qpy_serialization.dump(circuits, file_obj)
+        file_obj.seek(0)
+        new_circuits = qpy_serialization.load(file_obj)
+        self.assertEqual(new_circuits, circuits)
+        self.assertEqual([circuit.name for circuit in new_circuits],
+                         ['circuit0', 'circuit1', 'circuit2'])
+        self.assertEqual(len({circuit.parameters.pop() for circuit in new_circuits}), 1)
+
+    def test_smaller_than_pickle(self):
+        """Test the serialization of a deep circuit is smaller than its pickle."""
+        circuit = QuantumCircuit(5, 5)
+        for layer in range(100):
+            for qubit in range(5):
+                circuit.rz(0.1 * layer, qubit)
+            for qubit in range(4):
+                circuit.cx(qubit, qubit + 1)
+        circuit.measure(range(5), range(5))
+        data = qpy_serialization.dumps(circuit)
+        self.assertLess(len(data), len(pickle.dumps(circuit)))
+        self.assertEqual(qpy_serialization.loads(data), [circuit])
+
+    def test_invalid_data(self):
+        """Test loading data which is not in the QPY format."""
+        with self.assertRaises(CircuitError):
+            qpy_serialization.loads(b'not a QPY file')
+        data = qpy_serialization.dumps(QuantumCircuit(1))
+        with self.assertRaises(CircuitError):
+            qpy_serialization.loads(data[:-1])
+        self.assertEqual(len(qpy_serialization.loads(data)), 1)
@@ -0,0 +1,168 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""Test the shared immutable instances of the parameterless standard gates."""
+
+import copy
+import inspect
+import pickle
+
+from qiskit.test import QiskitTestCase
+
+from qiskit.circuit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.library import CXGate, CCXGate, HGate, XGate, RZGate
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+
+
+class TestSingletonGates(QiskitTestCase):
+    """Test the shared immutable instances of the standard gates."""
+
+    def test_shared_instance(self):
+        """Test the gates created without arguments are the same immutable instance."""
+        self.assertIs(HGate(), HGate())
+        self.assertIs(CXGate(), CXGate(label=None, ctrl_state=None))
+        self.assertFalse(HGate().mutable)
+        self.assertIsNot(XGate(label='my_x'), XGate(label='my_x'))
+        self.assertTrue(XGate(label='my_x').mutable)
+        self.assertTrue(CXGate(ctrl_state=0).mutable)
+        self.assertTrue(RZGate(0.5).mutable)
+
+    def test_subclass_not_shared(self):
+        """Test a subclass of a standard gate is created as usual."""
+
+        class MyXGate(XGate):
+            """A subclass of the X gate."""
+
+        self.assertIsNot(MyXGate(), MyXGate())
+        self.assertTrue(MyXGate().mutable)
+
+    def test_immutable(self):
+        """Test the shared instances cannot be modified."""
+        qr = QuantumRegister(1)
+        cr = ClassicalRegister(1)
+        with self.assertRaises(CircuitError):
+            HGate().label = 'my_h'
+        with self.assertRaises(CircuitError):
+            HGate().condition = (cr, 1)
+        with self.assertRaises(CircuitError):
+            HGate().duration = 100
+        with self.assertRaises(CircuitError):
+            CXGate().ctrl_state = 0
+        # Setting an unchanged value is allowed
+        HGate().label = None
+        self.assertIsNone(HGate().label)
+        self.assertIsNone(HGate().condition)
+        self.assertEqual(HGate().definition.data[0][0].name, 'u2')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(0)
+        self.assertIs(circuit._data[0][0], HGate())
+
+    def test_signature(self):
+        """Test the signatures of the gate classes are the ones of their initializers."""
+        self.assertEqual(list(inspect.signature(HGate).parameters), ['label'])
+        self.assertEqual(list(inspect.signature(CXGate).parameters), ['label', 'ctrl_state'])
+        self.assertEqual(list(inspect.signature(RZGate).parameters), ['phi', 'label'])
+
+    def test_definition_not_shared(self):
+        """Test the definition of a shared instance is not cached on it."""
+        definition = HGate().definition
+        self.assertIsNot(HGate().definition, definition)
+        self.assertIsNone(HGate()._definition)
+        self.assertIs(HGate().reverse_ops(), HGate())
+
+    def test_to_mutable(self):
+        """Test the mutable copies of the shared instances."""
+        gate = CCXGate().to_mutable()
+        self.assertIsNot(gate, CCXGate())
+        self.assertTrue(gate.mutable)
+        self.assertEqual(gate, CCXGate())
+        gate.label = 'my_ccx'
+        gate.base_gate.label = 'my_x'
+        gate.ctrl_state = 1
+        self.assertIsNone(CCXGate().label)
+        self.assertIsNone(CCXGate().base_gate.label)
+        self.assertEqual(CCXGate().ctrl_state, 3)
+        self.assertIs(gate.to_mutable(), gate)
+        self.assertEqual(HGate().copy(name='my_h').name, 'my_h')
+        self.assertEqual(HGate().name, 'h')
+
+    def test_c_if(self):
+        """Test conditioning a shared instance returns a copy, also in circuits."""
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        gate = XGate().c_if(cr, 1)
+        self.assertIsNot(gate, XGate())
+        self.assertEqual(gate.condition, (cr, 1))
+        self.assertIsNone(XGate().condition)
+
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr).c_if(cr, 2)
+        circuit.cx(0, 1)
+        self.assertEqual([instruction.condition for instruction, _, _ in circuit.data],
+                         [(cr, 2), (cr, 2), None])
+        self.assertIsNot(circuit.data[0][0], circuit.data[1][0])
+        self.assertIsNone(HGate().condition)
+        self.assertEqual(circuit.qasm().count('if(c'), 2)
+
+        dag = circuit_to_dag(circuit)
+        self.assertEqual(dag_to_circuit(dag), circuit)
+
+    def test_c_if_in_place(self):
+        """Test the instructions read from a circuit can be conditioned in place."""
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.x(1)
+        self.assertIs(circuit._data[0][0], HGate())
+
+        circuit.data[0][0].c_if(cr, 1)
+        for instruction, _, _ in circuit.data[1:]:
+            instruction.c_if(cr, 2)
+        self.assertEqual([instruction.condition for instruction, _, _ in circuit.data],
+                         [(cr, 1), (cr, 2), (cr, 2)])
+        self.assertIsNone(HGate().condition)
+        self.assertIsNone(CXGate().condition)
+        self.assertIsNone(XGate().condition)
+
+    def test_control(self):
+        """Test the controlled versions of labelled gates do not modify the shared instances."""
+        gate = XGate(label='my_x').control()
+        self.assertEqual(gate.base_gate.label, 'my_x')
+        self.assertIsNone(CXGate().base_gate.label)
+        gate = HGate(label='my_h').control(label='my_ch')
+        self.assertEqual(gate.label, 'my_ch')
+        self.assertEqual(gate.base_gate.label, 'my_h')
+        self.assertIsNone(HGate().control().base_gate.label)
+        self.assertIs(XGate().control(), CXGate())
+
+    def test_copy_pickle(self):
+        """Test the copies and pickles of the shared instances are the shared instances."""
+        self.assertIs(HGate().copy(), HGate())
+        self.assertIs(copy.copy(HGate()), HGate())
+        self.assertIs(copy.deepcopy(CXGate()), CXGate())
+        self.assertIs(pickle.loads(pickle.dumps(CXGate())), CXGate())
+        gate = pickle.loads(pickle.dumps(XGate(label='my_x')))
+        self.assertEqual(gate.label, 'my_x')
+        self.assertTrue(gate.mutable)
+
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        for new_circuit in [circuit.copy(), copy.deepcopy(circuit),
+                            pickle.loads(pickle.dumps(circuit))]:
+            self.assertEqual(new_circuit, circuit)
+            self.assertIs(new_circuit._data[0][0], HGate())
+            self.assertIs(new_circuit._data[1][0], CXGate())
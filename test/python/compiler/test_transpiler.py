@@ -13,8 +13,10 @@
 """Tests basic functionality of the transpile function"""
 
 import io
+import os
 import sys
 import math
+import tempfile
 
 from logging import StreamHandler, getLogger
 from unittest.mock import patch
@@ -28,10 +30,10 @@ from qiskit.exceptions import QiskitError
 from qiskit import BasicAer
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit, pulse
 from qiskit.circuit import Parameter, Gate
-from qiskit.compiler import transpile
+from qiskit.compiler import transpile, transpile_parametric, TranspileCache
 from qiskit.converters import circuit_to_dag
 from qiskit.dagcircuit.exceptions import DAGCircuitError
-from qiskit.circuit.library import CXGate, U3Gate, U2Gate, U1Gate
+from qiskit.circuit.library import CXGate, U3Gate, U2Gate, U1Gate, EfficientSU2
 from qiskit.test import QiskitTestCase, Path
 from qiskit.test.mock import FakeMelbourne, FakeRueschlikon, FakeAlmaden
 from qiskit.transpiler import Layout, CouplingMap
@@ -912,6 +914,20 @@ class TestTranspile(QiskitTestCase):
 
         self.assertEqual(out, expected)
 
+    def test_output_operations_not_shared(self):
+        """Verify the mutable operations of a transpiled circuit are independent objects."""
+        qc = QuantumCircuit(2)
+        qc.h(0)
+        qc.h(1)
+
+        out = transpile(qc, basis_gates=['u2'], optimization_level=0)
+
+        self.assertEqual(out.count_ops(), {'u2': 2})
+        first, second = out.data[0][0], out.data[1][0]
+        self.assertIsNot(first, second)
+        first.params[0] = 0.5
+        self.assertEqual(second.params[0], 0)
+
 
 class StreamHandlerRaiseException(StreamHandler):
     """Handler class that will raise an exception on formatting errors."""
@@ -975,3 +991,158 @@ class TestTranspileCustomPM(QiskitTestCase):
         self.assertEqual(len(transpiled), 2)
         self.assertEqual(transpiled[0], expected)
         self.assertEqual(transpiled[1], expected)
+
+
+@ddt
+class TestTranspileParametric(QiskitTestCase):
+    """Test transpiling parameterized circuits once and binding them many times."""
+
+    @data(0, 1, 2, 3)
+    def test_bound_template_equivalent(self, optimization_level):
+        """Test the bound template is equivalent to the bound input circuit."""
+        circuit = EfficientSU2(3, reps=1)
+        plan = transpile_parametric(circuit, basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                    optimization_level=optimization_level)
+        self.assertLessEqual(plan.circuit.parameters, circuit.parameters)
+
+        parameters = sorted(circuit.parameters, key=lambda param: param.name)
+        values = np.random.RandomState(seed=optimization_level).random_sample(
+            (3, len(parameters)))
+        for row, bound in zip(values, plan.bind(values)):
+            expected = circuit.bind_parameters(dict(zip(parameters, row)))
+            self.assertEqual(bound.parameters, set())
+            self.assertTrue(Operator(bound).equiv(Operator(expected)))
+
+    def test_multiple_circuits(self):
+        """Test a plan is returned for every circuit, with the given parameter order."""
+        theta = Parameter('theta')
+        phi = Parameter('phi')
+        circuit = QuantumCircuit(2)
+        circuit.rx(theta, 0)
+        circuit.cx(0, 1)
+        circuit.rz(phi, 1)
+        other = QuantumCircuit(2)
+        other.ry(theta, 1)
+
+        plans = transpile_parametric([circuit, other], parameters=[theta, phi],
+                                     basis_gates=['u1', 'u2', 'u3', 'cx'],
+                                     coupling_map=[[0, 1]])
+        self.assertEqual(len(plans), 2)
+        self.assertEqual([plan.parameters for plan in plans], [[theta, phi]] * 2)
+        bound = plans[1].bind([[0.5, 1.5]])[0]
+        self.assertTrue(Operator(bound).equiv(Operator(other.bind_parameters({theta: 0.5}))))
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Test transpile with a TranspileCache."""
+
+    def setUp(self):
+        super().setUp()
+        self.circuit = QuantumCircuit(3, 3, name='ghz')
+        self.circuit.h(0)
+        self.circuit.cx(0, 1)
+        self.circuit.cx(0, 2)
+        self.circuit.measure(range(3), range(3))
+        self.options = {'basis_gates': ['u1', 'u2', 'u3', 'cx'],
+                        'coupling_map': [[0, 1], [1, 2]], 'seed_transpiler': 42}
+
+    def test_cache_hit(self):
+        """Test a circuit transpiled again with the same options comes from the cache."""
+        cache = TranspileCache()
+        first = transpile(self.circuit, cache=cache, **self.options)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 1, 1))
+
+        transpile_module = sys.modules[transpile.__module__]
+        with patch.object(transpile_module, '_transpile_circuit') as mock_transpile:
+            second = transpile(self.circuit.copy(), cache=cache, **self.options)
+            mock_transpile.assert_not_called()
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_cache_miss_on_different_options(self):
+        """Test changing the circuit or the options misses the cache."""
+        cache = TranspileCache()
+        transpile(self.circuit, cache=cache, **self.options)
+        transpile(self.circuit, cache=cache, optimization_level=3, **self.options)
+        options = {name: value for name, value in self.options.items()
+                   if name != 'seed_transpiler'}
+        transpile(self.circuit, cache=cache, seed_transpiler=43, **options)
+        other = self.circuit.copy()
+        other.x(2)
+        transpile(other, cache=cache, **self.options)
+        self.assertEqual((cache.hits, cache.misses, len(cache)), (0, 4, 4))
+
+    def test_name_from_input(self):
+        """Test the name of a cached circuit is the name of the input circuit."""
+        cache = TranspileCache()
+        transpile(self.circuit, cache=cache, **self.options)
+        renamed = self.circuit.copy(name='renamed')
+        self.assertEqual(transpile(renamed, cache=cache, **self.options).name, 'renamed')
+        output = transpile(renamed, cache=cache, output_name='output', **self.options)
+        self.assertEqual(output.name, 'output')
+        self.assertEqual(cache.hits, 2)
+
+    def test_multiple_circuits_order(self):
+        """Test cached and transpiled circuits are returned in the input order."""
+        cache = TranspileCache()
+        other = QuantumCircuit(3, 3, name='other')
+        other.x(2)
+        other.measure(range(3), range(3))
+        expected = transpile(other, **self.options)
+        transpile(self.circuit, cache=cache, **self.options)
+
+        circuits = transpile([other, self.circuit], cache=cache, **self.options)
+        self.assertEqual([circuit.name for circuit in circuits], ['other', 'ghz'])
+        self.assertEqual(circuits[0], expected)
+        self.assertEqual(cache.hits, 1)
+
+    def test_directory(self):
+        """Test cached circuits are shared between caches using the same directory."""
+        with tempfile.TemporaryDirectory() as directory:
+            expected = transpile(self.circuit, cache=TranspileCache(directory=directory),
+                                 **self.options)
+            self.assertEqual(len(os.listdir(directory)), 1)
+
+            cache = TranspileCache(directory=directory)
+            self.assertEqual(transpile(self.circuit, cache=cache, **self.options), expected)
+            self.assertEqual(cache.hits, 1)
+
+            cache.clear()
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_directory_other_version(self):
+        """Test cached circuits stored by another version of Qiskit are not used."""
+        transpile_module = sys.modules[transpile.__module__]
+        cache_module = sys.modules[TranspileCache.__module__]
+        with tempfile.TemporaryDirectory() as directory:
+            with patch.object(cache_module, '__version__', '0.0.0'):
+                transpile(self.circuit, cache=TranspileCache(directory=directory),
+                          **self.options)
+
+            cache = TranspileCache(directory=directory)
+            with patch.object(transpile_module, '_transpile_circuit',
+                              wraps=transpile_module._transpile_circuit) as mock_transpile:
+                transpile(self.circuit, cache=cache, **self.options)
+                mock_transpile.assert_called_once()
+            self.assertEqual((cache.hits, cache.misses), (0, 1))
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+    def test_max_size(self):
+        """Test the least recently used circuits are evicted."""
+        cache = TranspileCache(max_size=1)
+        cache.put('first', self.circuit)
+        cache.put('second', self.circuit)
+        self.assertEqual(len(cache), 1)
+        self.assertNotIn('first', cache)
+        self.assertIsNone(cache.get('first'))
+        self.assertEqual(cache.get('second'), self.circuit)
+
+    def test_callback_not_cached(self):
+        """Test transpilations with a callback are not cached."""
+        cache = TranspileCache()
+        calls = []
+        transpile(self.circuit, cache=cache, callback=lambda **kwargs: calls.append(1),
+                  **self.options)
+        self.assertEqual(len(cache), 0)
+        self.assertTrue(calls)
@@ -15,7 +15,9 @@
 import unittest
 
 from qiskit.converters import dag_to_circuit, circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit.library import QFT
 from qiskit.test import QiskitTestCase
 
 
@@ -39,6 +41,71 @@ class TestCircuitToDag(QiskitTestCase):
         circuit_out = dag_to_circuit(dag)
         self.assertEqual(circuit_out, circuit_in)
 
+    def test_same_graph_as_apply_operation_back(self):
+        """Check the graph is the one built by applying the operations one by one"""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, QuantumRegister(1, 'idle'), cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.measure(qr[1], cr[0])
+        circuit.x(qr[2]).c_if(cr, 1)
+        circuit.barrier(qr)
+        circuit.cx(qr[2], qr[0])
+        circuit.measure(qr[0], cr[1])
+
+        dag = circuit_to_dag(circuit)
+        expected = DAGCircuit()
+        for register in circuit.qregs + circuit.cregs:
+            if isinstance(register, QuantumRegister):
+                expected.add_qreg(register)
+            else:
+                expected.add_creg(register)
+        for instruction, qargs, cargs in circuit.data:
+            expected.apply_operation_back(instruction.copy(), qargs, cargs)
+
+        self.assertEqual(dag, expected)
+        # The neighbors of the nodes are also in the same order
+        for node, expected_node in zip(dag.topological_nodes(), expected.topological_nodes()):
+            self.assertEqual(node._node_id, expected_node._node_id)
+            self.assertEqual([succ._node_id for succ in dag.successors(node)],
+                             [succ._node_id for succ in expected.successors(expected_node)])
+            self.assertEqual([pred._node_id for pred in dag.predecessors(node)],
+                             [pred._node_id for pred in expected.predecessors(expected_node)])
+
+    def test_shared_operations(self):
+        """Check the operations are shared when they are not copied"""
+        qr = QuantumRegister(2)
+        cr = ClassicalRegister(2)
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.rx(0.5, qr[1])
+        circuit.measure(qr, cr)
+
+        dag = circuit_to_dag(circuit, copy_operations=False)
+        self.assertEqual([node.op for node in dag.topological_op_nodes()],
+                         [instruction for instruction, _, _ in circuit._data])
+        for node, (instruction, _, _) in zip(dag.topological_op_nodes(), circuit._data):
+            self.assertIs(node.op, instruction)
+        # The immutable shared gates (e.g. the H gate) are not copied
+        for node, (instruction, _, _) in zip(circuit_to_dag(circuit).topological_op_nodes(),
+                                             circuit._data):
+            self.assertEqual(node.op is instruction, not instruction.mutable)
+
+        circuit_out = dag_to_circuit(dag, copy_operations=False)
+        self.assertEqual(circuit_out, circuit)
+        for (instruction_out, _, _), (instruction, _, _) in zip(circuit_out._data,
+                                                                circuit._data):
+            self.assertIs(instruction_out, instruction)
+
+    def test_unbuilt_library_circuit(self):
+        """Check a library circuit is built when converted"""
+        expected = circuit_to_dag(QFT(3).copy())
+        for copy_operations in [True, False]:
+            dag = circuit_to_dag(QFT(3), copy_operations=copy_operations)
+            self.assertEqual(dag.count_ops(), expected.count_ops())
+            self.assertEqual(dag, expected)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
@@ -12,6 +12,7 @@
 
 """Test for the DAGCircuit object"""
 
+import copy
 import unittest
 
 from ddt import ddt, data
@@ -194,8 +195,7 @@ class TestDagApplyOperation(QiskitTestCase):
 
     def test_apply_operation_back(self):
         """The apply_operation_back() method."""
-        x_gate = XGate()
-        x_gate.condition = self.condition
+        x_gate = XGate().c_if(*self.condition)
         self.dag.apply_operation_back(HGate(), [self.qubit0], [])
         self.dag.apply_operation_back(CXGate(), [self.qubit0, self.qubit1], [])
         self.dag.apply_operation_back(Measure(), [self.qubit1, self.clbit1], [])
@@ -207,8 +207,7 @@ class TestDagApplyOperation(QiskitTestCase):
 
     def test_edges(self):
         """Test that DAGCircuit.edges() behaves as expected with ops."""
-        x_gate = XGate()
-        x_gate.condition = self.condition
+        x_gate = XGate().c_if(*self.condition)
         self.dag.apply_operation_back(HGate(), [self.qubit0], [])
         self.dag.apply_operation_back(CXGate(), [self.qubit0, self.qubit1], [])
         self.dag.apply_operation_back(Measure(), [self.qubit1, self.clbit1], [])
@@ -226,8 +225,7 @@ class TestDagApplyOperation(QiskitTestCase):
 
         # Single qubit gate conditional: qc.h(qr[2]).c_if(cr, 3)
 
-        h_gate = HGate()
-        h_gate.condition = self.condition
+        h_gate = HGate().c_if(*self.condition)
         h_node = self.dag.apply_operation_back(
             h_gate, [self.qubit2], [])
 
@@ -678,8 +676,7 @@ class TestDagNodeSelection(QiskitTestCase):
 
     def test_dag_collect_runs_start_with_conditional(self):
         """Test collect runs with a conditional at the start of the run."""
-        h_gate = HGate()
-        h_gate.condition = self.condition
+        h_gate = HGate().c_if(*self.condition)
         self.dag.apply_operation_back(
             h_gate, [self.qubit0])
         self.dag.apply_operation_back(HGate(), [self.qubit0])
@@ -694,8 +691,7 @@ class TestDagNodeSelection(QiskitTestCase):
 
     def test_dag_collect_runs_conditional_in_middle(self):
         """Test collect_runs with a conditional in the middle of a run."""
-        h_gate = HGate()
-        h_gate.condition = self.condition
+        h_gate = HGate().c_if(*self.condition)
         self.dag.apply_operation_back(HGate(), [self.qubit0])
         self.dag.apply_operation_back(
             h_gate, [self.qubit0])
@@ -720,8 +716,7 @@ class TestDagLayers(QiskitTestCase):
         qubit1 = qreg[1]
         clbit0 = creg[0]
         clbit1 = creg[1]
-        x_gate = XGate()
-        x_gate.condition = (creg, 3)
+        x_gate = XGate().c_if(creg, 3)
         dag = DAGCircuit()
         dag.add_qreg(qreg)
         dag.add_creg(creg)
@@ -748,6 +743,49 @@ class TestDagLayers(QiskitTestCase):
             ['measure', 'measure']
         ], name_layers)
 
+    def test_layer_views(self):
+        """The layer_views() method returns the layers of layers(), with the nodes of the dag."""
+        qreg = QuantumRegister(3, 'qr')
+        creg = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qreg, creg)
+        circuit.h(qreg[0])
+        circuit.cx(qreg[0], qreg[1])
+        circuit.x(qreg[2])
+        circuit.barrier(qreg)
+        circuit.measure(qreg[0], creg[0])
+        circuit.measure(qreg[1], creg[1])
+        dag = circuit_to_dag(circuit)
+
+        layers = list(dag.layers())
+        views = list(dag.layer_views())
+        self.assertEqual(len(layers), len(views))
+        dag_nodes = {id(node) for node in dag.op_nodes()}
+        for layer, view in zip(layers, views):
+            self.assertEqual([node.name for node in layer["graph"].op_nodes()],
+                             [node.name for node in view["nodes"]])
+            self.assertEqual(layer["partition"], view["partition"])
+            self.assertTrue(all(id(node) in dag_nodes for node in view["nodes"]))
+        self.assertEqual([[node.name for node in view["nodes"]] for view in views],
+                         [['h', 'x'], ['cx'], ['barrier'], ['measure', 'measure']])
+        self.assertEqual(views[2]["partition"], [])
+
+    def test_serial_layer_views(self):
+        """The serial_layer_views() method returns the layers of serial_layers()."""
+        qreg = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qreg)
+        circuit.h(qreg[0])
+        circuit.cx(qreg[0], qreg[1])
+        circuit.barrier(qreg)
+        circuit.x(qreg[1])
+        dag = circuit_to_dag(circuit)
+
+        layers = list(dag.serial_layers())
+        views = list(dag.serial_layer_views())
+        self.assertEqual([[node.name for node in layer["graph"].op_nodes()] for layer in layers],
+                         [[node.name for node in view["nodes"]] for view in views])
+        self.assertEqual([layer["partition"] for layer in layers],
+                         [view["partition"] for view in views])
+
     def test_layers_maintains_order(self):
         """Test that the layers method doesn't mess up the order of the DAG as
          reported in #2698"""
@@ -1015,8 +1053,7 @@ class TestDagSubstituteNode(QiskitTestCase):
         dag.add_qreg(qr)
         dag.add_creg(cr)
         dag.apply_operation_back(HGate(), [qr[1]])
-        cx_gate = CXGate()
-        cx_gate.condition = (cr, 1)
+        cx_gate = CXGate().c_if(cr, 1)
         node_to_be_replaced = dag.apply_operation_back(cx_gate, [qr[1], qr[0]])
 
         dag.apply_operation_back(HGate(), [qr[1]])
@@ -1184,5 +1221,72 @@ class TestDagProperties(QiskitTestCase):
         self.assertEqual(dag.depth(), 6)
 
 
+class TestDagVersion(QiskitTestCase):
+    """Test the version of the DAG, changed by its modifications."""
+
+    def setUp(self):
+        super().setUp()
+        self.qreg = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(self.qreg)
+        circuit.h(self.qreg[0])
+        circuit.cx(self.qreg[0], self.qreg[1])
+        self.dag = circuit_to_dag(circuit)
+
+    def test_analysis_preserves_version(self):
+        """Inspecting the DAG does not change its version."""
+        version = self.dag.version
+        self.dag.depth()
+        self.dag.count_ops()
+        list(self.dag.topological_op_nodes())
+        list(self.dag.layers())
+        self.assertEqual(self.dag.version, version)
+
+    def test_copy_preserves_version(self):
+        """A copy of the DAG has the version of the DAG."""
+        self.assertEqual(copy.deepcopy(self.dag).version, self.dag.version)
+
+    def test_apply_operation_changes_version(self):
+        """Adding an operation changes the version."""
+        version = self.dag.version
+        self.dag.apply_operation_back(HGate(), [self.qreg[1]], [])
+        self.assertNotEqual(self.dag.version, version)
+
+    def test_remove_op_node_changes_version(self):
+        """Removing an operation changes the version."""
+        version = self.dag.version
+        self.dag.remove_op_node(self.dag.op_nodes()[0])
+        self.assertNotEqual(self.dag.version, version)
+
+    def test_substitute_node_changes_version(self):
+        """Substituting a node changes the version."""
+        version = self.dag.version
+        self.dag.substitute_node(self.dag.named_nodes('h')[0], XGate(), inplace=True)
+        self.assertNotEqual(self.dag.version, version)
+
+    def test_add_register_changes_version(self):
+        """Adding a register changes the version."""
+        version = self.dag.version
+        self.dag.add_creg(ClassicalRegister(2, 'cr'))
+        self.assertNotEqual(self.dag.version, version)
+
+    def test_setting_attribute_changes_version(self):
+        """Setting an attribute, such as the global phase, changes the version."""
+        version = self.dag.version
+        self.dag.global_phase = 1.0
+        self.assertNotEqual(self.dag.version, version)
+
+        version = self.dag.version
+        self.dag.name = 'new_name'
+        self.assertNotEqual(self.dag.version, version)
+
+    def test_modifications_of_a_copy_are_independent(self):
+        """Modifying a copy of the DAG does not change the version of the DAG."""
+        version = self.dag.version
+        dag_copy = copy.deepcopy(self.dag)
+        dag_copy.apply_operation_back(HGate(), [self.qreg[1]], [])
+        self.assertEqual(self.dag.version, version)
+        self.assertNotEqual(dag_copy.version, version)
+
+
 if __name__ == '__main__':
     unittest.main()
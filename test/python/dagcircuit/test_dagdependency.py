@@ -15,10 +15,12 @@
 import unittest
 
 from qiskit.dagcircuit import DAGDependency
+from qiskit.dagcircuit.dagdependency import _does_commute
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.circuit import Measure
 from qiskit.circuit import Instruction
 from qiskit.circuit.library.standard_gates.h import HGate
+from qiskit.circuit.random import random_circuit
 from qiskit.dagcircuit.exceptions import DAGDependencyError
 from qiskit.converters import circuit_to_dagdependency
 from qiskit.test import QiskitTestCase
@@ -209,6 +211,38 @@ class TestDagNodeSelection(QiskitTestCase):
         predecessors_fourth = self.dag.predecessors(3)
         self.assertEqual(predecessors_fourth, [])
 
+    def test_incremental_construction(self):
+        """Test the edges and the predecessors and successors lists of a larger circuit."""
+        circuit = random_circuit(4, 12, max_operands=2, seed=42)
+        circuit.z(0)
+        circuit.cz(0, 1)
+        circuit.x(1)
+        dag = circuit_to_dagdependency(circuit)
+        nodes = list(dag.get_nodes())
+
+        for node_id, node in enumerate(nodes):
+            self.assertEqual(dag.predecessors(node_id),
+                             sorted(rx.ancestors(dag._multi_graph, node_id)))
+            self.assertEqual(dag.successors(node_id),
+                             sorted(rx.descendants(dag._multi_graph, node_id)))
+            for prev_node_id in range(node_id):
+                commute = _does_commute(nodes[prev_node_id], node)
+                if not commute:
+                    self.assertIn(prev_node_id, dag.predecessors(node_id))
+                self.assertEqual(prev_node_id in dag.direct_predecessors(node_id),
+                                 not commute and not any(
+                                     prev_node_id in dag.predecessors(pred_id)
+                                     for pred_id in dag.direct_predecessors(node_id)))
+
+        # Adding nodes to a copy rebuilds the state of the incremental construction
+        dag_copy = dag.copy()
+        for operation, qargs, cargs in circuit.data[-3:]:
+            dag.add_op_node(operation, qargs, cargs)
+            dag_copy.add_op_node(operation, qargs, cargs)
+        self.assertEqual(dag_copy.get_all_edges(), dag.get_all_edges())
+        self.assertEqual(dag_copy.predecessors(len(nodes) + 2),
+                         dag.predecessors(len(nodes) + 2))
+
 
 class TestDagProperties(QiskitTestCase):
     """Test the DAG properties.
@@ -206,6 +206,30 @@ class TestOneQubitEulerDecomposer(CheckDecompositions):
         unitary = random_unitary(2, seed=seed)
         self.check_one_qubit_euler_angles(unitary, basis)
 
+    @combine(basis=['U3', 'U', 'PSX', 'U1X', 'ZYZ', 'ZXZ', 'XYX', 'RR'],
+             name='test_one_qubit_batch_{basis}_basis')
+    def test_one_qubit_batch_all_basis(self, basis):
+        """Verify the batched decomposition for {basis} basis matches the single one."""
+        decomposer = OneQubitEulerDecomposer(basis)
+        unitaries = [random_unitary(2, seed=seed).data for seed in range(10)]
+        unitaries += [clifford.data for clifford in ONEQ_CLIFFORDS]
+        circuits = decomposer.decompose_batch(unitaries)
+        self.assertEqual(len(circuits), len(unitaries))
+        for unitary, circuit in zip(unitaries, circuits):
+            self.assertEqual(circuit, decomposer(unitary))
+        thetas, phis, lams = decomposer.angles(np.array(unitaries))
+        for unitary, theta, phi, lam in zip(unitaries, thetas, phis, lams):
+            np.testing.assert_allclose(decomposer.angles(unitary), (theta, phi, lam))
+
+    @combine(basis=['U3', 'U1X', 'ZYZ', 'ZXZ', 'XYX', 'RR'],
+             name='test_one_qubit_matrix_{basis}_basis')
+    def test_one_qubit_matrix_all_basis(self, basis):
+        """Verify the {basis} basis angles of an np.matrix are the ones of the array."""
+        decomposer = OneQubitEulerDecomposer(basis)
+        unitary = random_unitary(2, seed=7).data
+        np.testing.assert_allclose(decomposer.angles(np.matrix(unitary)),
+                                   decomposer.angles(unitary))
+
 
 # FIXME: streamline the set of test cases
 class TestTwoQubitWeylDecomposition(CheckDecompositions):
@@ -522,6 +546,29 @@ class TestTwoQubitDecomposeExact(CheckDecompositions):
             self.assertTrue(
                 decomposition_basis.issubset(requested_basis))
 
+    def test_num_basis_gates_batch(self):
+        """Verify the batched basis gate counts match the single ones."""
+        unitaries = [np.eye(4), Operator(CXGate()).data, Operator(iSwapGate()).data]
+        unitaries += [random_unitary(4, seed=seed).data for seed in range(10)]
+        counts = two_qubit_cnot_decompose.num_basis_gates_batch(unitaries)
+        self.assertEqual(list(counts),
+                         [two_qubit_cnot_decompose.num_basis_gates(unitary)
+                          for unitary in unitaries])
+        self.assertEqual(list(counts[:3]), [0, 1, 2])
+        self.assertEqual(len(two_qubit_cnot_decompose.num_basis_gates_batch([])), 0)
+
+    def test_decompose_batch(self):
+        """Verify repeated targets are decomposed once and their
+        decompositions are independent circuits."""
+        decomposer = TwoQubitBasisDecomposer(CXGate())
+        unitary = random_unitary(4, seed=7).data
+        circuits = decomposer.decompose_batch([unitary, unitary.copy()])
+        self.assertEqual(len(decomposer._decompositions), 1)
+        self.assertEqual(circuits[0], circuits[1])
+        self.assertIsNot(circuits[0], circuits[1])
+        for circuit in circuits:
+            self.assertTrue(Operator(circuit).equiv(unitary))
+
 
 # FIXME: need to write tests for the approximate decompositions
 
@@ -19,7 +19,7 @@ from numpy.testing import assert_allclose
 
 from qiskit.test import QiskitTestCase
 from qiskit.quantum_info.random import random_unitary
-from qiskit.quantum_info.synthesis.weyl import weyl_coordinates
+from qiskit.quantum_info.synthesis.weyl import weyl_coordinates, weyl_coordinates_batch
 from qiskit.quantum_info.synthesis.local_invariance import (two_qubit_local_invariants,
                                                             local_equivalence)
 
@@ -71,6 +71,16 @@ class TestWeyl(QiskitTestCase):
             local = two_qubit_local_invariants(U)
             assert_allclose(local, local_equiv)
 
+    def test_weyl_coordinates_batch(self):
+        """Check the Weyl coordinates of a stack of unitaries.
+        """
+        unitaries = np.array([random_unitary(4, seed=seed).data for seed in range(10)])
+        weyl = weyl_coordinates_batch(unitaries)
+        self.assertEqual(weyl.shape, (10, 3))
+        for unitary, coordinates in zip(unitaries, weyl):
+            assert_allclose(two_qubit_local_invariants(unitary),
+                            local_equivalence(coordinates))
+
 
 if __name__ == '__main__':
     unittest.main()
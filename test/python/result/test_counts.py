@@ -46,6 +46,23 @@ class TestCounts(unittest.TestCase):
         result = utils.marginal_counts(counts_obj, [0, 1])
         self.assertEqual(expected, result)
 
+    def test_marginal_method(self):
+        raw_counts = {'0x0': 4, '0x1': 7, '0x2': 10, '0x6': 5, '0x9': 11,
+                      '0xD': 9, '0xE': 8}
+        counts_obj = counts.Counts(raw_counts, time_taken=1.5,
+                                   creg_sizes=[['c0', 4]], memory_slots=4)
+        result = counts_obj.marginal([3, 0])
+        self.assertIsInstance(result, counts.Counts)
+        self.assertEqual({'00': 19, '01': 7, '10': 8, '11': 20}, result)
+        self.assertEqual({0: 19, 1: 7, 2: 8, 3: 20}, result.int_outcomes())
+        self.assertEqual(result.time_taken, 1.5)
+        self.assertRaises(exceptions.QiskitError, counts_obj.marginal, [4])
+
+    def test_marginal_method_bitstrings(self):
+        raw_counts = {'00 01': 3, '10 11': 5, '11 01': 2}
+        result = counts.Counts(raw_counts).marginal([0, 2])
+        self.assertEqual({'01': 8, '11': 2}, result)
+
     def test_int_outcomes(self):
         raw_counts = {'0x0': 21, '0x2': 12, '0x3': 5, '0x2E': 265}
         expected = {0: 21, 2: 12, 3: 5, 46: 265}
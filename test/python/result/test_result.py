@@ -226,6 +226,42 @@ class TestResultOperations(QiskitTestCase):
         self.assertRaises(AttributeError,
                           lambda: marginal_counts(dict_counts_1, [0, 1]).get_counts(0))
 
+    def test_marginal_counts_many_bits(self):
+        """Test the marginalization of counts over many bits, with more than 64 bits."""
+        for num_clbits in [27, 70]:
+            rng = np.random.default_rng(1234)
+            outcomes = [int(''.join(bits), 2) for bits in
+                        rng.choice(['0', '1'], size=(200, num_clbits)).tolist()]
+            dict_counts = {}
+            for outcome in outcomes:
+                key = format(outcome, '0{}b'.format(num_clbits))
+                dict_counts[key] = dict_counts.get(key, 0) + 1
+            indices = [1, 2, 3, 7, 20, 21, 26, 0, 11, 12, 13, 14, 15, 16, 18, 19, 22, 23, 4, 5]
+
+            expected = {}
+            for key, value in dict_counts.items():
+                marginal_key = ''.join(key[-1 - index] for index in sorted(indices, reverse=True))
+                expected[marginal_key] = expected.get(marginal_key, 0) + value
+
+            self.assertEqual(marginal_counts(dict_counts, indices), expected)
+
+    def test_marginal_counts_result_shared_data(self):
+        """Test that a marginalized Result shares the data other than counts with the original."""
+        raw_counts = {'0x0': 4, '0x1': 7, '0x2': 10, '0x6': 5, '0x9': 11, '0xD': 9, '0xE': 8}
+        memory = ['0x0', '0x1', '0xE']
+        data = models.ExperimentResultData(counts=dict(**raw_counts), memory=memory)
+        exp_result_header = QobjExperimentHeader(creg_sizes=[['c0', 4]], memory_slots=4)
+        exp_result = models.ExperimentResult(shots=54, success=True, data=data,
+                                             header=exp_result_header)
+        result = Result(results=[exp_result], **self.base_result_args)
+
+        new_result = marginal_counts(result, [0, 1])
+        self.assertEqual(new_result.get_counts(0), {'00': 4, '01': 27, '10': 23})
+        self.assertIs(new_result.results[0].data.memory, memory)
+        self.assertEqual(result.results[0].header.memory_slots, 4)
+        self.assertEqual(result.results[0].data.counts, raw_counts)
+        self.assertEqual(marginal_counts(result).get_counts(0), result.get_counts(0))
+
     def test_memory_counts_no_header(self):
         """Test that memory bitstrings are extracted properly without header."""
         raw_memory = ['0x0', '0x0', '0x2', '0x2', '0x2', '0x2', '0x2']
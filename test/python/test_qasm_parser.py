@@ -12,10 +12,16 @@
 
 """Test for the QASM parser"""
 
+import os
+import tempfile
 import unittest
+from unittest.mock import patch
+
 import ply
 
+from qiskit.converters import ast_to_dag
 from qiskit.qasm import Qasm, QasmError
+from qiskit.qasm import qasmparser
 from qiskit.qasm.node.node import Node
 from qiskit.test import QiskitTestCase, Path
 
@@ -93,6 +99,70 @@ class TestParser(QiskitTestCase):
         for token in qasm.generate_tokens():
             self.assertTrue(isinstance(token, ply.lex.LexToken))
 
+    def test_parser_tables_cached(self):
+        """Test the parser tables are written once and read back."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(qasmparser, 'PARSER_TABLES_DIR', tmpdir):
+                expected = parse(self.qasm_file_path)
+                tables_files = os.listdir(tmpdir)
+                self.assertEqual(len(tables_files), 1)
+                self.assertEqual(parse(self.qasm_file_path), expected)
+
+                # A corrupted tables file is written again
+                tables_file = os.path.join(tmpdir, tables_files[0])
+                with open(tables_file, 'rb') as file:
+                    tables = file.read()
+                with open(tables_file, 'wb') as file:
+                    file.write(b'corrupted')
+                self.assertEqual(parse(self.qasm_file_path), expected)
+                self.assertEqual(os.listdir(tmpdir), tables_files)
+
+                # So is a truncated one
+                with open(tables_file, 'wb') as file:
+                    file.write(tables[:len(tables) // 2])
+                self.assertEqual(parse(self.qasm_file_path), expected)
+                self.assertEqual(os.listdir(tmpdir), tables_files)
+
+    def test_parse_to_dag(self):
+        """Test the DAG built from the tokens is the DAG built from the AST."""
+        program = '''OPENQASM 2.0;
+        include "qelib1.inc";
+        qreg q[3];
+        qreg r[3];
+        creg c[3];
+        h q;
+        cx q, r;
+        cu3(pi/2, -pi^2/4, 2*sin(0.3)+1.5e-1) q[0], r[1];
+        rz(-(1-2)*ln(2)) r; // comment
+        CX q[1], r[2];
+        barrier q, r[0];
+        measure q -> c;
+        if (c == 5) u2(0, 3.) r[2];
+        reset q[1];
+        '''
+        for qasm in [Qasm(data=program), Qasm(self.qasm_file_path),
+                     Qasm(self.qasm_file_path_if),
+                     Qasm(self._get_resource_path('all_gates.qasm', Path.QASMS))]:
+            dag = qasm.parse_to_dag()
+            self.assertIsNotNone(dag)
+            self.assertEqual(dag, ast_to_dag(qasm.parse()))
+
+    def test_parse_to_dag_full_parser(self):
+        """Test the programs left to the full parser."""
+        programs = [
+            # gate definition
+            'OPENQASM 2.0;\ngate g a { U(0,0,0) a; }\nqreg q[1];\ng q[0];',
+            # undeclared gate
+            'OPENQASM 2.0;\nqreg q[1];\nh q[0];',
+            # index out of range
+            'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[1];\nh q[1];',
+            # duplicate qubits
+            'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\ncx q[0],q[0];',
+        ]
+        for program in programs:
+            with self.subTest(program=program):
+                self.assertIsNone(Qasm(data=program).parse_to_dag())
+
 
 if __name__ == '__main__':
     unittest.main()
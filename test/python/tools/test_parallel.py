@@ -14,7 +14,11 @@
 import os
 import time
 
-from qiskit.tools.parallel import parallel_map
+import dill
+
+from qiskit.tools import parallel
+from qiskit.tools.parallel import (parallel_map, parallel_imap, ParallelPool, worker_preloaded,
+                                   worker_cached_loads, _chunk_size)
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.pulse import Schedule
 from qiskit.test import QiskitTestCase
@@ -34,10 +38,27 @@ def _build_simple_circuit(_):
     return qc
 
 
+def _add_hadamard(circuit):
+    circuit.h(0)
+    return circuit, circuit.name
+
+
 def _build_simple_schedule(_):
     return Schedule()
 
 
+def _worker_pid(_):
+    return os.getpid()
+
+
+def _read_preloaded(key):
+    return worker_preloaded(key)
+
+
+def _cached_loads(payload):
+    return worker_cached_loads(payload), len(parallel._WORKER_CACHE)
+
+
 class TestParallel(QiskitTestCase):
     """A class for testing parallel_map functionality.
     """
@@ -57,8 +78,100 @@ class TestParallel(QiskitTestCase):
         names = [circ.name for circ in out_circs]
         self.assertEqual(len(names), len(set(names)))
 
+    def test_parallel_circuits_round_trip(self):
+        """Verify circuits are sent to and from the workers unchanged"""
+        circuits = []
+        expected = []
+        for index in range(4):
+            circuit = QuantumCircuit(2, 2, name='circuit%d' % index)
+            circuit.rx(0.1 * index, 0)
+            circuit.cx(0, 1)
+            circuit.measure([0, 1], [0, 1])
+            circuits.append(circuit)
+            expected_circuit = circuit.copy()
+            expected_circuit.h(0)
+            expected.append((expected_circuit, circuit.name))
+        self.assertEqual(parallel_map(_add_hadamard, circuits), expected)
+
+    def test_parallel_chunksize(self):
+        """Test parallel_map with an explicit chunksize"""
+        ans = parallel_map(_parfunc, list(range(6)), chunksize=3)
+        self.assertEqual(ans, list(range(6)))
+
+    def test_chunk_size_circuits(self):
+        """Test small circuits are dispatched in chunks and other values one by one"""
+        circuits = [_build_simple_circuit(None) for _ in range(100)]
+        for circuit in circuits:
+            circuit.h(0)
+        self.assertEqual(_chunk_size(circuits, 2), 12)
+        self.assertEqual(_chunk_size([(circ, {}) for circ in circuits], 2), 12)
+        self.assertEqual(_chunk_size(list(range(100)), 2), 1)
+
+    def test_parallel_imap(self):
+        """Test parallel_imap yields the results in order"""
+        results = parallel_imap(_parfunc, list(range(4)))
+        self.assertNotIsInstance(results, list)
+        self.assertEqual(list(results), list(range(4)))
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
+
+    def test_parallel_imap_circuits(self):
+        """Test parallel_imap with chunked circuits"""
+        out_circs = list(parallel_imap(_build_simple_circuit, list(range(10))))
+        self.assertEqual(len(out_circs), 10)
+
     def test_parallel_schedule_names(self):
         """Verify unique schedule names in parallel"""
         out_schedules = parallel_map(_build_simple_schedule, list(range(10)))
         names = [schedule.name for schedule in out_schedules]
         self.assertEqual(len(names), len(set(names)))
+
+
+class TestParallelPool(QiskitTestCase):
+    """Tests for the persistent worker pool."""
+
+    def test_pool_map(self):
+        """Test parallel_map inside a pool."""
+        with ParallelPool(num_processes=2):
+            ans = parallel_map(_parfunc, list(range(4)))
+        self.assertEqual(ans, list(range(4)))
+
+    def test_pool_reuses_workers(self):
+        """Test the same workers run consecutive parallel_map calls."""
+        with ParallelPool(num_processes=2) as pool:
+            first = set(parallel_map(_worker_pid, list(range(8))))
+            second = set(parallel_map(_worker_pid, list(range(8))))
+            self.assertTrue(pool.running)
+        self.assertFalse(pool.running)
+        self.assertLessEqual(len(first | second), 2)
+        self.assertNotIn(os.getpid(), first)
+
+    def test_pool_explicit(self):
+        """Test passing a pool explicitly to parallel_map."""
+        pool = ParallelPool(num_processes=2, warm_up=False).start()
+        try:
+            ans = parallel_map(_parfunc, list(range(4)), pool=pool)
+        finally:
+            pool.shutdown()
+        self.assertEqual(ans, list(range(4)))
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
+
+    def test_pool_imap(self):
+        """Test parallel_imap inside a pool."""
+        with ParallelPool(num_processes=2):
+            ans = list(parallel_imap(_parfunc, list(range(4))))
+        self.assertEqual(ans, list(range(4)))
+
+    def test_pool_preload(self):
+        """Test objects preloaded in the workers."""
+        with ParallelPool(num_processes=2, preload={'a': 'b', 'c': 'd'}):
+            ans = parallel_map(_read_preloaded, ['a', 'c', 'a'])
+        self.assertEqual(ans, ['b', 'd', 'b'])
+
+    def test_pool_cached_loads_bounded(self):
+        """Test the payloads cached in the workers are bounded."""
+        payloads = [dill.dumps(list(range(i))) for i in range(20)]
+        with ParallelPool(num_processes=2):
+            ans = parallel_map(_cached_loads, payloads)
+        self.assertEqual([value for value, _ in ans], [list(range(i)) for i in range(20)])
+        for _, size in ans:
+            self.assertLessEqual(size, parallel._WORKER_CACHE_SIZE)
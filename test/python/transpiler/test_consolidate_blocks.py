@@ -310,6 +310,29 @@ class TestConsolidateBlocks(QiskitTestCase):
 
         self.assertEqual(qc, qc1)
 
+    def test_block_matrix_matches_operator(self):
+        """Test the unitary of a block with gates on both wires and in both
+        directions is that of the circuit."""
+        qr = QuantumRegister(2, "qr")
+        qc = QuantumCircuit(qr)
+        qc.h(qr[1])
+        qc.cx(qr[0], qr[1])
+        qc.rz(0.3, qr[0])
+        qc.cx(qr[1], qr[0])
+        qc.rz(0.3, qr[0])
+        qc.cu1(0.7, qr[1], qr[0])
+        qc.sx(qr[1])
+        qc.unitary(U2Gate(0.1, 0.2).to_matrix(), [qr[0]])
+        qc.cx(qr[0], qr[1])
+        dag = circuit_to_dag(qc)
+
+        pass_ = ConsolidateBlocks(force_consolidate=True)
+        pass_.property_set['block_list'] = [list(dag.topological_op_nodes())]
+        new_dag = pass_.run(dag)
+
+        self.assertEqual(len(new_dag.op_nodes()), 1)
+        self.assertEqual(Operator(new_dag.op_nodes()[0].op), Operator(qc))
+
     def test_no_kak_in_basis(self):
         """Test that pass just returns the input dag without a KAK gate."""
         qc = QuantumCircuit(1)
@@ -77,6 +77,31 @@ class CouplingTest(QiskitTestCase):
         graph.add_physical_qubit(1)
         self.assertRaises(CouplingError, graph.distance, 0, 1)
 
+    def test_distance_matrix(self):
+        """Test the distance matrix is shared by the coupling maps with the same graph."""
+        coupling = CouplingMap.from_grid(3, 4)
+        distance_matrix = coupling.distance_matrix
+        self.assertEqual(distance_matrix.shape, (12, 12))
+        self.assertEqual(distance_matrix[0, 11], 5)
+        self.assertEqual(coupling.distance(11, 0), 5)
+        self.assertFalse(distance_matrix.flags.writeable)
+        self.assertIs(CouplingMap(coupling.get_edges()).distance_matrix, distance_matrix)
+        coupling.add_edge(0, 11)
+        self.assertEqual(coupling.distance(0, 11), 1)
+        self.assertEqual(distance_matrix[0, 11], 5)
+
+    def test_shortest_undirected_path(self):
+        """Test the shortest undirected paths between physical qubits."""
+        coupling = CouplingMap([[0, 1], [2, 1], [2, 3], [4, 3], [0, 5]])
+        self.assertEqual(coupling.shortest_undirected_path(5, 3), [5, 0, 1, 2, 3])
+        self.assertEqual(coupling.shortest_undirected_path(4, 1), [4, 3, 2, 1])
+        self.assertEqual(coupling.shortest_undirected_path(2, 2), [2])
+        coupling.add_physical_qubit(6)
+        with self.assertRaises(CouplingError):
+            coupling.shortest_undirected_path(0, 6)
+        with self.assertRaises(CouplingError):
+            coupling.shortest_undirected_path(0, 7)
+
     def test_init_with_couplinglist(self):
         coupling_list = [[0, 1], [1, 2]]
         coupling = CouplingMap(coupling_list)
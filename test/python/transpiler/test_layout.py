@@ -17,7 +17,7 @@ import unittest
 import numpy
 
 from qiskit.circuit import QuantumRegister, Qubit
-from qiskit.transpiler.layout import Layout
+from qiskit.transpiler.layout import Layout, ArrayLayout
 from qiskit.transpiler.exceptions import LayoutError
 from qiskit.test import QiskitTestCase
 
@@ -407,5 +407,61 @@ class LayoutTest(QiskitTestCase):
         self.assertDictEqual(layout._v2p, expected._v2p)
 
 
+class ArrayLayoutTest(QiskitTestCase):
+    """Test the methods in the array layout object."""
+
+    def setUp(self):
+        super().setUp()
+        self.qr = QuantumRegister(3, 'qr')
+
+    def test_arrays(self):
+        """The arrays map virtual and physical qubits both ways"""
+        layout = ArrayLayout([2, 0, 4], 5)
+        self.assertEqual(len(layout), 3)
+        self.assertEqual(layout.virtual_to_physical.tolist(), [2, 0, 4])
+        self.assertEqual(layout.physical_to_virtual.tolist(), [1, -1, 0, -1, 2])
+        self.assertEqual(ArrayLayout([1, 0]).physical_to_virtual.tolist(), [1, 0])
+
+    def test_invalid_arrays(self):
+        """The physical qubits must be distinct and in range"""
+        with self.assertRaises(LayoutError):
+            ArrayLayout([0, 0])
+        with self.assertRaises(LayoutError):
+            ArrayLayout([0, 3], 3)
+        with self.assertRaises(LayoutError):
+            ArrayLayout([-1, 1])
+
+    def test_swap_and_undo(self):
+        """Swapping physical qubits in place, and swapping them back"""
+        layout = ArrayLayout([2, 0, 4], 5)
+        copied = layout.copy()
+        layout.swap(0, 2)
+        self.assertEqual(layout.virtual_to_physical.tolist(), [0, 2, 4])
+        self.assertEqual(layout.physical_to_virtual.tolist(), [0, -1, 1, -1, 2])
+        layout.swap(4, 3)
+        self.assertEqual(layout.virtual_to_physical.tolist(), [0, 2, 3])
+        self.assertEqual(layout.physical_to_virtual.tolist(), [0, -1, 1, 2, -1])
+        self.assertEqual(copied.virtual_to_physical.tolist(), [2, 0, 4])
+        layout.swap(4, 3)
+        layout.swap(0, 2)
+        numpy.testing.assert_array_equal(layout.virtual_to_physical,
+                                         copied.virtual_to_physical)
+        numpy.testing.assert_array_equal(layout.physical_to_virtual,
+                                         copied.physical_to_virtual)
+
+    def test_layout_conversions(self):
+        """Conversions from and to Layout"""
+        qr = self.qr
+        layout = Layout({qr[0]: 3, qr[1]: 0, qr[2]: 1})
+        array_layout = ArrayLayout.from_layout(layout, list(qr), 5)
+        self.assertEqual(array_layout.virtual_to_physical.tolist(), [3, 0, 1])
+        self.assertEqual(len(array_layout.physical_to_virtual), 5)
+        array_layout.swap(3, 4)
+        self.assertDictEqual(array_layout.to_layout(qr).get_virtual_bits(),
+                             {qr[0]: 4, qr[1]: 0, qr[2]: 1})
+        with self.assertRaises(LayoutError):
+            ArrayLayout.from_layout(Layout({qr[0]: 0}), list(qr))
+
+
 if __name__ == '__main__':
     unittest.main()
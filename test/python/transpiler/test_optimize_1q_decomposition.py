@@ -59,6 +59,35 @@ class TestOptimize1qGatesDecomposition(QiskitTestCase):
         result = passmanager.run(circuit)
         self.assertTrue(Operator(circuit).equiv(Operator(result)))
 
+    @ddt.data(
+        ['cx', 'u3'],
+        ['p', 'sx', 'u', 'cx'],
+        ['cz', 'rx', 'rz'],
+        ['rxx', 'rx', 'ry'],
+        ['cx', 'u1', 'rx'],
+        ['cx', 'r'],
+    )
+    def test_optimize_runs_on_several_qubits(self, basis):
+        """Runs on several qubits, split by two-qubit gates, are all optimized."""
+        qr = QuantumRegister(3, 'qr')
+        circuit = QuantumCircuit(qr)
+        for qubit, angle in enumerate([0.1, 0.2, 0.3]):
+            circuit.h(qr[qubit])
+            circuit.rz(angle, qr[qubit])
+            circuit.h(qr[qubit])
+        circuit.cx(qr[0], qr[1])
+        circuit.h(qr[0])
+        circuit.t(qr[0])
+        circuit.h(qr[0])
+        circuit.sx(qr[1])
+        circuit.sx(qr[1])
+
+        passmanager = PassManager()
+        passmanager.append(BasisTranslator(sel, basis))
+        passmanager.append(Optimize1qGatesDecomposition(basis))
+        result = passmanager.run(circuit)
+        self.assertTrue(Operator(circuit).equiv(Operator(result)))
+
     @ddt.data(
         ['cx', 'u3'],
         ['cz', 'u3'],
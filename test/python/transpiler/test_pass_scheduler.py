@@ -21,10 +21,11 @@ import sys
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.transpiler import PassManager, TranspilerError
+from qiskit.transpiler.passes import DAGFixedPoint
 from qiskit.transpiler.runningpassmanager import DoWhileController, ConditionalController, \
     FlowController
 from qiskit.test import QiskitTestCase
-from ._dummy_passes import (PassA_TP_NR_NP, PassB_TP_RA_PA, PassC_TP_RA_PA,
+from ._dummy_passes import (DummyTP, PassA_TP_NR_NP, PassB_TP_RA_PA, PassC_TP_RA_PA,
                             PassD_TP_NR_NP, PassE_AP_NR_NP, PassF_reduce_dag_property,
                             PassI_Bad_AP, PassJ_Bad_NoReturn,
                             PassK_check_fixed_point_property, PassM_AP_NR_NP)
@@ -300,19 +301,53 @@ class TestUseCases(SchedulerTestCase):
                               'set property as 1'])
 
     def test_ap_before_and_after_a_tp(self):
-        """A default transformation does not preserves anything
+        """A default transformation that modifies the DAG does not preserves anything
         and analysis passes need to be re-run"""
         passmanager = PassManager()
         passmanager.append(PassE_AP_NR_NP(argument1=1))
-        passmanager.append(PassA_TP_NR_NP())
+        passmanager.append(PassF_reduce_dag_property())
         passmanager.append(PassE_AP_NR_NP(argument1=1))
         self.assertScheduler(self.circuit, passmanager,
                              ['run analysis pass PassE_AP_NR_NP',
                               'set property as 1',
-                              'run transformation pass PassA_TP_NR_NP',
+                              'run transformation pass PassF_reduce_dag_property',
+                              'dag property = 6',
                               'run analysis pass PassE_AP_NR_NP',
                               'set property as 1'])
 
+    def test_ap_before_and_after_a_tp_not_modifying_the_dag(self):
+        """A transformation that does not modify the DAG preserves the analysis passes"""
+        passmanager = PassManager()
+        passmanager.append(PassE_AP_NR_NP(argument1=1))
+        passmanager.append(PassA_TP_NR_NP())
+        passmanager.append(PassE_AP_NR_NP(argument1=1))
+        passmanager.append(PassA_TP_NR_NP())
+        self.assertScheduler(self.circuit, passmanager,
+                             ['run analysis pass PassE_AP_NR_NP',
+                              'set property as 1',
+                              'run transformation pass PassA_TP_NR_NP'])
+
+    def test_tp_not_modifying_the_dag_is_not_preserved(self):
+        """A transformation pass is re-run if not preserved, even if the DAG did not change"""
+        passmanager = PassManager()
+        passmanager.append(PassA_TP_NR_NP())
+        passmanager.append(PassD_TP_NR_NP(argument1=[1, 2]))
+        passmanager.append(PassA_TP_NR_NP())
+        self.assertScheduler(self.circuit, passmanager,
+                             ['run transformation pass PassA_TP_NR_NP',
+                              'run transformation pass PassD_TP_NR_NP',
+                              'argument [1, 2]',
+                              'run transformation pass PassA_TP_NR_NP'])
+
+    def test_dag_fixed_point_after_a_tp_not_modifying_the_dag(self):
+        """DAGFixedPoint is re-run after a transformation that does not modify the DAG"""
+        passmanager = PassManager()
+        passmanager.append([DummyTP(), DAGFixedPoint()],
+                           do_while=lambda property_set: not property_set['dag_fixed_point'])
+        self.assertScheduler(self.circuit, passmanager,
+                             ['run transformation pass DummyTP',
+                              'run transformation pass DummyTP'])
+
     def test_pass_no_return(self):
         """Transformation passes that don't return a DAG raise error."""
         self.passmanager.append(PassJ_Bad_NoReturn())
@@ -397,12 +432,13 @@ class TestUseCases(SchedulerTestCase):
     def test_fresh_initial_state(self):
         """New construction gives fresh instance."""
         self.passmanager.append(PassM_AP_NR_NP(argument1=1))
-        self.passmanager.append(PassA_TP_NR_NP())
+        self.passmanager.append(PassF_reduce_dag_property())
         self.passmanager.append(PassM_AP_NR_NP(argument1=1))
         self.assertScheduler(self.circuit, self.passmanager,
                              ['run analysis pass PassM_AP_NR_NP',
                               'self.argument1 = 2',
-                              'run transformation pass PassA_TP_NR_NP',
+                              'run transformation pass PassF_reduce_dag_property',
+                              'dag property = 6',
                               'run analysis pass PassM_AP_NR_NP',
                               'self.argument1 = 2'])
 
@@ -12,12 +12,18 @@
 
 """Tests PassManager.run()"""
 
+from unittest.mock import patch
+
+import dill
+
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.circuit.library import CXGate
 from qiskit.transpiler.preset_passmanagers import level_1_pass_manager
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeMelbourne
-from qiskit.transpiler import Layout, CouplingMap
+from qiskit.tools.parallel import ParallelPool
+from qiskit.transpiler import Layout, CouplingMap, PassManager
+from qiskit.transpiler.passes import CXDirection, Optimize1qGates
 from qiskit.transpiler.passmanager_config import PassManagerConfig
 
 
@@ -111,3 +117,54 @@ class TestPassManagerRun(QiskitTestCase):
             for gate, qargs, _ in new_circuit.data:
                 if isinstance(gate, CXGate):
                     self.assertIn([x.index for x in qargs], coupling_map)
+
+    def test_default_pass_manager_pool(self):
+        """Test default_pass_manager.run(circuitS) preloaded in a ParallelPool."""
+        qr = QuantumRegister(4, 'qr')
+        circuit1 = QuantumCircuit(qr)
+        circuit1.h(qr[0])
+        circuit1.cx(qr[0], qr[1])
+        circuit1.cx(qr[1], qr[2])
+        circuit1.cx(qr[2], qr[3])
+
+        circuit2 = QuantumCircuit(qr)
+        circuit2.cx(qr[1], qr[2])
+        circuit2.cx(qr[0], qr[1])
+        circuit2.cx(qr[2], qr[3])
+
+        coupling_map = FakeMelbourne().configuration().coupling_map
+        basis_gates = FakeMelbourne().configuration().basis_gates
+        initial_layout = [None, qr[0], qr[1], qr[2], None, qr[3]]
+
+        pass_manager = level_1_pass_manager(PassManagerConfig(
+            basis_gates=basis_gates,
+            coupling_map=CouplingMap(coupling_map),
+            initial_layout=Layout.from_qubit_list(initial_layout),
+            seed_transpiler=42))
+        expected = pass_manager.run([circuit1, circuit2])
+
+        with ParallelPool(num_processes=2, pass_managers=[pass_manager]) as pool:
+            self.assertIsNotNone(pool.pass_manager_key(pass_manager))
+            with patch.object(dill, 'dumps', wraps=dill.dumps) as mock_dumps:
+                first = pass_manager.run([circuit1, circuit2])
+                second = pass_manager.run([circuit2, circuit1])
+                self.assertFalse(any(call[0][0] is pass_manager
+                                     for call in mock_dumps.call_args_list))
+
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected[::-1])
+
+    def test_preloaded_pass_manager_changed(self):
+        """Test a preloaded pass manager is sent again once its schedule changed."""
+        pass_manager = PassManager(CXDirection(CouplingMap([[0, 1]])))
+        circuit = QuantumCircuit(2)
+        circuit.cx(1, 0)
+        circuit.h(0)
+        with ParallelPool(num_processes=2, pass_managers=[pass_manager]) as pool:
+            self.assertIsNotNone(pool.pass_manager_key(pass_manager))
+            pass_manager.append(Optimize1qGates())
+            self.assertIsNone(pool.pass_manager_key(pass_manager))
+            self.assertIsNone(pool.pass_manager_key(PassManager()))
+            results = pass_manager.run([circuit, circuit])
+
+        self.assertEqual(results, [pass_manager.run(circuit)] * 2)
@@ -15,7 +15,7 @@
 import unittest
 
 from qiskit import QuantumRegister, QuantumCircuit
-from qiskit.transpiler import CouplingMap
+from qiskit.transpiler import CouplingMap, TranspilerError
 from qiskit.transpiler.passes import SabreLayout
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
@@ -79,6 +79,34 @@ class TestSabreLayout(QiskitTestCase):
         self.assertEqual(layout[qr1[1]], 7)
         self.assertEqual(layout[qr1[2]], 5)
 
+    def test_trials(self):
+        """Test the layout of the best of several seeded trials is kept, deterministically.
+        """
+        qr = QuantumRegister(8, 'q')
+        circuit = QuantumCircuit(qr)
+        for qubit in range(8):
+            circuit.cx(qr[qubit], qr[7 - qubit])
+            circuit.cx(qr[qubit], qr[(qubit + 3) % 8])
+
+        dag = circuit_to_dag(circuit)
+        coupling_map = CouplingMap(self.cmap20)
+        layouts = []
+        for _ in range(2):
+            pass_ = SabreLayout(coupling_map, seed=0, max_iterations=2, trials=3)
+            pass_.run(dag)
+            layouts.append(pass_.property_set['layout'].get_virtual_bits())
+
+        self.assertEqual(layouts[0], layouts[1])
+        self.assertEqual(set(layouts[0]), set(qr))
+        self.assertEqual(len(set(layouts[0].values())), 8)
+
+    def test_invalid_trials(self):
+        """Test a number of trials lower than 1 is rejected."""
+        coupling_map = CouplingMap(self.cmap20)
+        for trials in [0, -1]:
+            with self.assertRaises(TranspilerError):
+                SabreLayout(coupling_map, trials=trials)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,7 +14,8 @@
 
 import unittest
 from qiskit.transpiler.passes import SabreSwap
-from qiskit.transpiler import CouplingMap, PassManager
+from qiskit.transpiler.passes.routing.sabre_swap import _trial_seeds
+from qiskit.transpiler import CouplingMap, PassManager, TranspilerError
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.test import QiskitTestCase
 
@@ -84,6 +85,37 @@ class TestSabreSwap(QiskitTestCase):
 
         self.assertEqual(new_qc.num_nonlocal_gates(), 7)
 
+    def test_trials(self):
+        """Test the best of several seeded routings is kept, deterministically."""
+        coupling = CouplingMap.from_grid(3, 3)
+
+        qc = QuantumCircuit(QuantumRegister(9, 'q'))
+        for qubit in range(9):
+            qc.cx(qubit, (qubit + 4) % 9)
+            qc.cx(qubit, (qubit + 7) % 9)
+
+        seeds = _trial_seeds(12, 4)
+        self.assertEqual(seeds[0], 12)
+        self.assertEqual(len(set(seeds)), 4)
+        trials = [PassManager(SabreSwap(coupling, 'decay', seed=seed)).run(qc)
+                  for seed in seeds]
+        scores = [(trial.count_ops().get('swap', 0), trial.depth()) for trial in trials]
+
+        multiple = PassManager(SabreSwap(coupling, 'decay', seed=12, trials=4)).run(qc)
+        self.assertEqual(multiple, trials[scores.index(min(scores))])
+        self.assertEqual(PassManager(SabreSwap(coupling, 'decay', seed=12, trials=4)).run(qc),
+                         multiple)
+        for _, qargs, _ in multiple.data:
+            if len(qargs) == 2:
+                self.assertIn([qargs[0].index, qargs[1].index], coupling.get_edges())
+
+    def test_invalid_trials(self):
+        """Test a number of trials lower than 1 is rejected."""
+        coupling = CouplingMap.from_line(3)
+        for trials in [0, -1]:
+            with self.assertRaises(TranspilerError):
+                SabreSwap(coupling, trials=trials)
+
 
 if __name__ == '__main__':
     unittest.main()
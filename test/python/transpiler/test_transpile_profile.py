@@ -0,0 +1,123 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the profiling of the passes run by pass managers."""
+
+import json
+import tracemalloc
+
+from qiskit import QuantumCircuit
+from qiskit.compiler import transpile
+from qiskit.test import QiskitTestCase
+from qiskit.transpiler import PassManager, TranspileProfile, TransformationPass
+from qiskit.transpiler.passes import CXCancellation, Depth, Unroller
+
+
+class FailingPass(TransformationPass):
+    """A pass that always raises."""
+
+    def run(self, dag):
+        raise ValueError('failing pass')
+
+
+class TestTranspileProfile(QiskitTestCase):
+    """Test TranspileProfile."""
+
+    def setUp(self):
+        super().setUp()
+        self.circuit = QuantumCircuit(2)
+        self.circuit.h(0)
+        self.circuit.cx(0, 1)
+        self.circuit.cx(0, 1)
+        self.circuit.cx(0, 1)
+        self.pass_manager = PassManager([Unroller(['u3', 'cx']), CXCancellation(), Depth()])
+
+    def test_pass_manager_run(self):
+        """Test the statistics of the passes of a single circuit."""
+        profile = TranspileProfile()
+        self.pass_manager.run(self.circuit, profile=profile)
+
+        self.assertEqual(profile.num_circuits, 1)
+        self.assertEqual([record['pass'] for record in profile.records()],
+                         ['Unroller', 'CXCancellation', 'Depth'])
+        cancellation = profile['CXCancellation']
+        self.assertEqual(cancellation['calls'], 1)
+        self.assertEqual((cancellation['size_before'], cancellation['size_after']), (4, 2))
+        self.assertIsNone(cancellation['peak_memory'])
+        self.assertEqual(profile['Depth']['size_after'], 2)
+        self.assertGreaterEqual(profile.total_time, 0)
+
+    def test_parallel_runs_merged(self):
+        """Test the statistics of circuits run in parallel are merged."""
+        profile = TranspileProfile()
+        self.pass_manager.run([self.circuit] * 3, profile=profile)
+
+        self.assertEqual(profile.num_circuits, 3)
+        self.assertEqual(profile['CXCancellation']['calls'], 3)
+        self.assertEqual(profile['CXCancellation']['size_before'], 12)
+
+    def test_transpile(self):
+        """Test profiling the passes run by transpile."""
+        profile = TranspileProfile(memory=True)
+        transpile([self.circuit, self.circuit], basis_gates=['u3', 'cx'],
+                  optimization_level=1, profile=profile)
+
+        self.assertEqual(profile.num_circuits, 2)
+        self.assertIn('Optimize1qGates', profile)
+        for record in profile.records():
+            self.assertIsInstance(record['peak_memory'], int)
+
+    def test_failing_pass_stops_tracing(self):
+        """Test the memory tracing is stopped when a pass raises."""
+        profile = TranspileProfile(memory=True)
+        pass_manager = PassManager(FailingPass())
+        with self.assertRaises(ValueError):
+            pass_manager.run(self.circuit, profile=profile)
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_reports(self):
+        """Test the JSON and text reports."""
+        profile = TranspileProfile()
+        profile.add('Slow', 2.0, 10, 5, 100)
+        profile.add('Fast', 1.0, 4, 4)
+        profile.add('Fast', 0.5, 6, 4)
+
+        records = profile.records(sort_by='time')
+        self.assertEqual([record['pass'] for record in records], ['Slow', 'Fast'])
+        self.assertEqual(records[1]['calls'], 2)
+        self.assertEqual(records[1]['mean_size_before'], 5)
+        self.assertEqual(records[1]['max_time'], 1.0)
+
+        report = json.loads(profile.to_json())
+        self.assertEqual(report['total_time'], 3.5)
+        self.assertEqual(report['passes'], profile.records())
+
+        lines = profile.to_text(sort_by='calls').splitlines()
+        self.assertIn('ncalls', lines[2])
+        self.assertTrue(lines[3].endswith('Fast'))
+        self.assertTrue(lines[4].endswith('Slow'))
+
+    def test_merge(self):
+        """Test merging two profiles."""
+        profile = TranspileProfile()
+        profile.add('Pass', 1.0, 10, 5)
+        other = TranspileProfile()
+        other.num_circuits = 2
+        other.add('Pass', 3.0, 4, 4, 100)
+        other.add('Other', 1.0, 4, 4)
+
+        profile.merge(other)
+        self.assertEqual(profile.num_circuits, 2)
+        self.assertEqual(profile['Pass'], {'calls': 2, 'time': 4.0, 'max_time': 3.0,
+                                           'size_before': 14, 'size_after': 9,
+                                           'peak_memory': 100})
+        self.assertEqual(len(profile), 2)